@@ -0,0 +1,396 @@
+import argparse
+import io
+import json
+import os
+import platform
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import psycopg2
+from PySide6.QtCore import QEventLoop
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from checksum import compute_crc16, compute_crc16_batch
+from config import Config
+from export import export_session
+from main_window import LIVE, STARTUP_PROBE_PREFIX, MainWindow
+
+
+BENCHMARK_SESSION_ID = 2 ** 62
+STARTUP_TARGET_SECONDS = 1.0
+
+
+def current_rss_mb() -> Optional[float]:
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def percentiles_ms(samples: List[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"p50": None, "p99": None, "max": None}
+    values = np.asarray(samples) * 1000
+    return {
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+def report_dialog(parent, title: str, text: str, *args, **kwargs) -> QMessageBox.StandardButton:
+    print(f"{title}: {text}", file=sys.stderr)
+    return QMessageBox.StandardButton.Ok
+
+
+def run_scenario(name: str, scenario: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    rss_start = current_rss_mb()
+    try:
+        result = scenario()
+    except Exception as e:
+        result = {"error": str(e)}
+    rss_end = current_rss_mb()
+
+    result = {"scenario": name, **result}
+    if rss_start is not None and rss_end is not None:
+        result["rss_mb"] = {
+            "start": round(rss_start, 1),
+            "end": round(rss_end, 1),
+            "growth": round(rss_end - rss_start, 1),
+        }
+    print(f"{name}: {json.dumps(result, ensure_ascii=False)}", file=sys.stderr)
+    return result
+
+
+class Benchmark:
+    def __init__(self, app: QApplication, window: MainWindow, args: argparse.Namespace):
+        self.app = app
+        self.window = window
+        self.args = args
+
+    def spin(self, seconds: float) -> None:
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            self.app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 10)
+
+    def raw_packets(self, count: int, session_id: int, start_time: float, stamp: bool = False) -> List[Any]:
+        packets = []
+        for counter in range(count):
+            timestamp = start_time + counter * 0.001
+            payload = float(np.sin(counter / 100))
+            packet = {
+                "id": counter + 1,
+                "packetCounter": counter,
+                "timestamp": timestamp,
+                "payload": payload,
+                "crc16": compute_crc16(payload, counter, timestamp),
+                "sessionId": session_id,
+            }
+            packets.append(json.dumps(packet) if self.args.format == "json" and not stamp else packet)
+        return packets
+
+    def parse(self) -> Dict[str, Any]:
+        raw = self.raw_packets(self.args.packets, BENCHMARK_SESSION_ID, time.time())
+        timings = []
+        started = time.perf_counter()
+        for packet in raw:
+            call_started = time.perf_counter()
+            self.window._parse_packet(packet)
+            timings.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+        return {
+            "packets": len(raw),
+            "seconds": round(elapsed, 3),
+            "packets_per_second": round(len(raw) / elapsed),
+            "latency_ms": percentiles_ms(timings),
+        }
+
+    def ingest(self) -> Dict[str, Any]:
+        window = self.window
+        count = self.args.packets
+        rate = self.args.rate
+        session = window.live_sessions.watch(BENCHMARK_SESSION_ID, "Бенчмарк")
+        window._watch_session(session)
+        self.spin(0.1)
+
+        model = window.ui.PacketTableWidget.packet_model
+        append_batch = model.append_batch
+        latencies: List[float] = []
+        apply_times: List[float] = []
+        applied = [0]
+        sent = [0]
+
+        def timed_append(batch: np.ndarray) -> None:
+            started = time.perf_counter()
+            append_batch(batch)
+            now = time.time()
+            apply_times.append(time.perf_counter() - started)
+            latencies.extend((now - batch["timestamp"]).tolist())
+            applied[0] += len(batch)
+
+        model.append_batch = timed_append
+        template = self.raw_packets(count, BENCHMARK_SESSION_ID, 0.0, stamp=True)
+
+        def produce() -> None:
+            started = time.perf_counter()
+            for index, packet in enumerate(template):
+                if rate > 0:
+                    delay = started + index / rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                packet["timestamp"] = time.time()
+                packet["crc16"] = compute_crc16(packet["payload"], packet["packetCounter"], packet["timestamp"])
+                window._handle_new_packet(json.dumps(packet) if self.args.format == "json" else packet)
+                sent[0] += 1
+
+        producer = threading.Thread(target=produce, daemon=True)
+        started = time.perf_counter()
+        producer.start()
+        deadline = started + self.args.timeout
+        while applied[0] < count and time.perf_counter() < deadline:
+            self.spin(0.01)
+        elapsed = time.perf_counter() - started
+        producer.join(timeout=1)
+        self.spin(0.1)
+
+        model.append_batch = append_batch
+        rows = model.rowCount()
+        expected_rows = min(sent[0], session.buffer.capacity)
+        window.live_sessions.unwatch(BENCHMARK_SESSION_ID)
+        window.ui.cmbLiveSession.removeItem(window._session_index((LIVE, BENCHMARK_SESSION_ID)))
+        result = {
+            "packets": count,
+            "sent": sent[0],
+            "applied": applied[0],
+            "rows": rows,
+            "target_rate": rate,
+            "seconds": round(elapsed, 3),
+            "packets_per_second": round(applied[0] / elapsed),
+            "latency_ms": percentiles_ms(latencies),
+            "apply_ms": percentiles_ms(apply_times),
+            "batches": len(apply_times),
+        }
+        if sent[0] != count or applied[0] != sent[0] or rows != expected_rows:
+            result["error"] = (f"в таблицу попало строк: {rows}, ожидалось {expected_rows} "
+                               f"(отправлено {sent[0]} из {count}, применено {applied[0]})")
+        return result
+
+    def history(self, session_id: int) -> Dict[str, Any]:
+        window = self.window
+        model = window.ui.HistoryPacketTableWidget.packet_model
+        model.clear()
+
+        pages = []
+        first_page = None
+        started = time.perf_counter()
+        for page in window._iter_history_packets(session_id, None):
+            model.append_batch(page)
+            pages.append(len(page))
+            if first_page is None:
+                first_page = time.perf_counter() - started
+        elapsed = time.perf_counter() - started
+        count = sum(pages)
+        model.clear()
+        return {
+            "session_id": session_id,
+            "packets": count,
+            "pages": len(pages),
+            "seconds": round(elapsed, 3),
+            "first_page_ms": round(first_page * 1000, 3) if first_page is not None else None,
+            "packets_per_second": round(count / elapsed) if elapsed else None,
+        }
+
+    def export(self, session_id: int, extension: str) -> Dict[str, Any]:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, f"benchmark.{extension}")
+            started = time.perf_counter()
+            count = export_session(self.window.db, session_id, path)
+            elapsed = time.perf_counter() - started
+            size = os.path.getsize(path)
+        return {
+            "session_id": session_id,
+            "format": extension,
+            "packets": count,
+            "seconds": round(elapsed, 3),
+            "packets_per_second": round(count / elapsed) if elapsed else None,
+            "bytes": size,
+        }
+
+    def startup(self) -> Dict[str, Any]:
+        if self.args.startup_command:
+            command = shlex.split(self.args.startup_command)
+        else:
+            command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")]
+        env = {**os.environ, "STARTUP_PROBE": "1", "METRICS_PORT": "0"}
+
+        wall: Dict[str, List[float]] = {}
+        in_process: Dict[str, List[float]] = {}
+        for _ in range(self.args.startup_runs):
+            started = time.perf_counter()
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env,
+                                       text=True, encoding="utf-8", errors="replace")
+            try:
+                for line in process.stdout:
+                    fields = line.split()
+                    if len(fields) != 3 or fields[0] != STARTUP_PROBE_PREFIX:
+                        continue
+                    _, stage, seconds = fields
+                    wall.setdefault(stage, []).append(time.perf_counter() - started)
+                    in_process.setdefault(stage, []).append(float(seconds))
+                process.wait(timeout=self.args.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                raise RuntimeError("клиент не завершился после замера запуска")
+
+        window = wall.get("window", [])
+        return {
+            "command": command,
+            "runs": self.args.startup_runs,
+            "process_ms": {stage: percentiles_ms(samples) for stage, samples in wall.items()},
+            "in_process_ms": {stage: percentiles_ms(samples) for stage, samples in in_process.items()},
+            "window_target_met": bool(window) and float(np.median(window)) < STARTUP_TARGET_SECONDS,
+        }
+
+
+def seed_session(count: int) -> int:
+    connection = psycopg2.connect(**Config.DB_CONFIG)
+    try:
+        with connection, connection.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO public."Sessions" ("Name", "StartTime", "EndTime")
+                VALUES (%s, now(), now())
+                RETURNING "Id"
+                """, ("Бенчмарк",))
+            session_id = cursor.fetchone()[0]
+
+            counters = np.arange(count, dtype=np.int32)
+            timestamps = time.time() - count * 0.001 + counters * 0.001
+            payloads = np.sin(counters / 100)
+            crcs = compute_crc16_batch(payloads, counters, timestamps)
+            rows = io.StringIO()
+            np.savetxt(
+                rows,
+                np.column_stack([counters, timestamps, payloads, crcs, np.full(count, session_id), np.zeros(count)]),
+                fmt=["%d", "%.6f", "%.17g", "%d", "%d", "%d"],
+                delimiter=","
+            )
+            rows.seek(0)
+            cursor.copy_expert(
+                'COPY public."Packets" ("PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId", "SyncMarker") '
+                'FROM STDIN WITH (FORMAT csv)',
+                rows
+            )
+            cursor.execute('ANALYZE public."Packets"')
+        return session_id
+    finally:
+        connection.close()
+
+
+def drop_session(session_id: int) -> None:
+    connection = psycopg2.connect(**Config.DB_CONFIG)
+    try:
+        with connection, connection.cursor() as cursor:
+            cursor.execute('DELETE FROM public."Packets" WHERE "SessionId" = %s', (session_id,))
+            cursor.execute('DELETE FROM public."Sessions" WHERE "Id" = %s', (session_id,))
+    finally:
+        connection.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Нагрузочный тест клиентского конвейера телеметрии")
+    parser.add_argument("--scenarios", default="parse,ingest,history,export",
+                        help="Сценарии через запятую: parse, ingest, history, export, startup")
+    parser.add_argument("--packets", type=int, default=100000, help="Число пакетов для parse и ingest")
+    parser.add_argument("--rate", type=float, default=0, help="Темп подачи пакетов в ingest, пакетов/с (0 — максимум)")
+    parser.add_argument("--format", choices=("dict", "json"), default="dict",
+                        help="Формат пакетов, передаваемых в обработчик NewPacket")
+    parser.add_argument("--timeout", type=float, default=120, help="Предельное время сценария ingest, с")
+    parser.add_argument("--session-id", type=int, help="Сессия в БД для history и export")
+    parser.add_argument("--seed-packets", type=int, default=1000000,
+                        help="Размер временной сессии, если --session-id не задан")
+    parser.add_argument("--startup-runs", type=int, default=5, help="Число запусков клиента в сценарии startup")
+    parser.add_argument("--startup-command",
+                        help="Команда запуска клиента для startup, например путь к собранному main.exe "
+                             "(по умолчанию main.py текущим интерпретатором)")
+    parser.add_argument("--output", help="Файл для JSON-отчёта (по умолчанию stdout)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+
+    app = QApplication(sys.argv[:1])
+    QMessageBox.critical = staticmethod(report_dialog)
+    window = MainWindow()
+    window.show()
+    benchmark = Benchmark(app, window, args)
+
+    seeded_id = None
+    session_id = args.session_id
+    results = []
+    try:
+        if session_id is None and {"history", "export"} & set(scenarios):
+            started = time.perf_counter()
+            session_id = seeded_id = seed_session(args.seed_packets)
+            print(f"Создана временная сессия {session_id} за {time.perf_counter() - started:.1f} с", file=sys.stderr)
+
+        for name in scenarios:
+            if name == "parse":
+                results.append(run_scenario(name, benchmark.parse))
+            elif name == "ingest":
+                results.append(run_scenario(name, benchmark.ingest))
+            elif name == "history":
+                results.append(run_scenario(name, lambda: benchmark.history(session_id)))
+            elif name == "startup":
+                results.append(run_scenario(name, benchmark.startup))
+            elif name == "export":
+                for extension in ("npz", "csv"):
+                    results.append(run_scenario(f"export_{extension}", lambda: benchmark.export(session_id, extension)))
+            else:
+                results.append({"scenario": name, "error": "неизвестный сценарий"})
+    finally:
+        if seeded_id is not None:
+            drop_session(seeded_id)
+        window.close()
+
+    report = {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "signalr_protocol": Config.SIGNALR_PROTOCOL,
+            "ui_refresh_rate_hz": Config.UI_REFRESH_RATE_HZ,
+            "ui_max_batch_size": Config.UI_MAX_BATCH_SIZE,
+            "history_page_size": Config.HISTORY_PAGE_SIZE,
+        },
+        "arguments": vars(args),
+        "results": results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+    return 0 if all("error" not in result for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
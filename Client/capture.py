@@ -0,0 +1,228 @@
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from metrics import CAPTURE_CHUNK_SECONDS, CAPTURE_PACKETS
+from row_models import ROW_DTYPE, TelemetryPacket
+
+
+CAPTURE_DTYPE = np.dtype(ROW_DTYPE.descr + [("arrival", np.float64)])
+
+FILE_MAGIC = b"TLMCAP\x00\x01"
+FILE_HEADER = struct.Struct("<8sHH")
+CHUNK_MAGIC = b"TCHK"
+CHUNK_HEADER = struct.Struct("<4sIIIdddd")
+INDEX_ENTRY = struct.Struct("<QIIdddd")
+CAPTURE_VERSION = 1
+
+
+@dataclass
+class CaptureChunk:
+    offset: int
+    size: int
+    count: int
+    first_timestamp: float
+    last_timestamp: float
+    first_arrival: float
+    last_arrival: float
+
+
+def _encode_chunk(records: np.ndarray, level: int) -> bytes:
+    columns = b"".join(np.ascontiguousarray(records[name]).tobytes() for name in CAPTURE_DTYPE.names)
+    return zlib.compress(columns, level)
+
+
+def _decode_chunk(payload: bytes, count: int) -> np.ndarray:
+    raw = zlib.decompress(payload)
+    records = np.empty(count, dtype=CAPTURE_DTYPE)
+    offset = 0
+    for name in CAPTURE_DTYPE.names:
+        field = CAPTURE_DTYPE[name]
+        size = field.itemsize * count
+        records[name] = np.frombuffer(raw, dtype=field, count=count, offset=offset)
+        offset += size
+    return records
+
+
+class CaptureRecorder:
+    def __init__(self, path: str, chunk_packets: int = 4096, flush_interval: float = 1.0,
+                 compression_level: int = 1):
+        self.path = path
+        self.chunk_packets = chunk_packets
+        self.flush_interval = flush_interval
+        self.compression_level = compression_level
+        self.packet_count = 0
+        self.chunk_count = 0
+        self.bytes_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb", buffering=1024 * 1024)
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, CAPTURE_VERSION, CAPTURE_DTYPE.itemsize))
+        self._index = open(f"{path}.idx", "wb", buffering=64 * 1024)
+        self._offset = FILE_HEADER.size
+
+        self._packets: List[TelemetryPacket] = []
+        self._arrivals: List[float] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closing = False
+        self._thread = threading.Thread(target=self._write_loop, name="capture-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, packet: TelemetryPacket, arrival: float) -> None:
+        with self._lock:
+            self._packets.append(packet)
+            self._arrivals.append(arrival)
+            full = len(self._packets) >= self.chunk_packets
+        if full:
+            self._wake.set()
+
+    def _take_pending(self):
+        with self._lock:
+            packets, arrivals = self._packets, self._arrivals
+            self._packets, self._arrivals = [], []
+        return packets, arrivals
+
+    def _write_loop(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            closing = self._closing
+            packets, arrivals = self._take_pending()
+            for start in range(0, len(packets), self.chunk_packets):
+                stop = start + self.chunk_packets
+                try:
+                    self._write_chunk(packets[start:stop], arrivals[start:stop])
+                except Exception as e:
+                    logging.getLogger(__name__).error(f"Ошибка записи журнала захвата {self.path}: {e}")
+            if closing:
+                break
+
+        self._file.close()
+        self._index.close()
+
+    def _write_chunk(self, packets: List[TelemetryPacket], arrivals: List[float]) -> None:
+        started = time.perf_counter()
+        records = np.empty(len(packets), dtype=CAPTURE_DTYPE)
+        rows = np.array(packets, dtype=ROW_DTYPE)
+        for name in ROW_DTYPE.names:
+            records[name] = rows[name]
+        records["arrival"] = arrivals
+
+        payload = _encode_chunk(records, self.compression_level)
+        header = CHUNK_HEADER.pack(
+            CHUNK_MAGIC, len(payload), len(records), 0,
+            float(records["timestamp"][0]), float(records["timestamp"][-1]),
+            float(records["arrival"][0]), float(records["arrival"][-1])
+        )
+        self._file.write(header)
+        self._file.write(payload)
+        self._file.flush()
+        self._index.write(INDEX_ENTRY.pack(
+            self._offset, len(payload), len(records),
+            float(records["timestamp"][0]), float(records["timestamp"][-1]),
+            float(records["arrival"][0]), float(records["arrival"][-1])
+        ))
+        self._index.flush()
+
+        self._offset += len(header) + len(payload)
+        self.packet_count += len(records)
+        self.chunk_count += 1
+        self.bytes_written = self._offset
+        CAPTURE_PACKETS.inc(len(records))
+        CAPTURE_CHUNK_SECONDS.observe(time.perf_counter() - started)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+
+class CaptureReader:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        magic, version, record_size = FILE_HEADER.unpack(self._file.read(FILE_HEADER.size))
+        if magic != FILE_MAGIC:
+            raise ValueError(f"{path} не является журналом захвата")
+        if version != CAPTURE_VERSION or record_size != CAPTURE_DTYPE.itemsize:
+            raise ValueError(f"Неподдерживаемая версия журнала захвата: {version}")
+
+        self.chunks: List[CaptureChunk] = self._load_index()
+        self._arrivals = [chunk.first_arrival for chunk in self.chunks]
+
+    def _load_index(self) -> List[CaptureChunk]:
+        file_size = os.fstat(self._file.fileno()).st_size
+        chunks = []
+        try:
+            with open(f"{self.path}.idx", "rb") as index:
+                data = index.read()
+            for entry in INDEX_ENTRY.iter_unpack(data[:len(data) - len(data) % INDEX_ENTRY.size]):
+                chunk = CaptureChunk(*entry)
+                if chunk.offset + CHUNK_HEADER.size + chunk.size > file_size:
+                    break
+                chunks.append(chunk)
+        except OSError:
+            pass
+        return self._scan_chunks(chunks, file_size)
+
+    def _scan_chunks(self, chunks: List[CaptureChunk], file_size: int) -> List[CaptureChunk]:
+        offset = chunks[-1].offset + CHUNK_HEADER.size + chunks[-1].size if chunks else FILE_HEADER.size
+        while offset + CHUNK_HEADER.size <= file_size:
+            self._file.seek(offset)
+            magic, size, count, _, *bounds = CHUNK_HEADER.unpack(self._file.read(CHUNK_HEADER.size))
+            if magic != CHUNK_MAGIC or offset + CHUNK_HEADER.size + size > file_size:
+                break
+            chunks.append(CaptureChunk(offset, size, count, *bounds))
+            offset += CHUNK_HEADER.size + size
+        return chunks
+
+    @property
+    def packet_count(self) -> int:
+        return sum(chunk.count for chunk in self.chunks)
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return self.chunks[0].first_arrival if self.chunks else None
+
+    @property
+    def duration(self) -> float:
+        return self.chunks[-1].last_arrival - self.chunks[0].first_arrival if self.chunks else 0.0
+
+    def find_chunk(self, offset: float) -> int:
+        if not self.chunks:
+            return 0
+        return max(0, bisect_right(self._arrivals, self.chunks[0].first_arrival + offset) - 1)
+
+    def read_chunk(self, index: int) -> np.ndarray:
+        chunk = self.chunks[index]
+        self._file.seek(chunk.offset + CHUNK_HEADER.size)
+        return _decode_chunk(self._file.read(chunk.size), chunk.count)
+
+    def iter_chunks(self, start: int = 0) -> Iterator[np.ndarray]:
+        for index in range(start, len(self.chunks)):
+            yield self.read_chunk(index)
+
+    def read_from(self, offset: float) -> Iterator[np.ndarray]:
+        start = self.find_chunk(offset)
+        threshold = self.start_time + offset if self.chunks else 0.0
+        for records in self.iter_chunks(start):
+            if records["arrival"][0] < threshold:
+                records = records[records["arrival"] >= threshold]
+            if len(records):
+                yield records
+
+    def close(self) -> None:
+        self._file.close()
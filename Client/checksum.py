@@ -0,0 +1,44 @@
+import struct
+
+import crcmod
+import numpy as np
+
+
+CRC_RECORD = struct.Struct("<did")
+CRC_RECORD_DTYPE = np.dtype([
+    ("payload", "<f8"),
+    ("counter", "<i4"),
+    ("timestamp", "<f8"),
+])
+
+_crc16_ccitt = crcmod.mkCrcFun(0x11021, initCrc=0xFFFF, rev=False, xorOut=0x0000)
+
+
+def _build_crc16_table() -> np.ndarray:
+    table = np.zeros(256, dtype=np.uint16)
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table[byte] = crc & 0xFFFF
+    return table
+
+
+CRC16_TABLE = _build_crc16_table()
+
+
+def compute_crc16(payload: float, counter: int, timestamp: float) -> int:
+    return _crc16_ccitt(CRC_RECORD.pack(payload, counter, timestamp))
+
+
+def compute_crc16_batch(payload: np.ndarray, counter: np.ndarray, timestamp: np.ndarray) -> np.ndarray:
+    records = np.empty(len(payload), dtype=CRC_RECORD_DTYPE)
+    records["payload"] = payload
+    records["counter"] = counter
+    records["timestamp"] = timestamp
+    data = records.view(np.uint8).reshape(len(records), CRC_RECORD_DTYPE.itemsize)
+
+    crc = np.full(len(records), 0xFFFF, dtype=np.uint16)
+    for column in range(CRC_RECORD_DTYPE.itemsize):
+        crc = (crc << 8) ^ CRC16_TABLE[(crc >> 8) ^ data[:, column]]
+    return crc
@@ -1,7 +1,6 @@
 import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 
 def get_env_path():
@@ -16,13 +15,22 @@ def get_env_path():
     return env_path
 
 
+def load_env_file(env_path: Path) -> None:
+    if not env_path.is_file():
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv(env_path)
+
+
 env_path = get_env_path()
-load_dotenv(env_path)
+load_env_file(env_path)
 
 class Config:
     SERVER_HOST = os.getenv("SERVER_HOST")
     SERVER_PORT = os.getenv("SERVER_PORT")
     SERVER_URL = f"http://{SERVER_HOST}:{SERVER_PORT}"
+    SIGNALR_PROTOCOL = os.getenv("SIGNALR_PROTOCOL", "json").lower()
     DB_SCHEMA = os.getenv("DB_SCHEMA", "public")
     DB_CONFIG = {
         "host": os.getenv("DB_HOST"),
@@ -30,5 +38,54 @@ class Config:
         "dbname": os.getenv("DB_NAME"),
         "user": os.getenv("DB_USER"),
         "password": os.getenv("DB_PASSWORD", ""),
-        "options": f"-c search_path={os.getenv('DB_SCHEMA', 'public')}"
-    }
\ No newline at end of file
+        "options": f"-c search_path={os.getenv('DB_SCHEMA', 'public')}",
+        "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "3"))
+    }
+    DB_RECONNECT_INTERVAL = float(os.getenv("DB_RECONNECT_INTERVAL", "10"))
+    SERVER_AUTO_CONNECT = os.getenv("SERVER_AUTO_CONNECT", "1").lower() in ("1", "true", "yes")
+    SERVER_CONNECT_TIMEOUT = float(os.getenv("SERVER_CONNECT_TIMEOUT", "5"))
+    BACKFILL_SETTLE_INTERVAL = float(os.getenv("BACKFILL_SETTLE_INTERVAL", "2"))
+    STARTUP_PROBE = os.getenv("STARTUP_PROBE", "0").lower() in ("1", "true", "yes")
+    DB_POOL_MIN_CONNECTIONS = int(os.getenv("DB_POOL_MIN_CONNECTIONS", "1"))
+    DB_POOL_MAX_CONNECTIONS = int(os.getenv("DB_POOL_MAX_CONNECTIONS", "8"))
+    LIVE_TABLE_CAPACITY = int(os.getenv("LIVE_TABLE_CAPACITY", "100000"))
+    HISTORY_TABLE_CAPACITY = int(os.getenv("HISTORY_TABLE_CAPACITY", "2000000"))
+    HISTORY_FIRST_PAGE_SIZE = int(os.getenv("HISTORY_FIRST_PAGE_SIZE", "500"))
+    HISTORY_PAGE_SIZE = int(os.getenv("HISTORY_PAGE_SIZE", "20000"))
+    LIVE_CHART_WINDOW_SECONDS = float(os.getenv("LIVE_CHART_WINDOW_SECONDS", "300"))
+    LIVE_CHART_BUCKETS = int(os.getenv("LIVE_CHART_BUCKETS", "4096"))
+    SESSION_PAGE_SIZE = int(os.getenv("SESSION_PAGE_SIZE", "200"))
+    HISTORY_OVERVIEW_BUCKETS = int(os.getenv("HISTORY_OVERVIEW_BUCKETS", "1000"))
+    HISTORY_TAIL_INTERVAL = float(os.getenv("HISTORY_TAIL_INTERVAL", "0.25"))
+    HISTORY_TAIL_POLL_INTERVAL = float(os.getenv("HISTORY_TAIL_POLL_INTERVAL", "5"))
+    HISTORY_TAIL_PAGE_SIZE = int(os.getenv("HISTORY_TAIL_PAGE_SIZE", "5000"))
+    HISTORY_TAIL_CHART_INTERVAL = float(os.getenv("HISTORY_TAIL_CHART_INTERVAL", "2"))
+    SESSION_CACHE_DIR = os.getenv(
+        "SESSION_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "telemetry_client", "sessions")
+    )
+    SESSION_CACHE_MAX_MB = int(os.getenv("SESSION_CACHE_MAX_MB", "1024"))
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "3"))
+    LOG_RATE_LIMIT_BURST = int(os.getenv("LOG_RATE_LIMIT_BURST", "10"))
+    LOG_RATE_LIMIT_INTERVAL = float(os.getenv("LOG_RATE_LIMIT_INTERVAL", "10"))
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+    TIME_FORMAT_CACHE_SIZE = int(os.getenv("TIME_FORMAT_CACHE_SIZE", "4096"))
+    TIME_DISPLAY_MILLISECONDS = os.getenv("TIME_DISPLAY_MILLISECONDS", "0").lower() in ("1", "true", "yes")
+    CAPTURE_DIR = os.getenv(
+        "CAPTURE_DIR",
+        os.path.join(os.path.expanduser("~"), "telemetry_client", "captures")
+    )
+    CAPTURE_ON_START = os.getenv("CAPTURE_ON_START", "0").lower() in ("1", "true", "yes")
+    CAPTURE_CHUNK_PACKETS = int(os.getenv("CAPTURE_CHUNK_PACKETS", "4096"))
+    CAPTURE_FLUSH_INTERVAL = float(os.getenv("CAPTURE_FLUSH_INTERVAL", "1"))
+    CAPTURE_COMPRESSION_LEVEL = int(os.getenv("CAPTURE_COMPRESSION_LEVEL", "1"))
+    REPLAY_BATCH_SIZE = int(os.getenv("REPLAY_BATCH_SIZE", "5000"))
+    REPLAY_MAX_BACKLOG = int(os.getenv("REPLAY_MAX_BACKLOG", "32"))
+    API_TIMEOUT = float(os.getenv("API_TIMEOUT", "10"))
+    API_STOP_TIMEOUT = float(os.getenv("API_STOP_TIMEOUT", "2"))
+    API_MAX_CONNECTIONS = int(os.getenv("API_MAX_CONNECTIONS", "4"))
+    SHUTDOWN_TIMEOUT = float(os.getenv("SHUTDOWN_TIMEOUT", "1"))
+    UI_REFRESH_RATE_HZ = float(os.getenv("UI_REFRESH_RATE_HZ", "30"))
+    UI_MAX_BATCH_SIZE = int(os.getenv("UI_MAX_BATCH_SIZE", "5000"))
\ No newline at end of file
@@ -1,5 +1,16 @@
 from enum import Enum
-from PySide6.QtWidgets import *
+from typing import Any, Iterable
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QHeaderView, QTableView
+
+from config import Config
+from packet_buffer import PacketRingBuffer
+from row_models import STATUS_CRC_MISMATCH, STATUS_NAMES, TelemetryPacket, packets_to_batch
+from time_format import format_timestamp
+
 
 class CustomColumn:
     def __init__(self, title: str, tool_tip: str):
@@ -17,14 +28,137 @@ class Columns(Enum):
     SESSION = CustomColumn("Сеанс", "ID сеанса")
 
 
-class PacketTable(QTableWidget):
-    def __init__(self, parent):
+COLUMNS = list(Columns)
+NEGATIVE_BACKGROUND = QColor(255, 230, 230)
+CRC_MISMATCH_BACKGROUND = QColor(255, 200, 120)
+
+
+class PacketTableModel(QAbstractTableModel):
+    def __init__(self, capacity: int, parent=None):
+        super().__init__(parent)
+        self.buffer = PacketRingBuffer(capacity)
+        self.session_label = "Текущая"
+        self.show_milliseconds = Config.TIME_DISPLAY_MILLISECONDS
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.buffer)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section].value.title
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return COLUMNS[section].value.tool_tip
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._format_cell(index.row(), COLUMNS[index.column()])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if self.buffer.value(index.row(), "status") == STATUS_CRC_MISMATCH:
+                return CRC_MISMATCH_BACKGROUND
+            if self.buffer.value(index.row(), "payload") < 0:
+                return NEGATIVE_BACKGROUND
+        return None
+
+    def _format_cell(self, row: int, column: Columns) -> str:
+        if column == Columns.ID:
+            return str(self.buffer.value(row, "id"))
+        if column == Columns.COUNTER:
+            return str(self.buffer.value(row, "counter"))
+        if column == Columns.TIME:
+            return format_timestamp(self.buffer.value(row, "timestamp"), self.show_milliseconds)
+        if column == Columns.VALUE:
+            return f"{self.buffer.value(row, 'payload'):.4f}"
+        if column == Columns.CRC:
+            return hex(self.buffer.value(row, "crc16"))
+        if column == Columns.STATUS:
+            return STATUS_NAMES.get(int(self.buffer.value(row, "status")), "N/A")
+        return self.session_label
+
+    def append_batch(self, batch: np.ndarray) -> None:
+        if not len(batch):
+            return
+
+        if len(batch) >= self.buffer.capacity:
+            self.beginResetModel()
+            self.buffer.extend(batch)
+            self.endResetModel()
+            return
+
+        dropped = self.buffer.overflow(len(batch))
+        if dropped:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            self.buffer.drop_oldest(dropped)
+            self.endRemoveRows()
+
+        first = len(self.buffer)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self.buffer.extend(batch)
+        self.endInsertRows()
+
+    def merge_batch(self, batch: np.ndarray) -> None:
+        if not len(batch):
+            return
+
+        shift = 0
+        for row, rows in self.buffer.merge_runs(batch):
+            row = max(0, row - shift)
+            dropped, skipped = self.buffer.merge_overflow(row, len(rows))
+            if dropped:
+                self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+                self.buffer.drop_oldest(dropped)
+                self.endRemoveRows()
+                shift += dropped
+            rows = rows[skipped:]
+            if len(rows):
+                row -= dropped
+                self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+                self.buffer.insert(row, rows)
+                self.endInsertRows()
+
+    def append_packets(self, packets: Iterable[TelemetryPacket]) -> None:
+        self.append_batch(packets_to_batch(packets))
+
+    def set_buffer(self, buffer: PacketRingBuffer) -> None:
+        self.beginResetModel()
+        self.buffer = buffer
+        self.endResetModel()
+
+    def set_show_milliseconds(self, enabled: bool) -> None:
+        if enabled == self.show_milliseconds:
+            return
+        self.show_milliseconds = enabled
+        if len(self.buffer):
+            column = COLUMNS.index(Columns.TIME)
+            self.dataChanged.emit(self.index(0, column), self.index(len(self.buffer) - 1, column))
+
+    def set_capacity(self, capacity: int) -> None:
+        self.beginResetModel()
+        self.buffer = PacketRingBuffer(capacity)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.buffer.clear()
+        self.endResetModel()
+
+
+class PacketTable(QTableView):
+    def __init__(self, parent, capacity: int = Config.LIVE_TABLE_CAPACITY):
         super().__init__(parent)
 
-        self.setColumnCount(len(Columns))
+        self.packet_model = PacketTableModel(capacity, self)
+        self.setModel(self.packet_model)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        for index, column in enumerate(Columns):
-            custom_column: CustomColumn = column.value
-            item = QTableWidgetItem(custom_column.title)
-            item.setToolTip(custom_column.tool_tip)
-            self.setHorizontalHeaderItem(index, item)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 6)
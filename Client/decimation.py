@@ -0,0 +1,139 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+Envelope = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def empty_envelope() -> Envelope:
+    empty = np.empty(0, dtype=np.float64)
+    return empty, empty, empty, empty
+
+
+def envelope_to_polyline(x: np.ndarray, low: np.ndarray, high: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    line_x = np.repeat(x, 2)
+    line_y = np.empty(len(x) * 2, dtype=np.float64)
+    line_y[0::2] = low
+    line_y[1::2] = high
+    return line_x, line_y
+
+
+def bucket_envelope(x: np.ndarray, low: np.ndarray, high: np.ndarray, total: np.ndarray, count: np.ndarray,
+                    x_from: float, x_to: float, buckets: int) -> Envelope:
+    edges = np.linspace(x_from, x_to, buckets + 1)
+    starts = np.searchsorted(x, edges[:-1], side="left")
+    stop = np.searchsorted(x, x_to, side="right")
+    starts = np.unique(starts[starts < stop])
+    if not len(starts):
+        return empty_envelope()
+
+    x, low, high, total, count = x[:stop], low[:stop], high[:stop], total[:stop], count[:stop]
+    return (
+        x[starts],
+        np.minimum.reduceat(low, starts),
+        np.maximum.reduceat(high, starts),
+        np.add.reduceat(total, starts) / np.maximum(np.add.reduceat(count, starts), 1),
+    )
+
+
+class MinMaxPyramid:
+    def __init__(self, x: np.ndarray, y: np.ndarray, factor: int = 4, min_points: int = 2048):
+        order = np.argsort(x, kind="stable") if len(x) and np.any(np.diff(x) < 0) else slice(None)
+        x = np.asarray(x, dtype=np.float64)[order]
+        y = np.asarray(y, dtype=np.float64)[order]
+
+        self.factor = factor
+        self.levels: List[Tuple[np.ndarray, ...]] = [(x, y, y, y, np.ones(len(y), dtype=np.int64))]
+        while len(self.levels[-1][0]) > min_points:
+            x, low, high, total, count = self.levels[-1]
+            starts = np.arange(0, len(x), factor)
+            self.levels.append((
+                x[starts],
+                np.minimum.reduceat(low, starts),
+                np.maximum.reduceat(high, starts),
+                np.add.reduceat(total, starts),
+                np.add.reduceat(count, starts),
+            ))
+
+    @property
+    def x_range(self) -> Tuple[float, float]:
+        x = self.levels[0][0]
+        if not len(x):
+            return 0.0, 0.0
+        return float(x[0]), float(x[-1])
+
+    def query(self, x_from: float, x_to: float, buckets: int) -> Envelope:
+        for level in self.levels:
+            first, last = np.searchsorted(level[0], (x_from, x_to))
+            if last - first <= buckets * self.factor:
+                break
+        return bucket_envelope(*level, x_from, x_to, buckets)
+
+
+class StreamingDecimator:
+    def __init__(self, window: float, buckets: int):
+        self.buckets = buckets
+        self.bucket_width = window / buckets
+        self._low = np.full(buckets, np.inf)
+        self._high = np.full(buckets, -np.inf)
+        self._total = np.zeros(buckets)
+        self._count = np.zeros(buckets, dtype=np.int64)
+        self._latest = None
+
+    def clear(self) -> None:
+        self._low.fill(np.inf)
+        self._high.fill(-np.inf)
+        self._total.fill(0)
+        self._count.fill(0)
+        self._latest = None
+
+    def _reset_slots(self, first: int, last: int) -> None:
+        slots = np.arange(first, last + 1) % self.buckets
+        self._low[slots] = np.inf
+        self._high[slots] = -np.inf
+        self._total[slots] = 0
+        self._count[slots] = 0
+
+    def add(self, x: np.ndarray, y: np.ndarray) -> None:
+        valid = ~np.isnan(x)
+        x, y = x[valid], y[valid]
+        if not len(x):
+            return
+
+        index = np.floor(x / self.bucket_width).astype(np.int64)
+        newest = int(index.max())
+        if self._latest is None or newest - self._latest >= self.buckets:
+            self.clear()
+            self._latest = newest
+        elif newest > self._latest:
+            self._reset_slots(self._latest + 1, newest)
+            self._latest = newest
+
+        keep = index > self._latest - self.buckets
+        slots = index[keep] % self.buckets
+        y = y[keep]
+        np.minimum.at(self._low, slots, y)
+        np.maximum.at(self._high, slots, y)
+        np.add.at(self._total, slots, y)
+        np.add.at(self._count, slots, 1)
+
+    def envelope(self, buckets: Optional[int] = None) -> Envelope:
+        if self._latest is None:
+            return empty_envelope()
+
+        first = self._latest - self.buckets + 1
+        index = np.arange(first, self._latest + 1)
+        slots = index % self.buckets
+        filled = self._count[slots] > 0
+        index, slots = index[filled], slots[filled]
+        x = (index + 0.5) * self.bucket_width
+        if buckets is not None and buckets < self.buckets:
+            return bucket_envelope(x, self._low[slots], self._high[slots], self._total[slots], self._count[slots],
+                                   first * self.bucket_width, (self._latest + 1) * self.bucket_width, buckets)
+        return (
+            x,
+            self._low[slots],
+            self._high[slots],
+            self._total[slots] / self._count[slots],
+        )
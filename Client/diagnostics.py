@@ -0,0 +1,68 @@
+import time
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QPlainTextEdit
+
+from metrics import REGISTRY, Counter, Histogram, LabelKey, MetricsRegistry
+
+
+def _format_key(key: LabelKey) -> str:
+    return ", ".join(f"{name}={value}" for name, value in key) or "-"
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value == float("inf"):
+        return "> max"
+    return f"{value * 1000:.3f} мс"
+
+
+class DiagnosticsView(QPlainTextEdit):
+    def __init__(self, parent=None, registry: MetricsRegistry = REGISTRY):
+        super().__init__(parent)
+        self.registry = registry
+        self.setReadOnly(True)
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self._previous: Dict[Tuple[str, LabelKey], Tuple[float, float]] = {}
+
+    def _rate(self, name: str, key: LabelKey, value: float, now: float) -> str:
+        previous = self._previous.get((name, key))
+        self._previous[(name, key)] = (value, now)
+        if previous is None or now <= previous[1]:
+            return "-"
+        return f"{(value - previous[0]) / (now - previous[1]):.1f}/с"
+
+    def refresh(self) -> None:
+        now = time.monotonic()
+        lines = [f"{'Счётчик':<40} {'Метки':<34} {'Значение':>12} {'Скорость':>12}"]
+        histograms = []
+        for metric in self.registry.metrics():
+            if isinstance(metric, Histogram):
+                histograms.append(metric)
+                continue
+            for name, key, value in metric.samples():
+                rate = self._rate(name, key, value, now) if type(metric) is Counter else ""
+                lines.append(f"{name:<40} {_format_key(key):<34} {value:>12g} {rate:>12}")
+
+        lines.append("")
+        lines.append(f"{'Гистограмма':<40} {'Метки':<34} {'Кол-во':>10} {'Среднее':>12} {'p50 ≤':>12} {'p99 ≤':>12}")
+        for metric in histograms:
+            latency = metric.name.endswith("_seconds")
+            for key, series in metric.series().items():
+                mean = series.total / series.count if series.count else None
+                if latency:
+                    values = [_format_seconds(value) for value in (mean, series.quantile(0.5), series.quantile(0.99))]
+                else:
+                    values = ["-" if value is None else f"{value:g}"
+                              for value in (mean, series.quantile(0.5), series.quantile(0.99))]
+                lines.append(
+                    f"{metric.name:<40} {_format_key(key):<34} {series.count:>10} "
+                    f"{values[0]:>12} {values[1]:>12} {values[2]:>12}"
+                )
+
+        scroll = self.verticalScrollBar().value()
+        self.setPlainText("\n".join(lines))
+        self.verticalScrollBar().setValue(scroll)
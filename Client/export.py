@@ -0,0 +1,138 @@
+import os
+import shutil
+import tempfile
+import zipfile
+from typing import Dict, IO, Optional
+
+import numpy as np
+
+from postgres import PostgresManager
+from row_models import PACKET_DTYPE, ROW_FIELDS, records_to_batch
+
+
+PG_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+PG_COPY_HEADER_SIZE = 19
+
+PG_COPY_RECORD_DTYPE = np.dtype([
+    ("field_count", ">i2"),
+    ("id_length", ">i4"), ("id", ">i8"),
+    ("counter_length", ">i4"), ("counter", ">i4"),
+    ("timestamp_length", ">i4"), ("timestamp", ">f8"),
+    ("payload_length", ">i4"), ("payload", ">f8"),
+    ("crc16_length", ">i4"), ("crc16", ">i4"),
+    ("session_id_length", ">i4"), ("session_id", ">i8"),
+])
+
+
+class BinaryCopyColumnWriter:
+    def __init__(self, directory: str, chunk_size: int = 4 * 1024 * 1024):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._buffer = bytearray()
+        self._header_parsed = False
+        self._files: Dict[str, IO] = {
+            name: open(self.column_path(name), "wb") for name in PACKET_DTYPE.names
+        }
+
+    def column_path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.bin")
+
+    def write(self, data: bytes) -> None:
+        self._buffer += data
+        if len(self._buffer) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._header_parsed:
+            if len(self._buffer) < PG_COPY_HEADER_SIZE:
+                return
+            if bytes(self._buffer[:len(PG_COPY_SIGNATURE)]) != PG_COPY_SIGNATURE:
+                raise ValueError("Неверный формат бинарного COPY")
+            extension_length = int.from_bytes(self._buffer[15:19], "big")
+            del self._buffer[:PG_COPY_HEADER_SIZE + extension_length]
+            self._header_parsed = True
+
+        size = len(self._buffer) // PG_COPY_RECORD_DTYPE.itemsize * PG_COPY_RECORD_DTYPE.itemsize
+        if not size:
+            return
+
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+
+        records = np.frombuffer(chunk, dtype=PG_COPY_RECORD_DTYPE)
+        if (records["field_count"] != len(ROW_FIELDS)).any():
+            raise ValueError("Неожиданное число столбцов в бинарном COPY")
+
+        batch = records_to_batch(records)
+        for name, file in self._files.items():
+            batch[name].tofile(file)
+        self.count += len(batch)
+
+    def finish(self) -> int:
+        self._flush()
+        self.close()
+        return self.count
+
+    def close(self) -> None:
+        for file in self._files.values():
+            file.close()
+
+
+def export_session_csv(db: PostgresManager, session_id: int, path: str,
+                       time_from: Optional[float] = None, time_to: Optional[float] = None) -> int:
+    part_path = f"{path}.part"
+    with open(part_path, "wb", buffering=1024 * 1024) as out:
+        db.copy_session_packets(out, session_id, binary=False, time_from=time_from, time_to=time_to)
+
+    with open(part_path, "rb") as source:
+        lines = sum(chunk.count(b"\n") for chunk in iter(lambda: source.read(1024 * 1024), b""))
+    os.replace(part_path, path)
+    return max(0, lines - 1)
+
+
+def export_session_npz(db: PostgresManager, session_id: int, path: str,
+                       time_from: Optional[float] = None, time_to: Optional[float] = None) -> int:
+    part_path = f"{path}.part"
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as directory:
+        writer = BinaryCopyColumnWriter(directory)
+        try:
+            db.copy_session_packets(writer, session_id, binary=True, time_from=time_from, time_to=time_to)
+        except Exception:
+            writer.close()
+            raise
+        count = writer.finish()
+
+        with zipfile.ZipFile(part_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as bundle:
+            for name in PACKET_DTYPE.names:
+                with bundle.open(f"{name}.npy", "w", force_zip64=True) as entry:
+                    np.lib.format.write_array_header_1_0(entry, {
+                        "descr": np.lib.format.dtype_to_descr(PACKET_DTYPE[name]),
+                        "fortran_order": False,
+                        "shape": (count,),
+                    })
+                    with open(writer.column_path(name), "rb") as source:
+                        shutil.copyfileobj(source, entry, 1024 * 1024)
+
+    os.replace(part_path, path)
+    return count
+
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def export_session(db: PostgresManager, session_id: int, path: str,
+                   time_from: Optional[float] = None, time_to: Optional[float] = None) -> int:
+    if not path.lower().endswith((".csv", ".npz")):
+        path = f"{path}.npz"
+
+    export = export_session_csv if path.lower().endswith(".csv") else export_session_npz
+    try:
+        return export(db, session_id, path, time_from, time_to)
+    except Exception:
+        _discard(f"{path}.part")
+        raise
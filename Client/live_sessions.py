@@ -0,0 +1,69 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from decimation import StreamingDecimator
+from packet_buffer import PacketRingBuffer
+from sequence_tracker import SequenceTracker
+
+
+class LiveSession:
+    def __init__(self, session_id: int, label: str, capacity: int, chart_window: float, chart_buckets: int):
+        self.session_id = session_id
+        self.label = label
+        self.buffer = PacketRingBuffer(capacity)
+        self.decimator = StreamingDecimator(chart_window, chart_buckets)
+        self.tracker = SequenceTracker()
+        self.packet_count = 0
+
+
+class LiveSessionMonitor:
+    def __init__(self, capacity: int, chart_window: float, chart_buckets: int):
+        self.capacity = capacity
+        self.chart_window = chart_window
+        self.chart_buckets = chart_buckets
+        self.sessions: Dict[int, LiveSession] = {}
+
+    def __contains__(self, session_id: int) -> bool:
+        return session_id in self.sessions
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def get(self, session_id: Optional[int]) -> Optional[LiveSession]:
+        return self.sessions.get(session_id)
+
+    def watch(self, session_id: int, label: str) -> LiveSession:
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = LiveSession(session_id, label, self.capacity, self.chart_window, self.chart_buckets)
+            self.sessions = {**self.sessions, session_id: session}
+        return session
+
+    def unwatch(self, session_id: int) -> None:
+        if session_id in self.sessions:
+            self.sessions = {key: value for key, value in self.sessions.items() if key != session_id}
+
+    def ids(self) -> List[int]:
+        return list(self.sessions)
+
+    def split(self, batch: np.ndarray) -> Iterator[Tuple[LiveSession, np.ndarray]]:
+        if not len(batch):
+            return
+
+        session_ids = batch["session_id"]
+        if (session_ids == session_ids[0]).all():
+            groups = [(int(session_ids[0]), batch)]
+        else:
+            order = np.argsort(session_ids, kind="stable")
+            ordered = batch[order]
+            keys, starts = np.unique(ordered["session_id"], return_index=True)
+            bounds = list(starts[1:]) + [len(ordered)]
+            groups = [(int(key), ordered[start:stop]) for key, start, stop in zip(keys, starts, bounds)]
+
+        sessions = self.sessions
+        for session_id, part in groups:
+            session = sessions.get(session_id)
+            if session is not None:
+                session.packet_count += len(part)
+                yield session, part
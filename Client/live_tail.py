@@ -0,0 +1,104 @@
+import json
+import logging
+import select
+import threading
+from typing import Any, Dict, Optional, Set, Tuple
+
+import psycopg2
+import psycopg2.extensions
+
+
+PACKETS_CHANNEL = "packets_inserted"
+SESSION_ENDED_CHANNEL = "session_ended"
+
+
+class PacketNotificationListener:
+    def __init__(self, config: Dict[str, Any], reconnect_interval: float = 5.0,
+                 max_reconnect_interval: float = 60.0, poll_timeout: float = 0.5):
+        self.config = dict(config)
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+        self.poll_timeout = poll_timeout
+        self.connected = False
+
+        self._last_ids: Dict[int, int] = {}
+        self._ended: Set[int] = set()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and not self._stopping.is_set()
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self.take()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._listen_loop, args=(self._stopping,), name="db-notify",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        self._stopping.set()
+        thread = self._thread
+        if thread is None or timeout is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def take(self) -> Tuple[Dict[int, int], Set[int]]:
+        with self._lock:
+            last_ids, self._last_ids = self._last_ids, {}
+            ended, self._ended = self._ended, set()
+        return last_ids, ended
+
+    def reconnect_delay(self, attempt: int) -> float:
+        return min(self.reconnect_interval * 2 ** attempt, self.max_reconnect_interval)
+
+    def _listen_loop(self, stopping: threading.Event) -> None:
+        logger = logging.getLogger(__name__)
+        attempt = 0
+        while not stopping.is_set():
+            conn: Optional[psycopg2.extensions.connection] = None
+            delay = self.reconnect_delay(attempt)
+            try:
+                conn = psycopg2.connect(**self.config)
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {PACKETS_CHANNEL}; LISTEN {SESSION_ENDED_CHANNEL}")
+                self.connected = True
+                attempt, delay = 0, self.reconnect_interval
+                logger.info("Подписка на уведомления БД о новых пакетах")
+
+                while not stopping.is_set():
+                    if select.select([conn], [], [], self.poll_timeout) == ([], [], []):
+                        continue
+                    conn.poll()
+                    notifies, conn.notifies = conn.notifies, []
+                    self._collect(notifies)
+            except psycopg2.Error as e:
+                log = logger.warning if attempt == 0 else logger.debug
+                log(f"Уведомления БД недоступны, повтор через {delay:g} с: {e}")
+                attempt += 1
+            finally:
+                self.connected = False
+                if conn is not None:
+                    conn.close()
+            stopping.wait(delay)
+
+    def _collect(self, notifies: list) -> None:
+        with self._lock:
+            for notify in notifies:
+                try:
+                    payload = json.loads(notify.payload)
+                    session_id = int(payload["session_id"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if notify.channel == SESSION_ENDED_CHANNEL:
+                    self._ended.add(session_id)
+                else:
+                    last_id = int(payload.get("last_id", 0))
+                    self._last_ids[session_id] = max(last_id, self._last_ids.get(session_id, 0))
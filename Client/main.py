@@ -1,10 +1,14 @@
 import sys
+import time
+
+STARTED = time.perf_counter()
+
 from PySide6.QtWidgets import QApplication
 from main_window import MainWindow
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(STARTED)
     window.show()
     sys.exit(app.exec())
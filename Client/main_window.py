@@ -1,30 +1,83 @@
+import asyncio
 import json
 import logging
+import os
+import queue
+import random
+import sys
+import time
+from dataclasses import replace
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
-from typing import Optional, List, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
-from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QMainWindow, QMessageBox, QTableWidgetItem
+import numpy as np
+from PySide6.QtCore import QDateTime, QTimer, Signal
+from PySide6.QtWidgets import QFileDialog, QLabel, QMainWindow, QMessageBox
 
 from config import Config
-from server_connection import SignalRClient, TelemetryApiClient
-from row_models import TelemetryPacket
+from decimation import Envelope, StreamingDecimator, empty_envelope
+from row_models import (
+    STATUS_CODES, PacketFilter, Session, SessionSummary, TelemetryPacket, make_packet, queued_to_batch
+)
+from packet_buffer import PacketRingBuffer
 from postgres import PostgresManager
+from live_sessions import LiveSession, LiveSessionMonitor
+from live_tail import PacketNotificationListener
+from metrics import (
+    PACKET_PARSE_SECONDS, PACKET_QUEUE_DEPTH, PACKETS_BACKFILLED, PACKETS_DROPPED, PACKETS_RECEIVED, REGISTRY,
+    STARTUP_SECONDS,
+    UI_APPLY_SECONDS, UI_BATCH_SIZE, RATE_LIMIT_NOTE, MetricsServer, RateLimitFilter
+)
+from session_cache import CachedSession, SessionCache
+from session_list import SessionListModel
+from time_format import format_timestamp
 from ui_telemetry_client import Ui_MainWindow
+from workers import AsyncTaskRunner, TaskRunner
+
+if TYPE_CHECKING:
+    from capture import CaptureRecorder
+    from replay import ReplayEngine
+    from server_connection import SignalRClient, TelemetryApiClient
+
+
+SessionKey = Tuple[str, int]
+LIVE = "live"
+REPLAY = "replay"
+REPLAY_RESET = object()
+STARTUP_PROBE_PREFIX = "startup"
+
+
+class ReplayChunk(NamedTuple):
+    batch: np.ndarray
+    arrivals: np.ndarray
+
+
+def queued_size(item) -> int:
+    if isinstance(item, ReplayChunk):
+        return len(item.batch)
+    return len(item) if isinstance(item, np.ndarray) else 1
 
 
 class MainWindow(QMainWindow):
-    MAX_RECONNECT_ATTEMPTS: int = 5
-    BASE_RECONNECT_INTERVAL: int = 15000
+    MAX_RECONNECT_ATTEMPTS: int = 8
+    BASE_RECONNECT_INTERVAL: int = 1000
+    MAX_RECONNECT_INTERVAL: int = 30000
+    REPLAY_SPEEDS: Tuple[float, ...] = (1.0, 2.0, 5.0, 10.0, 100.0, 0.0)
+
+    server_opened = Signal(object)
+    server_closed = Signal(object)
+    server_failed = Signal(object, str)
 
-    def __init__(self) -> None:
+    def __init__(self, started: Optional[float] = None) -> None:
         super().__init__()
+        self.started: float = started if started is not None else time.perf_counter()
         self._setup_logging()
 
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        self.ui.HistoryPacketTableWidget.packet_model.set_capacity(Config.HISTORY_TABLE_CAPACITY)
+        self.ui.chkMilliseconds.setChecked(Config.TIME_DISPLAY_MILLISECONDS)
 
         self.current_packet_counter: int = 0
         self.signalr_connected: bool = False
@@ -32,59 +85,243 @@ class MainWindow(QMainWindow):
         self.current_reconnect_attempt: int = 0
         self.current_session_id: int = 0
         self.db_connected: bool = False
-
-        self.signalr: SignalRClient = SignalRClient(f'{Config.SERVER_URL}/telemetryhub')
-        self.api: TelemetryApiClient = TelemetryApiClient(Config.SERVER_URL + "/api/Telemetry")
-        self.db: PostgresManager = PostgresManager(Config.DB_CONFIG)
-        self.db_check_timer: QTimer = QTimer()
+        self.db_connect_reported: bool = False
+        self.server_connecting: bool = False
+        self.server_connect_manual: bool = False
+        self.is_manual_disconnect: bool = False
+        self.resume_points: Dict[int, Tuple[int, Optional[float]]] = {}
+        self.startup_pending: Set[str] = {"window", "db"}
+
+        self.signalr: Optional["SignalRClient"] = None
+        self.api: Optional["TelemetryApiClient"] = None
+        self.db: PostgresManager = PostgresManager(
+            Config.DB_CONFIG,
+            min_connections=Config.DB_POOL_MIN_CONNECTIONS,
+            max_connections=Config.DB_POOL_MAX_CONNECTIONS
+        )
+        self.db_check_timer: QTimer = QTimer(self)
+        self.reconnect_timer: QTimer = QTimer(self)
+        self.server_connect_timer: QTimer = QTimer(self)
+        self.packet_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.replay_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.ui_update_timer: QTimer = QTimer(self)
+        self.diagnostics_timer: QTimer = QTimer(self)
+        self.metrics_server: Optional[MetricsServer] = self._start_metrics_server()
+        self.tasks: TaskRunner = TaskRunner(self)
+        self.async_tasks: AsyncTaskRunner = AsyncTaskRunner(self)
+        self.history_session_id: Optional[int] = None
+        self.history_header: str = ""
+        self.history_summary: Optional[SessionSummary] = None
+        self.history_packet_count: int = 0
+        self.history_cacheable: bool = False
+        self.history_filter: PacketFilter = PacketFilter()
+        self.history_active: bool = False
+        self.history_last_id: int = 0
+        self.history_tail_due: bool = False
+        self.history_tail_ended: bool = False
+        self.history_tail_polled: float = 0.0
+        self.history_tail_charted: float = 0.0
+        self.history_tail_timer: QTimer = QTimer(self)
+        self.tail_listener: PacketNotificationListener = PacketNotificationListener(Config.DB_CONFIG)
+        self.session_model: SessionListModel = SessionListModel(self)
+        self.ui.listSessions.setModel(self.session_model)
+        self.session_cache: Optional[SessionCache] = self._open_session_cache()
+        self.live_sessions: LiveSessionMonitor = LiveSessionMonitor(
+            Config.LIVE_TABLE_CAPACITY,
+            Config.LIVE_CHART_WINDOW_SECONDS,
+            Config.LIVE_CHART_BUCKETS
+        )
+        self.replay_sessions: LiveSessionMonitor = LiveSessionMonitor(
+            Config.LIVE_TABLE_CAPACITY,
+            Config.LIVE_CHART_WINDOW_SECONDS,
+            Config.LIVE_CHART_BUCKETS
+        )
+        self.live_session_key: Optional[SessionKey] = None
+        self.live_session: Optional[LiveSession] = None
+        self.recorder: Optional["CaptureRecorder"] = None
+        self.replay: Optional["ReplayEngine"] = None
+        self.replay_timer: QTimer = QTimer(self)
+        self.lblStreamStats: QLabel = QLabel(self)
+        self.ui.statusbar.addPermanentWidget(self.lblStreamStats)
+        self.lblConnectionStatus: QLabel = QLabel(self)
+        self.ui.statusbar.addPermanentWidget(self.lblConnectionStatus)
 
         self._setup_ui_signals()
-        self._check_db_connection()
         self._setup_timers()
         self._update_ui_state()
+        if Config.CAPTURE_ON_START:
+            self.ui.btnCapture.setChecked(True)
+        QTimer.singleShot(0, self._on_window_ready)
 
     def _setup_logging(self) -> None:
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                RotatingFileHandler(
-                    'telemetry_client.log',
-                    encoding='utf-8'
-                ),
-                logging.StreamHandler()
-            ]
+        handlers = [
+            RotatingFileHandler(
+                'telemetry_client.log',
+                maxBytes=Config.LOG_MAX_BYTES,
+                backupCount=Config.LOG_BACKUP_COUNT,
+                encoding='utf-8'
+            ),
+            logging.StreamHandler()
+        ]
+        formatter = logging.Formatter(
+            f'%(asctime)s - %(levelname)s - %(message)s%({RATE_LIMIT_NOTE})s',
+            defaults={RATE_LIMIT_NOTE: ""}
         )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        logging.basicConfig(level=logging.INFO, handlers=handlers)
         self.logger = logging.getLogger(__name__)
+        self.packet_logger = logging.getLogger(f"{__name__}.packets")
+        self.packet_log_limit = RateLimitFilter(Config.LOG_RATE_LIMIT_BURST, Config.LOG_RATE_LIMIT_INTERVAL)
+        self.packet_logger.addFilter(self.packet_log_limit)
+        self.startup_probe: Optional[logging.Handler] = None
+        if Config.STARTUP_PROBE:
+            self.startup_probe = logging.StreamHandler(sys.stdout)
+            self.startup_probe.addFilter(lambda record: hasattr(record, "startup_stage"))
+            self.startup_probe.setFormatter(
+                logging.Formatter(f"{STARTUP_PROBE_PREFIX} %(startup_stage)s %(startup_seconds).4f"))
+            self.logger.addHandler(self.startup_probe)
 
     def _setup_ui_signals(self) -> None:
         self.ui.btnConnect.clicked.connect(self._toggle_server_connection)
         self.ui.btnStart.clicked.connect(self._start_generation)
         self.ui.btnStop.clicked.connect(self._stop_generation)
         self.ui.btnRefreshSessions.clicked.connect(self._refresh_sessions)
+        self.ui.btnExportSession.clicked.connect(self._export_session)
+        self.ui.btnWatchSession.clicked.connect(self._watch_selected_session)
+        self.ui.btnUnwatchSession.clicked.connect(self._unwatch_live_session)
+        self.ui.cmbLiveSession.currentIndexChanged.connect(self._on_live_session_selected)
+        self.ui.btnExportMetrics.clicked.connect(self._export_metrics)
+        self.ui.chkMilliseconds.toggled.connect(self._set_show_milliseconds)
+        self.ui.btnCapture.toggled.connect(self._toggle_capture)
+        self.ui.tabWidget.currentChanged.connect(self._refresh_diagnostics)
+        self.ui.btnApplyFilter.clicked.connect(self._apply_history_filter)
+        self.ui.btnResetFilter.clicked.connect(self._reset_history_filter)
+        self.ui.btnReplayCapture.clicked.connect(self._open_replay_capture)
+        self.ui.btnReplaySession.clicked.connect(self._replay_selected_session)
+        self.ui.btnReplayPause.toggled.connect(self._pause_replay)
+        self.ui.btnReplayStop.clicked.connect(self._stop_replay)
+        self.ui.cmbReplaySpeed.currentIndexChanged.connect(self._set_replay_speed)
+        self.ui.sliderReplay.sliderReleased.connect(self._seek_replay)
+        self.server_opened.connect(self._on_server_connected)
+        self.server_closed.connect(self._on_server_disconnected)
+        self.server_failed.connect(self._handle_error)
+        self.ui.chkHistoryTail.toggled.connect(self._toggle_history_tail)
+        for check, editors in (
+            (self.ui.chkFilterTime, (self.ui.dtFilterFrom, self.ui.dtFilterTo)),
+            (self.ui.chkFilterPayload, (self.ui.spnPayloadMin, self.ui.spnPayloadMax)),
+            (self.ui.chkFilterCounter, (self.ui.spnCounterFrom, self.ui.spnCounterTo)),
+        ):
+            for editor in editors:
+                check.toggled.connect(editor.setEnabled)
+
+        self.ui.listSessions.selectionModel().currentChanged.connect(self._load_session_packets)
+        self.session_model.older_requested.connect(self._fetch_older_sessions)
 
-        self.signalr.on_packet_received(self._handle_new_packet)
-        self.signalr.connection.on_open(self._on_server_connected)
-        self.signalr.connection.on_close(self._on_server_disconnected)
-        self.signalr.connection.on_error(self._handle_error)
+    def _setup_timers(self) -> None:
+        self.db_check_timer.timeout.connect(self._retry_db_connection)
+        self.db_check_timer.start(max(1, int(Config.DB_RECONNECT_INTERVAL * 1000)))
+        self.reconnect_timer.setSingleShot(True)
+        self.reconnect_timer.timeout.connect(self._reconnect_server)
+        self.server_connect_timer.setSingleShot(True)
+        self.server_connect_timer.timeout.connect(self._on_server_connect_timeout)
+        self.ui_update_timer.timeout.connect(self._drain_packet_queue)
+        self.ui_update_timer.start(max(1, int(1000 / Config.UI_REFRESH_RATE_HZ)))
+        self.diagnostics_timer.timeout.connect(self._refresh_diagnostics)
+        self.diagnostics_timer.timeout.connect(self._update_stream_stats)
+        self.diagnostics_timer.start(1000)
+        self.replay_timer.timeout.connect(self._update_replay_controls)
+        self.history_tail_timer.timeout.connect(self._poll_history_tail)
+        self.history_tail_timer.setInterval(max(1, int(Config.HISTORY_TAIL_INTERVAL * 1000)))
+
+    def _start_metrics_server(self) -> Optional[MetricsServer]:
+        if Config.METRICS_PORT <= 0:
+            return None
+        try:
+            server = MetricsServer(Config.METRICS_HOST, Config.METRICS_PORT)
+        except OSError as e:
+            self.logger.warning(f"Не удалось открыть порт метрик {Config.METRICS_PORT}: {e}")
+            return None
+        server.start()
+        host, port = server.address
+        self.logger.info(f"Метрики Prometheus доступны по адресу http://{host}:{port}/metrics")
+        return server
+
+    def _refresh_diagnostics(self) -> None:
+        if self.ui.tabWidget.currentWidget() is self.ui.tab_diagnostics:
+            self.ui.DiagnosticsView.refresh()
+
+    def _export_metrics(self) -> None:
+        path, _ = QFileDialog.getSaveFileName(self, "Экспорт метрик", "metrics.prom", "Prometheus (*.prom *.txt)")
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(REGISTRY.render_prometheus())
+        except OSError as e:
+            self._show_error(f"Ошибка экспорта метрик: {e}")
+            return
+        self.ui.statusbar.showMessage(f"Метрики сохранены в {path}", 5000)
 
-        self.ui.listSessions.itemSelectionChanged.connect(self._load_session_packets)
+    def _on_window_ready(self) -> None:
+        self._mark_startup("window")
+        self._connect_database()
+        if Config.SERVER_AUTO_CONNECT:
+            self._connect_server()
 
-    def _setup_timers(self) -> None:
-        self.db_check_timer.start(1000)
+    def _mark_startup(self, stage: str) -> None:
+        if stage not in self.startup_pending:
+            return
 
-    def _check_db_connection(self) -> None:
-        self.db_connected = self.db.cursor is not None
-        if not self.db_connected:
-            self.logger.error("Курсор БД не инициализирован")
+        self.startup_pending.discard(stage)
+        elapsed = time.perf_counter() - self.started
+        STARTUP_SECONDS.set(elapsed, stage=stage)
+        self.logger.info(f"Запуск, этап {stage}: {elapsed * 1000:.0f} мс",
+                         extra={"startup_stage": stage, "startup_seconds": elapsed})
+        if Config.STARTUP_PROBE and not self.startup_pending:
+            QTimer.singleShot(0, self.close)
+
+    def _connect_database(self) -> None:
+        if self.tasks.is_busy("db_connect"):
+            return
+
+        self.tasks.submit(
+            "db_connect",
+            self.db.connect,
+            on_error=self._on_db_connect_failed,
+            on_finished=self._on_db_connect_finished
+        )
+        self._update_connection_status()
+
+    def _on_db_connect_failed(self, message: str) -> None:
+        self.logger.error(f"Нет подключения к БД: {message}")
+        if not self.db_connect_reported:
+            self.db_connect_reported = True
             QMessageBox.critical(
                 self,
                 "Ошибка БД",
-                "Курсор БД не инициализирован!",
+                "Нет подключения к БД!",
                 QMessageBox.StandardButton.Ok
             )
-        else:
+
+    def _on_db_connect_finished(self) -> None:
+        self._check_db_connection()
+        self._mark_startup("db")
+        self._update_ui_state()
+
+    def _retry_db_connection(self) -> None:
+        if not self.db.is_connected:
+            self._connect_database()
+
+    def _check_db_connection(self) -> None:
+        connected = self.db.is_connected
+        if connected and not self.db_connected:
+            self.db_connect_reported = False
             self.logger.info("Подключение к БД установлено")
+        elif self.db_connected and not connected:
+            self.logger.error("Нет подключения к БД")
+        self.db_connected = connected
 
     def _refresh_sessions(self) -> None:
         if not self.db_connected:
@@ -92,127 +329,772 @@ class MainWindow(QMainWindow):
             self._show_error("Нет подключения к БД")
             return
 
-        self.ui.listSessions.clear()
-        sessions = self.db.get_sessions()
+        newest_id = self.session_model.newest_id
+        if newest_id is None:
+            self.tasks.submit(
+                "sessions",
+                self.db.get_sessions,
+                limit=Config.SESSION_PAGE_SIZE,
+                on_result=self._show_sessions,
+                on_error=lambda message: self._show_error(f"Ошибка загрузки сессий: {message}")
+            )
+        else:
+            self.tasks.submit(
+                "sessions",
+                self.db.get_session_updates,
+                newest_id,
+                self.session_model.active_ids,
+                on_result=self._merge_sessions,
+                on_error=lambda message: self._show_error(f"Ошибка загрузки сессий: {message}")
+            )
+
+    def _fetch_older_sessions(self, before_id: int) -> None:
+        self.tasks.submit(
+            "sessions_older",
+            self.db.get_sessions,
+            before_id,
+            Config.SESSION_PAGE_SIZE,
+            on_result=lambda sessions: self.session_model.append_older(sessions, Config.SESSION_PAGE_SIZE),
+            on_error=lambda message: self._on_older_sessions_failed(message)
+        )
+
+    def _on_older_sessions_failed(self, message: str) -> None:
+        self.session_model.older_failed()
+        self._show_error(f"Ошибка загрузки сессий: {message}")
+
+    def _open_session_cache(self) -> Optional[SessionCache]:
+        try:
+            return SessionCache(Config.SESSION_CACHE_DIR, Config.SESSION_CACHE_MAX_MB * 1024 * 1024)
+        except OSError as e:
+            self.logger.warning(f"Локальный кэш сессий недоступен: {e}")
+            return None
+
+    def _show_sessions(self, sessions: List[Session]) -> None:
+        self.session_model.set_sessions(sessions, Config.SESSION_PAGE_SIZE)
         if not sessions:
             self.logger.debug("В базе данных не найдено сессий")
             return
 
-        for session in sessions:
-            start_str = session.formatted_start_time
-            end_str = session.formatted_end_time if session.end_time else "Активна"
-            self.ui.listSessions.addItem(f"{session.id}: {session.name} ({start_str} - {end_str})")
-
         self.logger.info(f"Список сессий обновлен, количество: {len(sessions)}")
 
+    def _merge_sessions(self, sessions: List[Session]) -> None:
+        self.session_model.merge(sessions)
+        self.logger.info(f"Список сессий обновлен, изменено: {len(sessions)}")
+
     def _load_session_packets(self) -> None:
-        selected = self.ui.listSessions.currentItem()
-        if not selected:
+        session = self.session_model.session(self.ui.listSessions.currentIndex())
+        if session is None:
             return
 
-        session_text = selected.text()
-        parts = session_text.split(":", 1)
+        session_id = session.id
+        session_name = session.name
+        self._update_watch_buttons()
+        self.logger.debug(f"Загрузка пакетов для сессии ID: {session_id}")
+        end_str = session.formatted_end_time if session.end_time else "Активна"
+        time_range = f"{session.formatted_start_time} - {end_str}"
+
+        history_model = self.ui.HistoryPacketTableWidget.packet_model
+        history_model.clear()
+        history_model.session_label = f"{session_id}: {session_name}"
+        self.ui.HistoryPayloadChart.clear()
+
+        self.history_session_id = session_id
+        self.history_active = session.end_time is None
+        self._reset_history_tail()
+        self.ui.chkHistoryTail.setEnabled(self.history_active)
+        self.ui.btnExportSession.setEnabled(not self.tasks.is_busy("export"))
+        self.ui.btnApplyFilter.setEnabled(True)
+        if not self.ui.chkFilterTime.isChecked():
+            self.ui.dtFilterFrom.setDateTime(QDateTime.fromSecsSinceEpoch(int(session.start_time)))
+            self.ui.dtFilterTo.setDateTime(QDateTime.fromSecsSinceEpoch(int(session.end_time or time.time()) + 1))
+        self.history_header = f"Сессия: {session_name} | Диапазон: {time_range}"
+        self.history_packet_count = 0
+        self.history_summary = None
+        self.ui.lblSessionInfo.setText(f"{self.history_header} | Загрузка...")
+
+        self.history_filter = self._current_filter()
+        closed = session.end_time is not None and self.session_cache is not None
+        cached = self.session_cache.get(session_id) if closed else None
+        self.history_cacheable = closed and cached is None and self.history_filter.is_empty()
+
+        if cached is not None and cached.summary is not None:
+            self.history_summary = cached.summary
+        else:
+            self._submit_session_overview(session_id)
+
+        if cached is not None:
+            self.logger.info(f"Сессия {session_id} загружается из локального кэша")
+        self._submit_history_load(session_id, cached)
+
+    def _submit_session_overview(self, session_id: int) -> None:
+        self.tasks.submit(
+            "summary",
+            self._request_session_overview,
+            session_id,
+            Config.HISTORY_OVERVIEW_BUCKETS,
+            on_result=self._show_session_overview
+        )
 
-        if len(parts) < 2:
-            self.logger.warning(f"Неверный формат сессии: {session_text}")
-            self._show_error("Неверный формат записи сессии")
+    def _submit_history_load(self, session_id: int, cached: Optional[CachedSession]) -> None:
+        self.tasks.submit(
+            "history",
+            self._iter_history_packets,
+            session_id,
+            cached,
+            self.history_filter,
+            on_chunk=self._append_history_page,
+            on_error=lambda message: self._show_error(f"Ошибка загрузки пакетов: {message}"),
+            on_finished=self._finish_history_load
+        )
+
+    def _iter_history_packets(self, session_id: int, cached: Optional[CachedSession],
+                              packet_filter: PacketFilter = PacketFilter()) -> Iterator[np.ndarray]:
+        if cached is not None:
+            yield packet_filter.apply(cached.to_batch())
             return
 
-        session_id_str, rest = parts[0].strip(), parts[1].strip()
-        if not session_id_str.isdigit():
-            self.logger.warning(f"Неверный формат ID сессии: {session_id_str}")
-            self._show_error(f"Неверный формат ID сессии: {session_id_str}")
+        yield from self.db.iter_filtered_packets(
+            session_id,
+            packet_filter,
+            page_size=Config.HISTORY_PAGE_SIZE,
+            first_page_size=Config.HISTORY_FIRST_PAGE_SIZE
+        )
+
+    def _current_filter(self) -> PacketFilter:
+        ui = self.ui
+        status = ui.cmbFilterStatus.currentText() if ui.cmbFilterStatus.currentIndex() > 0 else None
+        time_range = (
+            ui.dtFilterFrom.dateTime().toMSecsSinceEpoch() / 1000,
+            (ui.dtFilterTo.dateTime().toMSecsSinceEpoch() + 999) / 1000
+        ) if ui.chkFilterTime.isChecked() else (None, None)
+        payload_range = (ui.spnPayloadMin.value(), ui.spnPayloadMax.value()) \
+            if ui.chkFilterPayload.isChecked() else (None, None)
+        counter_range = (ui.spnCounterFrom.value(), ui.spnCounterTo.value()) \
+            if ui.chkFilterCounter.isChecked() else (None, None)
+        return PacketFilter(
+            time_from=time_range[0],
+            time_to=time_range[1],
+            payload_min=payload_range[0],
+            payload_max=payload_range[1],
+            status=STATUS_CODES[status] if status else None,
+            counter_from=counter_range[0],
+            counter_to=counter_range[1]
+        )
+
+    def _apply_history_filter(self) -> None:
+        session = self.session_model.session(self.ui.listSessions.currentIndex())
+        if session is None or session.id != self.history_session_id:
             return
 
-        session_id = int(session_id_str)
-        self.logger.debug(f"Загрузка пакетов для сессии ID: {session_id}")
-        time_range = "N/A"
+        packet_filter = self._current_filter()
+        if packet_filter == self.history_filter and not self.tasks.is_busy("history"):
+            return
 
-        if "(" in rest and ")" in rest:
-            name_part, time_part = rest.split("(", 1)
-            session_name = name_part.strip()
-            time_range = time_part.split(")")[0].strip()
-        else:
-            session_name = rest.strip()
+        self.history_filter = packet_filter
+        self.history_packet_count = 0
+        self._reset_history_tail()
+        self.ui.HistoryPacketTableWidget.packet_model.clear()
+        self.ui.HistoryPayloadChart.clear()
+
+        closed = session.end_time is not None and self.session_cache is not None
+        cached = self.session_cache.get(session.id) if closed else None
+        self.history_cacheable = closed and cached is None and packet_filter.is_empty()
+        self.logger.info(f"Фильтр для сессии {session.id}: {packet_filter}")
+        self._submit_history_load(session.id, cached)
+        self._update_session_info()
+
+    def _reset_history_filter(self) -> None:
+        for check in (self.ui.chkFilterTime, self.ui.chkFilterPayload, self.ui.chkFilterCounter):
+            check.setChecked(False)
+        self.ui.cmbFilterStatus.setCurrentIndex(0)
+        if not self.history_filter.is_empty():
+            self._apply_history_filter()
+
+    def _request_session_overview(self, session_id: int, buckets: int) -> Tuple[Optional[SessionSummary], Envelope]:
+        summary = self.db.get_session_summary(session_id)
+        if summary is None or not summary.packet_count:
+            return summary, empty_envelope()
+        envelope = self.db.get_session_buckets(
+            session_id, summary.first_timestamp, summary.last_timestamp, buckets)
+        return summary, envelope
+
+    def _show_session_overview(self, overview: Tuple[Optional[SessionSummary], Envelope]) -> None:
+        summary, envelope = overview
+        if summary is None or summary.session_id != self.history_session_id:
+            return
 
-        packets = self.db.get_session_packets(session_id)
-        if not packets:
-            self.logger.info(f"Для сессии {session_id} не найдено пакетов")
+        self.history_summary = summary
+        if summary.packet_count and self.history_filter.is_empty():
+            self.ui.HistoryPayloadChart.show_overview(envelope, summary.first_timestamp, summary.last_timestamp)
+        self._update_session_info()
+        if not self.tasks.is_busy("history"):
+            self._cache_history_session()
+
+    def _update_session_info(self) -> None:
+        parts = [self.history_header]
+        summary = self.history_summary
+        if summary is not None:
+            parts.append(f"Пакетов: {summary.packet_count}")
+            if summary.packet_count:
+                parts.append(
+                    f"Значение: {summary.payload_min:.4f} … {summary.payload_max:.4f}, "
+                    f"среднее {summary.payload_mean:.4f}"
+                )
+            parts.append(f"Отрицательных: {summary.negative_count}")
+            parts.append(f"Пропусков счётчика: {summary.counter_gaps} (потеряно {summary.missing_packets})")
+            parts.append(f"Длительность: {summary.duration:.1f} с")
+
+        loading = self.tasks.is_busy("history")
+        if self.history_tail_timer.isActive():
+            parts.append(f"Слежение: {self.history_packet_count} пакетов")
+        elif not self.history_filter.is_empty():
+            parts.append(f"По фильтру: {self.history_packet_count}{'...' if loading else ''}")
+        elif loading:
+            parts.append(f"Загружено пакетов: {self.history_packet_count}...")
+        elif summary is None:
+            parts.append(f"Пакетов: {self.history_packet_count}")
+        self.ui.lblSessionInfo.setText(" | ".join(parts))
+
+    def _append_history_page(self, batch: np.ndarray) -> None:
+        if len(batch):
+            self.history_last_id = max(self.history_last_id, int(batch["id"].max()))
+        self.history_packet_count += len(batch)
+        self.ui.HistoryPacketTableWidget.packet_model.append_batch(batch)
+        self._update_session_info()
+
+    def _finish_history_load(self) -> None:
+        self._update_session_info()
+        if not self.history_packet_count and not self.history_filter.is_empty():
+            self.ui.statusbar.showMessage("Нет пакетов, удовлетворяющих фильтру", 5000)
+        elif not self.history_packet_count:
+            self.logger.info(f"Для сессии {self.history_session_id} не найдено пакетов")
             self._show_error("Для выбранной сессии нет пакетов данных")
+        else:
+            self.logger.info(f"Загружено {self.history_packet_count} пакетов для сессии {self.history_session_id}")
+            snapshot = self.ui.HistoryPacketTableWidget.packet_model.buffer.snapshot()
+            self.ui.HistoryPayloadChart.set_data(snapshot["timestamp"], snapshot["payload"])
+            self._cache_history_session(snapshot)
+
+        if self.history_active and self.ui.chkHistoryTail.isChecked():
+            self._start_history_tail()
+            self._update_session_info()
+
+    def _start_history_tail(self) -> None:
+        self.history_tail_due = True
+        self.history_tail_timer.start()
+        self.tail_listener.start()
+
+    def _stop_history_tail(self) -> None:
+        self.tasks.cancel("history_tail")
+        self.history_tail_timer.stop()
+        self.tail_listener.stop()
+
+    def _reset_history_tail(self) -> None:
+        self._stop_history_tail()
+        self.history_last_id = 0
+        self.history_tail_due = False
+        self.history_tail_ended = False
+
+    def _toggle_history_tail(self, enabled: bool) -> None:
+        if not enabled:
+            self._stop_history_tail()
+        elif self.history_active and self.history_session_id is not None and not self.tasks.is_busy("history"):
+            self._start_history_tail()
+        self._update_session_info()
+
+    def _poll_history_tail(self) -> None:
+        last_ids, ended = self.tail_listener.take()
+        session_id = self.history_session_id
+        if last_ids.get(session_id, 0) > self.history_last_id:
+            self.history_tail_due = True
+        if session_id in ended:
+            self.history_tail_due = self.history_tail_ended = True
+        if time.monotonic() - self.history_tail_polled >= Config.HISTORY_TAIL_POLL_INTERVAL:
+            self.history_tail_due = True
+        if not self.history_tail_due or self.tasks.is_busy("history_tail"):
             return
 
-        self.ui.HistoryPacketTableWidget.setRowCount(0)
-        packet_count = len(packets)
-        self.ui.lblSessionInfo.setText(f"Сессия: {session_name} | Диапазон: {time_range} | Пакетов: {packet_count}")
-
-        for packet in packets:
-            packet_data = {
-                'id': packet.id,
-                'counter': packet.counter,
-                'timestamp': packet.timestamp,
-                'payload': packet.payload,
-                'crc16': packet.crc16,
-                'status': packet.status
-            }
-
-            self._add_packet_to_table(
-                self.ui.HistoryPacketTableWidget,
-                packet_data,
-                f"{session_id}: {session_name}"
-            )
+        self.history_tail_due = False
+        self.history_tail_polled = time.monotonic()
+        self.tasks.submit(
+            "history_tail",
+            self.db.get_packets_after,
+            session_id,
+            self.history_last_id,
+            self.history_filter,
+            Config.HISTORY_TAIL_PAGE_SIZE,
+            on_result=lambda result: self._append_history_tail(session_id, *result),
+            on_error=lambda message: self._show_error(f"Ошибка догрузки пакетов: {message}")
+        )
+
+    def _append_history_tail(self, session_id: int, batch: np.ndarray, last_id: int) -> None:
+        if session_id != self.history_session_id:
+            return
+
+        if last_id > self.history_last_id:
+            self.history_last_id = last_id
+            self.history_tail_due = True
+        elif self.history_tail_ended:
+            self._finish_history_tail()
+            return
+
+        if len(batch):
+            self.history_packet_count += len(batch)
+            history_model = self.ui.HistoryPacketTableWidget.packet_model
+            history_model.append_batch(batch)
+            if time.monotonic() - self.history_tail_charted >= Config.HISTORY_TAIL_CHART_INTERVAL:
+                self.history_tail_charted = time.monotonic()
+                snapshot = history_model.buffer.snapshot()
+                self.ui.HistoryPayloadChart.set_data(snapshot["timestamp"], snapshot["payload"], keep_view=True)
+            self._update_session_info()
+
+    def _finish_history_tail(self) -> None:
+        self._stop_history_tail()
+        self.history_active = False
+        self.ui.chkHistoryTail.setEnabled(False)
+        self.logger.info(f"Сессия {self.history_session_id} завершена, загружено пакетов: {self.history_packet_count}")
+        snapshot = self.ui.HistoryPacketTableWidget.packet_model.buffer.snapshot()
+        self.ui.HistoryPayloadChart.set_data(snapshot["timestamp"], snapshot["payload"], keep_view=True)
+        self._submit_session_overview(self.history_session_id)
+        if self.db_connected:
+            self._refresh_sessions()
+
+    def _cache_history_session(self, snapshot: Optional[np.ndarray] = None) -> None:
+        summary = self.history_summary
+        if not self.history_cacheable or summary is None or summary.packet_count != self.history_packet_count:
+            return
+
+        history_model = self.ui.HistoryPacketTableWidget.packet_model
+        if len(history_model.buffer) != summary.packet_count:
+            return
+
+        self.history_cacheable = False
+        self.tasks.submit(
+            None,
+            self.session_cache.put,
+            summary.session_id,
+            snapshot if snapshot is not None else history_model.buffer.snapshot(),
+            summary,
+            on_result=lambda _: self.logger.info(f"Сессия {summary.session_id} сохранена в локальный кэш"),
+            on_error=lambda message: self.logger.warning(f"Не удалось сохранить сессию в кэш: {message}")
+        )
+
+    def _export_session(self) -> None:
+        from export import export_session
+
+        if self.history_session_id is None or self.tasks.is_busy("export"):
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Экспорт сессии",
+            f"session_{self.history_session_id}.npz",
+            "NumPy (*.npz);;CSV (*.csv)"
+        )
+        if not path:
+            return
+
+        session_id = self.history_session_id
+        time_from, time_to = self.history_filter.time_from, self.history_filter.time_to
+        self.ui.btnExportSession.setEnabled(False)
+        if time_from is None and time_to is None:
+            self.ui.statusbar.showMessage(f"Экспорт сессии {session_id}...")
+        else:
+            self.ui.statusbar.showMessage(
+                f"Экспорт сессии {session_id} {self._format_range(time_from, time_to)}...")
+        self.tasks.submit(
+            "export",
+            export_session,
+            self.db,
+            session_id,
+            path,
+            time_from,
+            time_to,
+            on_result=lambda count: self._on_session_exported(session_id, path, count),
+            on_error=lambda message: self._show_error(f"Ошибка экспорта: {message}"),
+            on_finished=lambda: self.ui.btnExportSession.setEnabled(self.history_session_id is not None)
+        )
+
+    @staticmethod
+    def _format_range(time_from: Optional[float], time_to: Optional[float]) -> str:
+        parts = []
+        if time_from is not None:
+            parts.append(f"с {format_timestamp(time_from)}")
+        if time_to is not None:
+            parts.append(f"по {format_timestamp(time_to)}")
+        return " ".join(parts)
 
-        self.logger.info(f"Загружено {packet_count} пакетов для сессии {session_id}")
+    def _on_session_exported(self, session_id: int, path: str, count: int) -> None:
+        self.logger.info(f"Сессия {session_id} экспортирована в {path}, пакетов: {count}")
+        self.ui.statusbar.showMessage(f"Экспортировано пакетов: {count}", 5000)
 
     def _handle_new_packet(self, packet: Union[dict, str, list]) -> None:
+        PACKETS_RECEIVED.inc()
         if not packet:
-            self.logger.debug("Получен пустой пакет")
+            PACKETS_DROPPED.inc(reason="empty")
+            self.packet_logger.debug("Получен пустой пакет")
             return
 
+        started = time.perf_counter()
         parsed = self._parse_packet(packet)
+        PACKET_PARSE_SECONDS.observe(time.perf_counter() - started)
         if not parsed:
-            self.logger.warning("Не удалось распарсить пакет")
-            return
-
-        self.current_packet_counter += 1
-        session_text = f"Сессия {self.current_session_id}" if hasattr(self, 'current_session_id') else None
-
-        packet_data = {
-            'id': parsed.id,
-            'counter': parsed.counter,
-            'timestamp': parsed.timestamp,
-            'payload': parsed.payload,
-            'crc16': parsed.crc16,
-            'status': parsed.status
-        }
-
-        self._add_packet_to_table(self.ui.PacketTableWidget, packet_data, session_text)
-        self.logger.debug(f"Обработан пакет #{self.current_packet_counter}")
-
-    def _prepare_packet_items(self, packet: dict, session_info: Optional[str] = None) -> List[str]:
-        payload = packet.get('payload', 0)
-        return [
-            str(packet.get('id', 'N/A')),
-            str(packet.get('counter', packet.get('packetCounter', 'N/A'))),
-            self._format_time(packet.get('timestamp')),
-            f"{payload:.4f}",
-            hex(packet.get('crc16', 0)),
-            'NegativeValue' if payload < 0 else 'OK',
-            str(session_info) if session_info else "Текущая"
-        ]
+            PACKETS_DROPPED.inc(reason="parse_error")
+            self.packet_logger.warning("Не удалось распарсить пакет")
+            return
+
+        if not parsed.session_id and self.current_session_id:
+            parsed = parsed._replace(session_id=self.current_session_id)
+        arrival = time.time()
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.record(parsed, arrival)
+
+        session = self.live_sessions.get(parsed.session_id)
+        if session is None:
+            PACKETS_DROPPED.inc(reason="not_subscribed")
+            if self.packet_logger.isEnabledFor(logging.DEBUG):
+                self.packet_logger.debug(f"Пропущен пакет сессии без подписки: {parsed.session_id}")
+            return
+
+        if not session.tracker.add(parsed.counter, parsed.timestamp, arrival):
+            PACKETS_DROPPED.inc(reason="duplicate")
+            return
+        self.packet_queue.put(parsed)
+
+    def _track_replay_chunk(self, chunk: ReplayChunk) -> np.ndarray:
+        batch, arrivals = chunk
+        PACKETS_RECEIVED.inc(len(batch))
+        if not len(batch):
+            return batch
+
+        session_ids = batch["session_id"]
+        if (session_ids == session_ids[0]).all():
+            unique_ids = [int(session_ids[0])]
+        else:
+            unique_ids = np.unique(session_ids).tolist()
+        self._watch_replay_sessions([session_id for session_id in unique_ids
+                                     if session_id not in self.replay_sessions])
+        if len(unique_ids) == 1:
+            accepted = self.replay_sessions.get(unique_ids[0]).tracker.add_batch(
+                batch["counter"], batch["timestamp"], arrivals)
+        else:
+            accepted = np.empty(len(batch), dtype=bool)
+            for session_id in unique_ids:
+                mask = session_ids == session_id
+                accepted[mask] = self.replay_sessions.get(session_id).tracker.add_batch(
+                    batch["counter"][mask], batch["timestamp"][mask], arrivals[mask])
+
+        if not accepted.all():
+            PACKETS_DROPPED.inc(int((~accepted).sum()), reason="duplicate")
+            batch = batch[accepted]
+        return batch
+
+    def _take_queued(self, source: queue.SimpleQueue, limit: int) -> Tuple[list, int]:
+        items = []
+        count = 0
+        while count < limit:
+            try:
+                item = source.get_nowait()
+            except queue.Empty:
+                break
+            items.append(item)
+            count += queued_size(item)
+        return items, count
+
+    def _drain_packet_queue(self) -> None:
+        live_items, count = self._take_queued(self.packet_queue, Config.UI_MAX_BATCH_SIZE)
+        replay_items, _ = self._take_queued(self.replay_queue, Config.UI_MAX_BATCH_SIZE - count)
+
+        PACKET_QUEUE_DEPTH.set(self.packet_queue.qsize() + self.replay_queue.qsize())
+        if not live_items and not replay_items:
+            return
 
-    def _add_packet_to_table(self, table, packet: dict, session_info: Optional[str] = None) -> None:
-        row = table.rowCount()
-        table.insertRow(row)
+        started = time.perf_counter()
+        applied = self._apply_queued(self.live_sessions, live_items)
+        pending = []
+        for item in replay_items:
+            if item is REPLAY_RESET:
+                applied += self._apply_queued(self.replay_sessions, pending)
+                pending = []
+                self._reset_replay_sessions()
+            else:
+                pending.append(self._track_replay_chunk(item))
+        applied += self._apply_queued(self.replay_sessions, pending)
+        self.current_packet_counter += applied
+        self._update_stream_stats()
+        UI_APPLY_SECONDS.observe(time.perf_counter() - started)
+        UI_BATCH_SIZE.observe(applied)
+        if self.packet_logger.isEnabledFor(logging.DEBUG):
+            self.packet_logger.debug(f"Обработано пакетов: {applied}, всего: {self.current_packet_counter}")
+
+    def _apply_queued(self, monitor: LiveSessionMonitor, items: list) -> int:
+        if not items:
+            return 0
+
+        batch = queued_to_batch(items)
+        for session, part in monitor.split(batch):
+            if session is self.live_session:
+                self.ui.PacketTableWidget.packet_model.append_batch(part)
+                self.ui.LivePayloadChart.append_batch(part)
+            else:
+                session.buffer.extend(part)
+                session.decimator.add(part["timestamp"], part["payload"])
+        return len(batch)
+
+    def _session_for_key(self, key: Optional[SessionKey]) -> Optional[LiveSession]:
+        if key is None:
+            return None
+        kind, session_id = key
+        return (self.replay_sessions if kind == REPLAY else self.live_sessions).get(session_id)
+
+    def _session_index(self, key: SessionKey) -> int:
+        combo = self.ui.cmbLiveSession
+        return next((index for index in range(combo.count()) if combo.itemData(index) == key), -1)
+
+    def _watch_session(self, session: LiveSession, kind: str = LIVE) -> None:
+        key = (kind, session.session_id)
+        index = self._session_index(key)
+        if index < 0:
+            self.ui.cmbLiveSession.addItem(session.label, key)
+            index = self.ui.cmbLiveSession.count() - 1
+        self.ui.cmbLiveSession.setCurrentIndex(index)
+
+    def _watch_selected_session(self) -> None:
+        session = self.session_model.session(self.ui.listSessions.currentIndex())
+        if session is None or session.end_time is not None or not self.signalr_connected:
+            return
+
+        live_session = self.live_sessions.watch(session.id, f"{session.id}: {session.name}")
+        self.tasks.submit(
+            None,
+            self.signalr.join_session,
+            session.id,
+            on_error=lambda message: self._show_error(f"Не удалось подписаться на сессию: {message}")
+        )
+        self._watch_session(live_session)
+        self.logger.info(f"Наблюдение за сессией {session.id}, всего сессий: {len(self.live_sessions)}")
+        self._update_watch_buttons()
 
-        items = self._prepare_packet_items(packet, session_info)
-        payload = packet.get('payload', 0)
+    def _is_generation_session(self, key: Optional[SessionKey]) -> bool:
+        return self.is_generation_active and key == (LIVE, self.current_session_id)
 
-        for col, text in enumerate(items):
-            item = QTableWidgetItem(text)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if payload < 0:
-                item.setBackground(QColor(255, 230, 230))
-            table.setItem(row, col, item)
+    def _unwatch_live_session(self) -> None:
+        key = self.live_session_key
+        if key is None or self._is_generation_session(key):
+            return
+
+        kind, session_id = key
+        if kind == REPLAY:
+            self.replay_sessions.unwatch(session_id)
+        else:
+            if self.signalr_connected:
+                self.tasks.submit(None, self.signalr.leave_session, session_id)
+            self.live_sessions.unwatch(session_id)
+        self.ui.cmbLiveSession.removeItem(self._session_index(key))
+        self.logger.info(f"Наблюдение за сессией {session_id} прекращено")
+        self._update_watch_buttons()
+
+    def _on_live_session_selected(self, index: int) -> None:
+        key = self.ui.cmbLiveSession.itemData(index)
+        session = self._session_for_key(key)
+        self.live_session = session
+        table_model = self.ui.PacketTableWidget.packet_model
+        if session is None:
+            self.live_session_key = None
+            table_model.set_buffer(PacketRingBuffer(Config.LIVE_TABLE_CAPACITY))
+            self.ui.LivePayloadChart.set_decimator(
+                StreamingDecimator(Config.LIVE_CHART_WINDOW_SECONDS, Config.LIVE_CHART_BUCKETS))
+        else:
+            self.live_session_key = key
+            table_model.session_label = session.label
+            table_model.set_buffer(session.buffer)
+            self.ui.LivePayloadChart.set_decimator(session.decimator)
+        self._update_stream_stats()
+        self._update_watch_buttons()
+
+    def _set_show_milliseconds(self, enabled: bool) -> None:
+        for table in (self.ui.PacketTableWidget, self.ui.HistoryPacketTableWidget):
+            table.packet_model.set_show_milliseconds(enabled)
+
+    def _toggle_capture(self, enabled: bool) -> None:
+        if enabled and self.recorder is None:
+            from capture import CaptureRecorder
+
+            path = os.path.join(Config.CAPTURE_DIR, f"capture_{datetime.now():%Y%m%d_%H%M%S}.tlmcap")
+            try:
+                self.recorder = CaptureRecorder(
+                    path,
+                    chunk_packets=Config.CAPTURE_CHUNK_PACKETS,
+                    flush_interval=Config.CAPTURE_FLUSH_INTERVAL,
+                    compression_level=Config.CAPTURE_COMPRESSION_LEVEL
+                )
+            except OSError as e:
+                self.ui.btnCapture.setChecked(False)
+                self._show_error(f"Не удалось начать запись: {e}")
+                return
+            self.logger.info(f"Запись потока в {path}")
+        elif not enabled and self.recorder is not None:
+            recorder, self.recorder = self.recorder, None
+            self.tasks.submit(
+                None,
+                recorder.close,
+                on_finished=lambda: self.logger.info(
+                    f"Запись потока остановлена: {recorder.path}, пакетов: {recorder.packet_count}")
+            )
+        self._update_stream_stats()
+
+    def _open_replay_capture(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Открыть журнал захвата", Config.CAPTURE_DIR, "Журнал захвата (*.tlmcap)")
+        if not path:
+            return
+
+        from replay import CaptureReplaySource
+
+        try:
+            source = CaptureReplaySource(path)
+        except (OSError, ValueError) as e:
+            self._show_error(f"Не удалось открыть журнал захвата: {e}")
+            return
+        self._start_replay(source)
+
+    def _replay_selected_session(self) -> None:
+        session = self.session_model.session(self.ui.listSessions.currentIndex())
+        if session is None:
+            return
+
+        self.ui.btnReplaySession.setEnabled(False)
+        self.tasks.submit(
+            "replay",
+            self.db.get_session_summary,
+            session.id,
+            on_result=self._start_session_replay,
+            on_error=lambda message: self._show_error(f"Не удалось загрузить сессию: {message}"),
+            on_finished=self._update_watch_buttons
+        )
+
+    def _start_session_replay(self, summary: Optional[SessionSummary]) -> None:
+        if summary is None or not summary.packet_count:
+            self._show_error("В сессии нет пакетов для воспроизведения")
+            return
+
+        from replay import DatabaseReplaySource
+
+        self._start_replay(DatabaseReplaySource(self.db, summary, Config.HISTORY_PAGE_SIZE))
+
+    def _start_replay(self, source) -> None:
+        from replay import ReplayEngine
+
+        self._stop_replay()
+        for session_id in self.replay_sessions.ids():
+            self.replay_sessions.unwatch(session_id)
+            self.ui.cmbLiveSession.removeItem(self._session_index((REPLAY, session_id)))
+        replay_queue = self.replay_queue = queue.SimpleQueue()
+        self.replay = ReplayEngine(
+            source,
+            lambda batch, arrivals: replay_queue.put(ReplayChunk(batch, arrivals)),
+            None,
+            replay_queue.qsize,
+            speed=self.REPLAY_SPEEDS[self.ui.cmbReplaySpeed.currentIndex()],
+            batch_size=Config.REPLAY_BATCH_SIZE,
+            max_backlog=Config.REPLAY_MAX_BACKLOG,
+            on_seek=lambda offset: replay_queue.put(REPLAY_RESET)
+        )
+        self.ui.btnReplayPause.setChecked(False)
+        self.replay.start()
+        self.replay_timer.start(200)
+        self.logger.info(f"Воспроизведение: {source.label}, пакетов: {source.packet_count}")
+        self._update_replay_controls()
+
+    def _watch_replay_sessions(self, session_ids: List[int]) -> None:
+        for session_id in session_ids:
+            session = self.replay_sessions.watch(session_id, f"Повтор: {session_id}")
+            self._watch_session(session, REPLAY)
+        if session_ids:
+            self._update_watch_buttons()
+
+    def _set_replay_speed(self, index: int) -> None:
+        if self.replay is not None:
+            self.replay.set_speed(self.REPLAY_SPEEDS[index])
+
+    def _pause_replay(self, paused: bool) -> None:
+        if self.replay is None:
+            return
+        if paused:
+            self.replay.pause()
+        else:
+            self.replay.resume()
+
+    def _seek_replay(self) -> None:
+        replay = self.replay
+        if replay is None:
+            return
+
+        slider = self.ui.sliderReplay
+        replay.seek(replay.source.duration * slider.value() / max(1, slider.maximum()))
+
+    def _reset_replay_sessions(self) -> None:
+        for session_id in self.replay_sessions.ids():
+            session = self.replay_sessions.get(session_id)
+            session.tracker.reset()
+            session.decimator.clear()
+            if session is self.live_session:
+                self.ui.PacketTableWidget.packet_model.clear()
+                self.ui.LivePayloadChart.clear()
+            else:
+                session.buffer.clear()
+
+    def _stop_replay(self) -> None:
+        replay, self.replay = self.replay, None
+        self.replay_timer.stop()
+        if replay is not None:
+            replay.stop()
+            self.tasks.submit(
+                None,
+                replay.join,
+                on_finished=lambda: self.logger.info(
+                    f"Воспроизведение остановлено: {replay.source.label}, пакетов: {replay.packets_sent}")
+            )
+        self._update_replay_controls()
+
+    def _update_replay_controls(self) -> None:
+        replay = self.replay
+        active = replay is not None
+        self.ui.btnReplayPause.setEnabled(active)
+        self.ui.btnReplayStop.setEnabled(active)
+        self.ui.sliderReplay.setEnabled(active)
+        if not active:
+            self.ui.lblReplayPosition.setText("")
+            return
+
+        if replay.error:
+            self._show_error(f"Ошибка воспроизведения: {replay.error}")
+            self._stop_replay()
+            return
+
+        duration = replay.source.duration
+        if not self.ui.sliderReplay.isSliderDown():
+            self.ui.sliderReplay.setValue(
+                int(self.ui.sliderReplay.maximum() * replay.position / duration) if duration else 0)
+        status = "готово" if replay.finished else ("пауза" if replay.paused else "идёт")
+        self.ui.lblReplayPosition.setText(
+            f"{replay.position:.1f} / {duration:.1f} с | {replay.packets_sent} пакетов | {status}")
+
+    def _update_stream_stats(self) -> None:
+        parts = []
+        session = self.live_session
+        if session is not None:
+            stats = session.tracker.stats()
+            parts.append(
+                f"Потери: {stats.missing} ({stats.loss_percent:.2f}%, разрывов: {stats.gap_count}) | "
+                f"Дубликаты: {stats.duplicates} | Вне порядка: {stats.reordered} | "
+                f"Восстановлено: {stats.backfilled} | Джиттер: {stats.jitter * 1000:.1f} мс"
+            )
+        recorder = self.recorder
+        if recorder is not None:
+            parts.append(f"Запись: {recorder.packet_count} пакетов, {recorder.bytes_written / 1024 / 1024:.1f} МБ")
+        self.lblStreamStats.setText(" | ".join(parts))
 
     def _parse_packet(self, raw_packet: Union[dict, str, list]) -> Optional[TelemetryPacket]:
         if not raw_packet:
@@ -222,7 +1104,7 @@ class MainWindow(QMainWindow):
             try:
                 raw_packet = json.loads(raw_packet)
             except json.JSONDecodeError as e:
-                self.logger.error(f"Ошибка декодирования JSON: {e}")
+                self.packet_logger.error(f"Ошибка декодирования JSON: {e}")
                 return None
 
         if isinstance(raw_packet, list):
@@ -231,34 +1113,22 @@ class MainWindow(QMainWindow):
             else:
                 return None
 
+        if isinstance(raw_packet, TelemetryPacket):
+            return raw_packet
+
         if not isinstance(raw_packet, dict):
             return None
 
-        payload = raw_packet.get('payload', 0)
-        return TelemetryPacket(
-            id=raw_packet.get('id', 0),
-            counter=raw_packet.get('packetCounter', 0),
-            timestamp=raw_packet.get('timestamp'),
-            payload=payload,
-            crc16=raw_packet.get('crc16', 0),
-            status='NegativeValue' if payload < 0 else 'OK'
+        get = raw_packet.get
+        return make_packet(
+            get('id'),
+            get('packetCounter'),
+            get('timestamp'),
+            get('payload'),
+            get('crc16'),
+            get('sessionId')
         )
 
-    def _format_time(self, time_value: Union[int, float, str, None]) -> str:
-        if not time_value:
-            return "N/A"
-
-        try:
-            if isinstance(time_value, (int, float)):
-                return datetime.fromtimestamp(time_value).strftime('%Y-%m-%d %H:%M:%S')
-            elif 'T' in str(time_value):
-                return datetime.fromisoformat(str(time_value).replace('T', ' ')).strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                return datetime.strptime(str(time_value), '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M:%S')
-        except Exception as e:
-            self.logger.error(f"Ошибка формата времени: {e}")
-            return "N/A"
-
     def _start_generation(self) -> None:
         if not self.db_connected:
             self.logger.warning("Попытка запустить генерацию без подключения к БД")
@@ -270,121 +1140,353 @@ class MainWindow(QMainWindow):
             self._show_error("Сначала подключитесь к серверу")
             return
 
+        if self.async_tasks.is_busy("generation"):
+            return
+
         self.current_packet_counter = 0
-        self.ui.PacketTableWidget.setRowCount(0)
 
         session_name = f"Сессия {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        response = self.api.start_session(session_name)
-
-        if response.status_code != 200:
-            self.logger.error(f"Ошибка запуска сессии, код статуса: {response.status_code}")
-            self._show_error("Ошибка создания сессии")
-            return
+        self.ui.btnStart.setEnabled(False)
+        self.async_tasks.submit(
+            "generation",
+            self._request_generation_start,
+            session_name,
+            on_result=self._on_generation_started,
+            on_error=self._on_generation_request_failed,
+            on_finished=self._update_ui_state
+        )
 
-        session_data = response.json()
-        if 'SessionId' not in session_data:
-            self.logger.error("Некорректный формат ответа сервера")
-            self._show_error("Неверный формат ответа сервера")
-            return
+    async def _request_generation_start(self, session_name: str) -> int:
+        session_id = await self.api.start_session(session_name)
+        self.live_sessions.watch(session_id, f"{session_id}: {session_name}")
+        await asyncio.gather(
+            self.api.start_generation(session_id),
+            asyncio.get_running_loop().run_in_executor(None, self.signalr.join_session, session_id)
+        )
+        return session_id
 
-        self.current_session_id = session_data['SessionId']
-        response = self.api.start_generation(self.current_session_id)
+    def _on_generation_started(self, session_id: int) -> None:
+        self.current_session_id = session_id
+        self._watch_session(self.live_sessions.get(int(session_id)))
+        self.is_generation_active = True
+        self.logger.info(f"Генерация запущена для сессии {self.current_session_id}")
 
-        if response.status_code == 200:
-            self.signalr.join_session(int(self.current_session_id))
-            self.is_generation_active = True
-            self._update_ui_state()
-            self.logger.info(f"Генерация запущена для сессии {self.current_session_id}")
-        else:
-            self.logger.error(f"Ошибка запуска генерации, код статуса: {response.status_code}")
-            self._show_error("Ошибка запуска генерации")
+    def _on_generation_request_failed(self, message: str) -> None:
+        self._show_error(message)
 
     def _stop_generation(self) -> None:
         if not self.is_generation_active:
             return
 
-        try:
-            if hasattr(self, 'current_session_id') and self.current_session_id:
-                self.signalr.leave_session(int(self.current_session_id))
-                response = self.api.stop_generation(self.current_session_id)
-
-                if response.status_code == 200:
-                    self.is_generation_active = False
-                    self._update_ui_state()
-                    self.logger.info("Генерация остановлена")
-                else:
-                    self.logger.error(f"Ошибка остановки генерации, код статуса: {response.status_code}")
-                    self._show_error("Сервер не подтвердил остановку генерации")
-        except Exception as e:
-            self.logger.error(f"Ошибка при остановке генерации: {e}")
-            self._show_error(f"Ошибка при остановке генерации: {str(e)}")
+        if not self.current_session_id or self.async_tasks.is_busy("generation"):
+            return
 
-    def _toggle_server_connection(self) -> None:
-        try:
-            if self.signalr_connected:
-                self.is_manual_disconnect = True
-                self.signalr.disconnect()
-                self.logger.info("Отключено от сервера по запросу пользователя")
-            else:
-                self.is_manual_disconnect = False
-                self.signalr.connect()
-                self.logger.info("Попытка подключения к серверу")
-        except Exception as e:
-            self.logger.error(f"Ошибка подключения: {e}")
+        self.ui.btnStop.setEnabled(False)
+        self.async_tasks.submit(
+            "generation",
+            self._request_generation_stop,
+            int(self.current_session_id),
+            on_result=self._on_generation_stopped,
+            on_error=lambda message: self._show_error(f"Ошибка при остановке генерации: {message}"),
+            on_finished=self._update_ui_state
+        )
+
+    async def _request_generation_stop(self, session_id: int) -> None:
+        await asyncio.gather(
+            asyncio.get_running_loop().run_in_executor(None, self.signalr.leave_session, session_id),
+            self.api.stop_generation(session_id)
+        )
+
+    async def _stop_generation_on_exit(self, session_id: int) -> None:
+        await self._request_generation_stop(session_id)
+        self.logger.info("Генерация остановлена при завершении работы")
+
+    def _on_generation_stopped(self, _) -> None:
+        self.is_generation_active = False
+        self.logger.info("Генерация остановлена")
+
+    def _server_clients(self) -> "SignalRClient":
+        from server_connection import SignalRClient, TelemetryApiClient
+
+        if self.api is None:
+            self.api = TelemetryApiClient(
+                Config.SERVER_URL + "/api/Telemetry",
+                timeout=Config.API_TIMEOUT,
+                stop_timeout=Config.API_STOP_TIMEOUT,
+                max_connections=Config.API_MAX_CONNECTIONS
+            )
+        if self.signalr is None:
+            signalr = SignalRClient(f'{Config.SERVER_URL}/telemetryhub', Config.SIGNALR_PROTOCOL)
+            signalr.on_packet_received(self._handle_new_packet)
+            signalr.connection.on_open(lambda: self.server_opened.emit(signalr))
+            signalr.connection.on_close(lambda: self.server_closed.emit(signalr))
+            signalr.connection.on_error(lambda error: self.server_failed.emit(signalr, str(error)))
+            self.signalr = signalr
+        return self.signalr
+
+    def _connect_server(self, manual: bool = False) -> None:
+        if self.server_connecting or self.signalr_connected:
+            return
+
+        if manual:
+            self.reconnect_timer.stop()
+            self.current_reconnect_attempt = 0
+        self.is_manual_disconnect = False
+        self.server_connecting = True
+        self.server_connect_manual = manual
+        self.tasks.submit(
+            "server_connect",
+            lambda: self._server_clients().connect(),
+            on_error=self._on_server_connect_failed
+        )
+        self.server_connect_timer.start(int(Config.SERVER_CONNECT_TIMEOUT * 1000))
+        self.logger.info("Попытка подключения к серверу")
+        self._update_connection_status()
+
+    def _on_server_connect_failed(self, message: str) -> None:
+        self.server_connect_timer.stop()
+        self.server_connecting = False
+        self.logger.error(f"Ошибка подключения: {message}")
+        self._update_ui_state()
+        if self.server_connect_manual:
             QMessageBox.critical(
                 self,
                 "Ошибка подключения",
                 "Не удалось подключиться к серверу!",
                 QMessageBox.StandardButton.Ok
             )
+        else:
+            self._schedule_reconnect()
+
+    def _on_server_connect_timeout(self) -> None:
+        if not self.server_connecting or self.signalr_connected:
+            return
+
+        self.tasks.cancel("server_connect")
+        self.signalr = None
+        self._on_server_connect_failed(f"сервер не ответил за {Config.SERVER_CONNECT_TIMEOUT:.0f} с")
+
+    def _reconnect_delay(self, attempt: int) -> int:
+        delay = min(self.BASE_RECONNECT_INTERVAL * 2 ** attempt, self.MAX_RECONNECT_INTERVAL)
+        return int(delay / 2 + random.uniform(0, delay / 2))
+
+    def _schedule_reconnect(self) -> None:
+        if self.reconnect_timer.isActive():
+            return
+
+        if self.current_reconnect_attempt >= self.MAX_RECONNECT_ATTEMPTS:
+            self.logger.error(f"Соединение с сервером не восстановлено за {self.MAX_RECONNECT_ATTEMPTS} попыток")
+            self.current_reconnect_attempt = 0
+            self.resume_points.clear()
+            self.is_generation_active = False
+            self.ui.statusbar.showMessage("Сервер недоступен, подключитесь вручную", 5000)
+            self._update_ui_state()
+            return
 
-    def _on_server_connected(self) -> None:
+        delay = self._reconnect_delay(self.current_reconnect_attempt)
+        self.current_reconnect_attempt += 1
+        self.reconnect_timer.start(delay)
+        self.logger.warning(
+            f"Переподключение к серверу через {delay / 1000:.1f} с "
+            f"(попытка {self.current_reconnect_attempt}/{self.MAX_RECONNECT_ATTEMPTS})"
+        )
+        self._update_connection_status()
+
+    def _reconnect_server(self) -> None:
+        self.signalr = None
+        self._connect_server()
+
+    def _toggle_server_connection(self) -> None:
+        if self.signalr_connected:
+            self.is_manual_disconnect = True
+            self.reconnect_timer.stop()
+            self.resume_points.clear()
+            try:
+                self.signalr.disconnect()
+            except Exception as e:
+                self.logger.error(f"Ошибка отключения: {e}")
+            self.logger.info("Отключено от сервера по запросу пользователя")
+        else:
+            self._connect_server(manual=True)
+
+    def _on_server_connected(self, client: "SignalRClient") -> None:
+        if client is not self.signalr:
+            self.tasks.submit(None, client.disconnect)
+            return
+
+        self.server_connect_timer.stop()
         self.signalr_connected = True
+        self.server_connecting = False
         self.current_reconnect_attempt = 0
         self._update_ui_state()
         self.logger.info("Успешное подключение к серверу")
+        if self.resume_points:
+            self._resume_sessions()
+
+    def _on_server_disconnected(self, client: "SignalRClient") -> None:
+        if client is not self.signalr:
+            return
 
-    def _on_server_disconnected(self) -> None:
         self.logger.debug("Отключение от сервера")
+        was_connected = self.signalr_connected
         self.signalr_connected = False
-        self.is_generation_active = False
-        self._update_ui_state()
 
-        if hasattr(self, 'is_manual_disconnect') and self.is_manual_disconnect:
+        if self.is_manual_disconnect:
+            self.is_generation_active = False
+            self._update_ui_state()
             self.ui.statusbar.showMessage("Соединение с сервером закрыто пользователем")
             QTimer.singleShot(500, self._update_ui_state)
-        else:
-            self._show_error("Соединение с сервером разорвано")
+            return
+
+        if self.server_connecting:
+            self._on_server_connect_failed("соединение закрыто при подключении")
+            return
+
+        if was_connected:
+            self._remember_resume_points()
+            self.ui.statusbar.showMessage("Соединение с сервером разорвано, переподключение…", 5000)
             self.logger.warning("Сервер разорвал соединение")
+        self._schedule_reconnect()
+        self._update_ui_state()
 
-    def _handle_error(self, error: str) -> None:
-        error_msg = str(error)
-        if not error_msg or "WinError" in error_msg:
-            error_msg = "Сервер разорвал соединение"
+    def _remember_resume_points(self) -> None:
+        for session_id in self.live_sessions.ids():
+            session = self.live_sessions.get(session_id)
+            if session is None or session_id in self.resume_points:
+                continue
+
+            next_counter = session.tracker.next_expected
+            if next_counter is None:
+                continue
+            buffer = session.buffer
+            last_timestamp = float(buffer.value(len(buffer) - 1, "timestamp")) if len(buffer) else None
+            if last_timestamp is not None and np.isnan(last_timestamp):
+                last_timestamp = None
+            self.resume_points[session_id] = (next_counter, last_timestamp)
+
+    def _resume_sessions(self) -> None:
+        resume_points, self.resume_points = self.resume_points, {}
+        for session_id, (next_counter, last_timestamp) in resume_points.items():
+            if session_id not in self.live_sessions:
+                continue
+
+            packet_filter = PacketFilter(time_from=last_timestamp, counter_from=next_counter)
+            self.tasks.submit(
+                f"backfill_{session_id}",
+                self._rejoin_session,
+                self.signalr,
+                session_id,
+                packet_filter,
+                on_chunk=lambda batch, session_id=session_id: self._merge_backfill(session_id, batch),
+                on_error=lambda message: self._show_error(f"Ошибка восстановления сессии: {message}"),
+                on_finished=lambda session_id=session_id, packet_filter=packet_filter: QTimer.singleShot(
+                    int(Config.BACKFILL_SETTLE_INTERVAL * 1000),
+                    lambda: self._backfill_gaps(session_id, packet_filter)
+                )
+            )
+            self.logger.info(f"Повторная подписка на сессию {session_id}, догрузка с пакета {next_counter}")
+
+    def _rejoin_session(self, signalr: "SignalRClient", session_id: int,
+                        packet_filter: PacketFilter) -> Iterator[np.ndarray]:
+        signalr.join_session(session_id)
+        session = self.live_sessions.get(session_id)
+        received_to = session.tracker.next_expected - 1 if session is not None else None
+        if received_to is not None and received_to >= packet_filter.counter_from:
+            packet_filter = replace(packet_filter, counter_to=received_to)
+        yield from self.db.iter_filtered_packets(
+            session_id, packet_filter, Config.HISTORY_PAGE_SIZE, Config.HISTORY_PAGE_SIZE)
+
+    def _backfill_gaps(self, session_id: int, packet_filter: PacketFilter) -> None:
+        session = self.live_sessions.get(session_id)
+        if session is None:
+            return
 
-        self.signalr_connected = False
-        self.is_generation_active = False
-        self.logger.error(f"Ошибка соединения: {error_msg}")
+        gaps = [(start, end) for start, end in session.tracker.gaps() if end >= packet_filter.counter_from]
+        if not gaps:
+            return
 
-        QMessageBox.critical(
-            self,
-            "Ошибка соединения",
-            f"Не удалось подключиться к серверу:\n\n{error_msg}",
-            QMessageBox.StandardButton.Ok
+        gap_filter = PacketFilter(
+            time_from=packet_filter.time_from,
+            counter_from=max(gaps[0][0], packet_filter.counter_from),
+            counter_to=gaps[-1][1]
+        )
+        self.tasks.submit(
+            f"backfill_{session_id}",
+            self.db.iter_filtered_packets,
+            session_id,
+            gap_filter,
+            Config.HISTORY_PAGE_SIZE,
+            Config.HISTORY_PAGE_SIZE,
+            on_chunk=lambda batch: self._merge_backfill(session_id, batch),
+            on_error=lambda message: self._show_error(f"Ошибка догрузки пропусков: {message}")
         )
 
-        self._update_ui_state()
+    def _merge_backfill(self, session_id: int, batch: np.ndarray) -> None:
+        session = self.live_sessions.get(session_id)
+        if session is None or not len(batch):
+            return
+
+        fresh = batch[session.tracker.backfill(batch["counter"])]
+        if not len(fresh):
+            return
+
+        self._drain_packet_queue()
+        if session is self.live_session:
+            self.ui.PacketTableWidget.packet_model.merge_batch(fresh)
+            self.ui.LivePayloadChart.append_batch(fresh)
+        else:
+            session.buffer.merge(fresh)
+            session.decimator.add(fresh["timestamp"], fresh["payload"])
+        session.packet_count += len(fresh)
+        self.current_packet_counter += len(fresh)
+        PACKETS_BACKFILLED.inc(len(fresh))
+        self._update_stream_stats()
+        self.logger.info(f"Восстановлено пакетов сессии {session_id}: {len(fresh)}")
+
+    def _handle_error(self, client: "SignalRClient", error: str) -> None:
+        if client is not self.signalr:
+            return
+
+        error_msg = str(error) or "неизвестная ошибка"
+        self.logger.error(f"Ошибка сервера: {error_msg}")
+        self.ui.statusbar.showMessage(f"ОШИБКА: {error_msg}", 3000)
 
     def _update_ui_state(self) -> None:
         self.ui.btnConnect.setText("Отключиться" if self.signalr_connected else "Подключиться")
-        self.ui.btnStart.setEnabled(self.signalr_connected and not self.is_generation_active)
-        self.ui.btnStop.setEnabled(self.is_generation_active)
+        self.ui.btnConnect.setEnabled(not self.server_connecting)
+        generation_pending = self.async_tasks.is_busy("generation")
+        self.ui.btnStart.setEnabled(self.signalr_connected and not self.is_generation_active and not generation_pending)
+        self.ui.btnStop.setEnabled(self.is_generation_active and not generation_pending)
+        self._update_watch_buttons()
         self._check_db_connection()
-        db_status = "БД: ✔" if self.db_connected else "БД: ✖"
+        self._update_connection_status()
+
+    def _update_connection_status(self) -> None:
+        if self.db_connected:
+            db_status = "БД: ✔"
+        else:
+            db_status = "БД: подключение…" if self.tasks.is_busy("db_connect") else "БД: ✖"
+        if self.signalr_connected:
+            server_status = "Сервер: ✔"
+        elif self.current_reconnect_attempt:
+            server_status = f"Сервер: переподключение {self.current_reconnect_attempt}/{self.MAX_RECONNECT_ATTEMPTS}…"
+        else:
+            server_status = "Сервер: подключение…" if self.server_connecting else "Сервер: ОТКЛЮЧЕН"
         gen_status = f"Генерация: {'ВКЛ' if self.is_generation_active else 'ВЫКЛ'}"
-        server_status = "Сервер: ОТКЛЮЧЕН" if not self.signalr_connected else "Сервер: ✔"
+        self.lblConnectionStatus.setText(f"{db_status} | {gen_status} | {server_status}")
 
-        self.ui.statusbar.showMessage(f"{db_status} | {gen_status} | {server_status}")
+    def _update_watch_buttons(self) -> None:
+        selected = self.session_model.session(self.ui.listSessions.currentIndex())
+        self.ui.btnWatchSession.setEnabled(
+            self.signalr_connected and selected is not None and selected.end_time is None
+            and selected.id not in self.live_sessions
+        )
+        self.ui.btnUnwatchSession.setEnabled(
+            self.live_session_key is not None and not self._is_generation_session(self.live_session_key)
+        )
+        self.ui.btnReplaySession.setEnabled(
+            self.db_connected and selected is not None and not self.tasks.is_busy("replay")
+        )
 
     def _show_error(self, message: str) -> None:
         if not message.strip():
@@ -402,22 +1504,41 @@ class MainWindow(QMainWindow):
             self.logger.warning(f"Предупреждение: {message}")
 
     def closeEvent(self, event) -> None:
-        if self.is_generation_active:
-            if hasattr(self, 'current_session_id') and self.current_session_id:
-                self.signalr.leave_session(self.current_session_id)
-            response = self.api.stop_generation()
-            if response.status_code == 200:
-                self.is_generation_active = False
-                self._update_ui_state()
-                self.logger.info("Генерация остановлена при завершении работы")
-
-        if hasattr(self, 'signalr') and self.signalr_connected:
+        self.is_manual_disconnect = True
+        self.reconnect_timer.stop()
+        self.server_connect_timer.stop()
+        self.history_tail_timer.stop()
+        if not self.tail_listener.stop(Config.SHUTDOWN_TIMEOUT):
+            self.logger.warning("Поток уведомлений БД не завершился вовремя")
+        if self.replay is not None:
+            self.replay.stop()
+            if not self.replay.join(Config.SHUTDOWN_TIMEOUT):
+                self.logger.warning("Поток воспроизведения не завершился вовремя")
+            self.replay = None
+        if self.recorder is not None:
+            self.recorder.close()
+            self.logger.info(f"Запись потока сохранена: {self.recorder.path}")
+            self.recorder = None
+        self.tasks.shutdown()
+        self.diagnostics_timer.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+
+        if self.is_generation_active and self.current_session_id:
+            self.async_tasks.submit(None, self._stop_generation_on_exit, int(self.current_session_id))
+        closers = [self.api.close] if self.api is not None else []
+        self.async_tasks.shutdown(Config.SHUTDOWN_TIMEOUT, *closers)
+
+        if self.signalr is not None and self.signalr_connected:
             self.signalr.disconnect()
             self.logger.info("Отключено от сервера при завершении работы")
 
-        if hasattr(self, 'db') and hasattr(self.db, 'conn') and self.db.conn and not self.db.conn.closed:
-            self.db.conn.close()
+        if hasattr(self, 'db'):
+            self.db.close()
             self.logger.info("Подключение к БД закрыто при завершении работы")
 
         self.logger.info("Завершение работы приложения")
+        if self.startup_probe is not None:
+            self.logger.removeHandler(self.startup_probe)
+        self.packet_logger.removeFilter(self.packet_log_limit)
         event.accept()
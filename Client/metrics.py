@@ -0,0 +1,242 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+LATENCY_BUCKETS = tuple(
+    round(base * 10 ** exponent, 9)
+    for exponent in range(-6, 2)
+    for base in (1, 2.5, 5)
+)
+SIZE_BUCKETS = (1, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+RATE_LIMIT_NOTE = "rate_limit_note"
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in key) + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def samples(self) -> List[Tuple[str, LabelKey, float]]:
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class HistogramSeries:
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else float("inf")
+        return float("inf")
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, HistogramSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = HistogramSeries(self.buckets)
+            series.counts[bisect_left(self.buckets, value)] += 1
+            series.count += 1
+            series.total += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def series(self) -> Dict[LabelKey, HistogramSeries]:
+        with self._lock:
+            return dict(self._series)
+
+    def samples(self) -> List[Tuple[str, LabelKey, float]]:
+        samples = []
+        for key, series in self.series().items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                samples.append((f"{self.name}_bucket", key + (("le", le),), cumulative))
+            samples.append((f"{self.name}_sum", key, series.total))
+            samples.append((f"{self.name}_count", key, series.count))
+        return samples
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._register(Gauge(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, buckets))
+
+    def metrics(self) -> List[object]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for metric in self.metrics():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, key, value in metric.samples():
+                lines.append(f"{name}{_format_labels(key)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+PACKETS_RECEIVED = REGISTRY.counter("telemetry_packets_received_total", "Пакеты, полученные из SignalR")
+PACKETS_DROPPED = REGISTRY.counter("telemetry_packets_dropped_total", "Отброшенные пакеты по причинам")
+PACKET_PARSE_SECONDS = REGISTRY.histogram("telemetry_packet_parse_seconds", "Время разбора одного пакета")
+UI_APPLY_SECONDS = REGISTRY.histogram("telemetry_ui_apply_seconds", "Время применения пачки пакетов к интерфейсу")
+UI_BATCH_SIZE = REGISTRY.histogram("telemetry_ui_batch_size", "Размер пачки пакетов за тик интерфейса", SIZE_BUCKETS)
+PACKET_QUEUE_DEPTH = REGISTRY.gauge("telemetry_packet_queue_depth", "Очередь пакетов перед интерфейсом")
+DB_QUERY_SECONDS = REGISTRY.histogram("telemetry_db_query_seconds", "Время запросов PostgresManager")
+DB_QUERY_ERRORS = REGISTRY.counter("telemetry_db_query_errors_total", "Ошибки запросов PostgresManager")
+REST_CALL_SECONDS = REGISTRY.histogram("telemetry_rest_call_seconds", "Время вызовов REST API сервера")
+CAPTURE_PACKETS = REGISTRY.counter("telemetry_capture_packets_total", "Пакеты, записанные в журнал захвата")
+CAPTURE_CHUNK_SECONDS = REGISTRY.histogram("telemetry_capture_chunk_seconds", "Время сжатия и записи блока журнала захвата")
+PACKETS_BACKFILLED = REGISTRY.counter("telemetry_packets_backfilled_total", "Пакеты, восстановленные из БД после переподключения")
+STARTUP_SECONDS = REGISTRY.gauge("telemetry_startup_seconds", "Время от запуска клиента до готовности по этапам")
+LOG_MESSAGES_SUPPRESSED = REGISTRY.counter("telemetry_log_messages_suppressed_total", "Сообщения журнала, отброшенные ограничителем частоты")
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class MetricsServer:
+    def __init__(self, host: str, port: int):
+        self.server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.server.server_address[:2]
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, burst: int = 10, interval: float = 10.0):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._windows: Dict[Tuple[str, int], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = int(window[2]) if window else 0
+                window = self._windows[key] = [now, 0, 0]
+                if suppressed:
+                    setattr(record, RATE_LIMIT_NOTE, f" (ещё {suppressed} подобных сообщений пропущено)")
+            if window[1] >= self.burst:
+                window[2] += 1
+                LOG_MESSAGES_SUPPRESSED.inc(logger=record.name)
+                return False
+            window[1] += 1
+            return True
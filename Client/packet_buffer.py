@@ -0,0 +1,130 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from row_models import PACKET_DTYPE
+
+
+class PacketRingBuffer:
+    INITIAL_ALLOCATION = 1024
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Ёмкость буфера должна быть положительной")
+
+        self.capacity = capacity
+        self.columns: Dict[str, np.ndarray] = self._allocate(min(capacity, self.INITIAL_ALLOCATION))
+        self._head = 0
+        self._size = 0
+
+    @staticmethod
+    def _allocate(size: int) -> Dict[str, np.ndarray]:
+        return {name: np.empty(size, dtype=PACKET_DTYPE[name]) for name in PACKET_DTYPE.names}
+
+    @property
+    def allocated(self) -> int:
+        return len(self.columns["id"])
+
+    def _reserve(self, size: int) -> None:
+        allocated = self.allocated
+        if size <= allocated or allocated == self.capacity:
+            return
+
+        order = (self._head + np.arange(self._size)) % allocated
+        columns = self._allocate(min(self.capacity, max(size, allocated * 2)))
+        for name, column in self.columns.items():
+            columns[name][:self._size] = column[order]
+        self.columns = columns
+        self._head = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+    def overflow(self, count: int) -> int:
+        return max(0, self._size + min(count, self.capacity) - self.capacity)
+
+    def drop_oldest(self, count: int) -> None:
+        count = min(count, self._size)
+        self._head = (self._head + count) % self.allocated
+        self._size -= count
+
+    def extend(self, batch: np.ndarray) -> None:
+        if len(batch) >= self.capacity:
+            batch = batch[-self.capacity:]
+            if self.allocated < self.capacity:
+                self.columns = self._allocate(self.capacity)
+            for name, column in self.columns.items():
+                column[:] = batch[name]
+            self._head = 0
+            self._size = self.capacity
+            return
+
+        self._reserve(self._size + len(batch))
+        self.drop_oldest(self.overflow(len(batch)))
+
+        allocated = self.allocated
+        start = (self._head + self._size) % allocated
+        first = min(len(batch), allocated - start)
+        for name, column in self.columns.items():
+            values = batch[name]
+            column[start:start + first] = values[:first]
+            column[:len(batch) - first] = values[first:]
+        self._size += len(batch)
+
+    def insert(self, row: int, batch: np.ndarray) -> None:
+        if row >= self._size:
+            self.extend(batch)
+            return
+        if not len(batch):
+            return
+
+        self._reserve(self._size + len(batch))
+        allocated = self.allocated
+        tail = (self._head + np.arange(row, self._size)) % allocated
+        shifted = (tail + len(batch)) % allocated
+        inserted = (self._head + np.arange(row, row + len(batch))) % allocated
+        for name, column in self.columns.items():
+            column[shifted] = column[tail]
+            column[inserted] = batch[name]
+        self._size += len(batch)
+
+    def merge_runs(self, batch: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+        batch = batch[np.argsort(batch["counter"], kind="stable")]
+        positions = np.searchsorted(self.ordered("counter"), batch["counter"], side="right")
+        starts = np.flatnonzero(np.diff(positions, prepend=-1))
+        stops = np.append(starts[1:], len(batch))
+        return [(int(positions[start]), batch[start:stop]) for start, stop in zip(starts[::-1], stops[::-1])]
+
+    def merge_overflow(self, row: int, count: int) -> Tuple[int, int]:
+        excess = max(0, self._size + count - self.capacity)
+        dropped = min(excess, row)
+        return dropped, excess - dropped
+
+    def merge(self, batch: np.ndarray) -> None:
+        shift = 0
+        for row, rows in self.merge_runs(batch):
+            row = max(0, row - shift)
+            dropped, skipped = self.merge_overflow(row, len(rows))
+            self.drop_oldest(dropped)
+            shift += dropped
+            self.insert(row - dropped, rows[skipped:])
+
+    def index(self, row: int) -> int:
+        return (self._head + row) % self.allocated
+
+    def value(self, row: int, name: str):
+        return self.columns[name][self.index(row)]
+
+    def ordered(self, name: str) -> np.ndarray:
+        return self.columns[name][(self._head + np.arange(self._size)) % self.allocated]
+
+    def snapshot(self) -> np.ndarray:
+        result = np.empty(self._size, dtype=PACKET_DTYPE)
+        order = (self._head + np.arange(self._size)) % self.allocated
+        for name, column in self.columns.items():
+            result[name] = column[order]
+        return result
@@ -0,0 +1,208 @@
+from typing import Optional
+
+import numpy as np
+from PySide6.QtCharts import QChart, QChartView, QDateTimeAxis, QLineSeries, QValueAxis
+from PySide6.QtCore import QDateTime, Qt
+from PySide6.QtGui import QColor, QPainter, QPen
+
+from config import Config
+from decimation import Envelope, MinMaxPyramid, StreamingDecimator, envelope_to_polyline
+
+
+class PayloadChartView(QChartView):
+    def __init__(self, parent=None, title: str = ""):
+        super().__init__(parent)
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+        chart = QChart()
+        chart.setTitle(title)
+        chart.legend().setVisible(False)
+        chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+
+        self.envelope_series = QLineSeries()
+        self.envelope_series.setPen(QPen(QColor(120, 160, 220), 1))
+        self.mean_series = QLineSeries()
+        self.mean_series.setPen(QPen(QColor(20, 60, 140), 1))
+        chart.addSeries(self.envelope_series)
+        chart.addSeries(self.mean_series)
+
+        self.axis_x = QDateTimeAxis()
+        self.axis_x.setFormat("HH:mm:ss")
+        self.axis_y = QValueAxis()
+        self.axis_y.setTitleText("Значение")
+        chart.addAxis(self.axis_x, Qt.AlignmentFlag.AlignBottom)
+        chart.addAxis(self.axis_y, Qt.AlignmentFlag.AlignLeft)
+        for series in (self.envelope_series, self.mean_series):
+            series.attachAxis(self.axis_x)
+            series.attachAxis(self.axis_y)
+
+        self.setChart(chart)
+
+    def plot_width(self) -> int:
+        return max(1, int(self.chart().plotArea().width()))
+
+    def _show_envelope(self, envelope: Envelope, x_from: float, x_to: float) -> None:
+        x, low, high, mean = envelope
+        line_x, line_y = envelope_to_polyline(x * 1000.0, low, high)
+        self.envelope_series.replaceNp(line_x, line_y)
+        self.mean_series.replaceNp(x * 1000.0, np.ascontiguousarray(mean, dtype=np.float64))
+
+        self.axis_x.setRange(
+            QDateTime.fromMSecsSinceEpoch(int(x_from * 1000)),
+            QDateTime.fromMSecsSinceEpoch(int(x_to * 1000))
+        )
+        if len(x):
+            low_value, high_value = float(low.min()), float(high.max())
+            margin = (high_value - low_value) * 0.05 or 1.0
+            self.axis_y.setRange(low_value - margin, high_value + margin)
+
+
+class LivePayloadChart(PayloadChartView):
+    def __init__(self, parent=None):
+        super().__init__(parent, "Полезная нагрузка (текущая сессия)")
+        self.decimator = StreamingDecimator(Config.LIVE_CHART_WINDOW_SECONDS, Config.LIVE_CHART_BUCKETS)
+        self._dirty = False
+
+    def set_decimator(self, decimator: StreamingDecimator) -> None:
+        self.decimator = decimator
+        self._dirty = True
+        self.redraw()
+
+    def clear(self) -> None:
+        self.decimator.clear()
+        self._dirty = True
+        self.redraw()
+
+    def append_batch(self, batch: np.ndarray) -> None:
+        self.decimator.add(batch["timestamp"], batch["payload"])
+        self._dirty = True
+        if self.isVisible():
+            self.redraw()
+
+    def redraw(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        envelope = self.decimator.envelope(self.plot_width())
+        x_to = envelope[0][-1] if len(envelope[0]) else 0.0
+        self._show_envelope(envelope, x_to - Config.LIVE_CHART_WINDOW_SECONDS, x_to)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.redraw()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._dirty = True
+        if self.isVisible():
+            self.redraw()
+
+
+class HistoryPayloadChart(PayloadChartView):
+    ZOOM_STEP = 1.25
+
+    def __init__(self, parent=None):
+        super().__init__(parent, "Полезная нагрузка (история)")
+        self.pyramid: Optional[MinMaxPyramid] = None
+        self.view_from = 0.0
+        self.view_to = 0.0
+        self._drag_x: Optional[float] = None
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+    def set_data(self, timestamps: np.ndarray, payloads: np.ndarray, keep_view: bool = False) -> None:
+        valid = ~np.isnan(timestamps)
+        zoomed = keep_view and self.pyramid is not None and (self.view_from, self.view_to) != self.pyramid.x_range
+        self.pyramid = MinMaxPyramid(timestamps[valid], payloads[valid])
+        if zoomed:
+            self.redraw()
+        else:
+            self.reset_zoom()
+
+    def show_overview(self, envelope: Envelope, x_from: float, x_to: float) -> None:
+        if self.pyramid is None:
+            self._show_envelope(envelope, x_from, x_to)
+
+    def clear(self) -> None:
+        self.pyramid = None
+        self.envelope_series.clear()
+        self.mean_series.clear()
+
+    def reset_zoom(self) -> None:
+        if self.pyramid is None:
+            return
+        self.view_from, self.view_to = self.pyramid.x_range
+        self.redraw()
+
+    def zoom(self, factor: float, anchor: float) -> None:
+        if self.pyramid is None:
+            return
+
+        data_from, data_to = self.pyramid.x_range
+        span = max((self.view_to - self.view_from) * factor, 1.0)
+        span = min(span, max(data_to - data_from, 1.0))
+        ratio = (anchor - self.view_from) / max(self.view_to - self.view_from, 1e-9)
+        self.view_from = anchor - span * ratio
+        self.view_to = self.view_from + span
+        self.pan(0.0)
+
+    def pan(self, fraction: float) -> None:
+        if self.pyramid is None:
+            return
+
+        data_from, data_to = self.pyramid.x_range
+        span = self.view_to - self.view_from
+        shift = span * fraction
+        self.view_from = min(max(self.view_from + shift, data_from), max(data_to - span, data_from))
+        self.view_to = self.view_from + span
+        self.redraw()
+
+    def redraw(self) -> None:
+        if self.pyramid is None:
+            return
+        envelope = self.pyramid.query(self.view_from, self.view_to, self.plot_width())
+        self._show_envelope(envelope, self.view_from, self.view_to)
+
+    def _anchor_at(self, x_position: float) -> float:
+        plot = self.chart().plotArea()
+        ratio = (x_position - plot.left()) / max(plot.width(), 1.0)
+        ratio = min(max(ratio, 0.0), 1.0)
+        return self.view_from + (self.view_to - self.view_from) * ratio
+
+    def wheelEvent(self, event) -> None:
+        factor = 1 / self.ZOOM_STEP if event.angleDelta().y() > 0 else self.ZOOM_STEP
+        self.zoom(factor, self._anchor_at(event.position().x()))
+        event.accept()
+
+    def keyPressEvent(self, event) -> None:
+        if event.key() == Qt.Key.Key_Left:
+            self.pan(-0.25)
+        elif event.key() == Qt.Key.Key_Right:
+            self.pan(0.25)
+        elif event.key() == Qt.Key.Key_Home:
+            self.reset_zoom()
+        else:
+            super().keyPressEvent(event)
+
+    def mousePressEvent(self, event) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_x = event.position().x()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event) -> None:
+        if self._drag_x is not None and event.buttons() & Qt.MouseButton.LeftButton:
+            shift = self._drag_x - event.position().x()
+            self._drag_x = event.position().x()
+            self.pan(shift / max(self.chart().plotArea().width(), 1.0))
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event) -> None:
+        self._drag_x = None
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event) -> None:
+        self.reset_zoom()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self.redraw()
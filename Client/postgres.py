@@ -1,82 +1,408 @@
 import logging
-from typing import Dict, Any, List
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Iterator, Callable, Optional, Sequence, Set, Tuple, IO
 
+import numpy as np
 import psycopg2
+import psycopg2.extensions
+from psycopg2.pool import ThreadedConnectionPool
 
-from row_models import Session, TelemetryPacket
+from decimation import Envelope, empty_envelope
+from metrics import DB_QUERY_ERRORS, DB_QUERY_SECONDS
+from row_models import STATUS_NEGATIVE_VALUE, STATUS_OK, PacketFilter, Session, SessionSummary, rows_to_batch
+
+
+PREPARED_STATEMENTS = {
+    "ping": "SELECT 1",
+    "session_page_first": """
+        SELECT "Id", "Name", "StartTime", "EndTime"
+        FROM public."Sessions"
+        ORDER BY "Id" DESC
+        LIMIT $1
+        """,
+    "session_page_next": """
+        SELECT "Id", "Name", "StartTime", "EndTime"
+        FROM public."Sessions"
+        WHERE "Id" < $1
+        ORDER BY "Id" DESC
+        LIMIT $2
+        """,
+    "session_updates": """
+        SELECT "Id", "Name", "StartTime", "EndTime"
+        FROM public."Sessions"
+        WHERE "Id" > $1 OR "Id" = ANY($2::bigint[])
+        ORDER BY "Id" DESC
+        """,
+    "packet_page_first": """
+        SELECT "Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId"
+        FROM public."Packets"
+        WHERE "SessionId" = $1
+        ORDER BY "Timestamp", "Id"
+        LIMIT $2
+        """,
+    "packet_page_next": """
+        SELECT "Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId"
+        FROM public."Packets"
+        WHERE "SessionId" = $1 AND ("Timestamp", "Id") > ($2, $3)
+        ORDER BY "Timestamp", "Id"
+        LIMIT $4
+        """,
+    "packet_tail": """
+        SELECT "Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId"
+        FROM public."Packets"
+        WHERE "SessionId" = $1 AND "Id" > $2
+        ORDER BY "Id"
+        LIMIT $3
+        """,
+    "session_summary": """
+        WITH steps AS (
+            SELECT "Timestamp", "Payload",
+                   "PacketCounter" - LAG("PacketCounter") OVER (ORDER BY "PacketCounter") AS step
+            FROM public."Packets"
+            WHERE "SessionId" = $1
+        )
+        SELECT count(*), min("Payload"), max("Payload"), avg("Payload"),
+               count(*) FILTER (WHERE "Payload" < 0),
+               count(*) FILTER (WHERE step > 1),
+               coalesce(sum(step - 1) FILTER (WHERE step > 1), 0),
+               min("Timestamp"), max("Timestamp")
+        FROM steps
+        """,
+    "packet_buckets": """
+        SELECT least(width_bucket("Timestamp", $2, $3, $4), $4) AS bucket,
+               min("Timestamp"), min("Payload"), max("Payload"), avg("Payload"), count(*)
+        FROM public."Packets"
+        WHERE "SessionId" = $1 AND "Timestamp" BETWEEN $2 AND $3
+        GROUP BY bucket
+        ORDER BY bucket
+        """,
+}
+
+CONNECTION_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+FILTER_COLUMNS = (
+    ("Timestamp", "time_from", "time_to"),
+    ("Payload", "payload_min", "payload_max"),
+    ("PacketCounter", "counter_from", "counter_to"),
+)
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.autocommit = True
+        self.prepared: Set[str] = set()
+
+
+class CopyOutput:
+    def __init__(self, out: IO):
+        self.out = out
+        self.written = 0
+
+    def write(self, data: bytes) -> None:
+        self.written += len(data)
+        self.out.write(data)
 
 
 class PostgresManager:
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], min_connections: int = 1, max_connections: int = 8):
         config["client_encoding"] = "utf-8"
-        self.conn = psycopg2.connect(**config)
-        self.conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
-        self.cursor = self.conn.cursor()
+        self.config = config
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.pool: Optional[ThreadedConnectionPool] = None
+        self.is_connected = False
+        self._pool_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def connect(self) -> None:
+        with self._pool_lock:
+            if self.pool is None:
+                started = time.perf_counter()
+                self.pool = ThreadedConnectionPool(
+                    self.min_connections,
+                    self.max_connections,
+                    connection_factory=PooledConnection,
+                    **self.config
+                )
+                self.is_connected = True
+                DB_QUERY_SECONDS.observe(time.perf_counter() - started, method="connect")
+                return
+        self._run(lambda conn: self._execute_prepared(conn, "ping"), "connect")
+
+    @contextmanager
+    def _connection(self) -> Iterator[PooledConnection]:
+        if self.pool is None:
+            self.connect()
+        pool = self.pool
+        with self._slots:
+            conn = pool.getconn()
+            if conn.closed or conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+
+            broken = False
+            try:
+                yield conn
+            except CONNECTION_ERRORS:
+                broken = True
+                raise
+            finally:
+                pool.putconn(conn, close=broken or bool(conn.closed))
+
+    def _run(self, operation: Callable[[PooledConnection], Any], method: str,
+             can_retry: Callable[[], bool] = lambda: True) -> Any:
+        started = time.perf_counter()
+        for attempt in range(2):
+            try:
+                with self._connection() as conn:
+                    result = operation(conn)
+                self.is_connected = True
+                DB_QUERY_SECONDS.observe(time.perf_counter() - started, method=method)
+                return result
+            except CONNECTION_ERRORS as e:
+                if attempt or not can_retry():
+                    self.is_connected = False
+                    DB_QUERY_ERRORS.inc(method=method)
+                    raise
+                logging.warning(f"Соединение с БД потеряно, переподключение: {e}")
+            except Exception:
+                DB_QUERY_ERRORS.inc(method=method)
+                raise
+
+    @staticmethod
+    def _execute_prepared(conn: PooledConnection, name: str, params: Sequence = ()) -> List[tuple]:
+        with conn.cursor() as cursor:
+            if name not in conn.prepared:
+                cursor.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+                conn.prepared.add(name)
+
+            if params:
+                placeholders = ", ".join(["%s"] * len(params))
+                cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+            else:
+                cursor.execute(f"EXECUTE {name}")
+            return cursor.fetchall()
 
-    def get_sessions(self) -> List[Session]:
+    @staticmethod
+    def _rows_to_sessions(rows: List[tuple]) -> List[Session]:
+        sessions = []
+        for row in rows:
+            try:
+                sessions.append(Session(
+                    id=row[0],
+                    name=row[1],
+                    start_time=row[2].timestamp() if row[2] else None,
+                    end_time=row[3].timestamp() if row[3] else None
+                ))
+            except Exception as e:
+                print(f"Ошибка обработки сессии: {str(e)}")
+        return sessions
+
+    def get_sessions(self, before_id: Optional[int] = None, limit: int = 200) -> List[Session]:
         try:
-            self.cursor.execute("""
-                SELECT "Id", "Name", "StartTime", "EndTime"
-                FROM public."Sessions"
-                ORDER BY "StartTime" DESC
-                """)
-            sessions = []
-            for row in self.cursor.fetchall():
-                try:
-                    sessions.append(Session(
-                        id=row[0],
-                        name=row[1],
-                        start_time=row[2].timestamp() if row[2] else None,
-                        end_time=row[3].timestamp() if row[3] else None
-                    ))
-                except Exception as e:
-                    print(f"Ошибка обработки сессии: {str(e)}")
-            return sessions
+            if before_id is None:
+                rows = self._run(lambda conn: self._execute_prepared(conn, "session_page_first", (limit,)),
+                                 "get_sessions")
+            else:
+                rows = self._run(lambda conn: self._execute_prepared(conn, "session_page_next", (before_id, limit)),
+                                 "get_sessions")
+            return self._rows_to_sessions(rows)
         except Exception as e:
             print(f"Ошибка БД в get_sessions: {str(e)}")
             return []
 
-    def get_session_packets(self, session_id: int) -> List[TelemetryPacket]:
+    def get_session_updates(self, after_id: int, session_ids: List[int]) -> List[Session]:
+        try:
+            rows = self._run(lambda conn: self._execute_prepared(
+                conn, "session_updates", (after_id, list(session_ids))), "get_session_updates")
+            return self._rows_to_sessions(rows)
+        except Exception as e:
+            print(f"Ошибка БД в get_session_updates: {str(e)}")
+            return []
+
+    def iter_session_packets(self, session_id: int, page_size: int = 20000,
+                             first_page_size: int = 500) -> Iterator[np.ndarray]:
+        if session_id is None:
+            raise ValueError("Session ID не может быть None")
+
+        limit = first_page_size
+        last_key: Optional[tuple] = None
+        while True:
+            if last_key is None:
+                rows = self._run(lambda conn: self._execute_prepared(
+                    conn, "packet_page_first", (session_id, limit)), "iter_session_packets")
+            else:
+                rows = self._run(lambda conn: self._execute_prepared(
+                    conn, "packet_page_next", (session_id, last_key[0], last_key[1], limit)),
+                    "iter_session_packets")
+
+            if not rows:
+                return
+
+            yield rows_to_batch(rows)
+            if len(rows) < limit:
+                return
+
+            last_key = (rows[-1][2], rows[-1][0])
+            limit = page_size
+
+    @staticmethod
+    def _filter_conditions(packet_filter: PacketFilter) -> Tuple[List[str], List[Any]]:
+        conditions, params = [], []
+        for column, low_name, high_name in FILTER_COLUMNS:
+            low, high = getattr(packet_filter, low_name), getattr(packet_filter, high_name)
+            if low is not None:
+                conditions.append(f'"{column}" >= %s')
+                params.append(low)
+            if high is not None:
+                conditions.append(f'"{column}" <= %s')
+                params.append(high)
+
+        if packet_filter.status == STATUS_NEGATIVE_VALUE:
+            conditions.append('"Payload" < 0')
+        elif packet_filter.status == STATUS_OK:
+            conditions.append('"Payload" >= 0')
+        return conditions, params
+
+    def iter_filtered_packets(self, session_id: int, packet_filter: PacketFilter, page_size: int = 20000,
+                              first_page_size: int = 500) -> Iterator[np.ndarray]:
+        if session_id is None:
+            raise ValueError("Session ID не может быть None")
+        if packet_filter.is_empty():
+            yield from self.iter_session_packets(session_id, page_size, first_page_size)
+            return
+
+        conditions, params = self._filter_conditions(packet_filter)
+        where = " AND ".join(['"SessionId" = %s'] + conditions)
+
+        def fetch(conn: PooledConnection, last_key: Optional[tuple], limit: int) -> List[tuple]:
+            keyset = ' AND ("Timestamp", "Id") > (%s, %s)' if last_key is not None else ""
+            with conn.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT "Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId"
+                    FROM public."Packets"
+                    WHERE {where}{keyset}
+                    ORDER BY "Timestamp", "Id"
+                    LIMIT %s
+                    """, [session_id, *params, *(last_key or ()), limit])
+                return cursor.fetchall()
+
+        limit = first_page_size
+        last_key: Optional[tuple] = None
+        while True:
+            rows = self._run(lambda conn: fetch(conn, last_key, limit), "iter_filtered_packets")
+            if not rows:
+                return
+
+            batch = rows_to_batch(rows)
+            if packet_filter.status is not None:
+                batch = batch[batch["status"] == packet_filter.status]
+            if len(batch):
+                yield batch
+            if len(rows) < limit:
+                return
+
+            last_key = (rows[-1][2], rows[-1][0])
+            limit = page_size
+
+    def get_packets_after(self, session_id: int, after_id: int, packet_filter: PacketFilter = PacketFilter(),
+                          limit: int = 5000) -> Tuple[np.ndarray, int]:
+        if session_id is None:
+            raise ValueError("Session ID не может быть None")
+
+        def fetch(conn: PooledConnection) -> List[tuple]:
+            if packet_filter.is_empty():
+                return self._execute_prepared(conn, "packet_tail", (session_id, after_id, limit))
+
+            conditions, params = self._filter_conditions(packet_filter)
+            where = " AND ".join(['"SessionId" = %s', '"Id" > %s'] + conditions)
+            with conn.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT "Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId"
+                    FROM public."Packets"
+                    WHERE {where}
+                    ORDER BY "Id"
+                    LIMIT %s
+                    """, [session_id, after_id, *params, limit])
+                return cursor.fetchall()
+
+        batch = rows_to_batch(self._run(fetch, "get_packets_after"))
+        last_id = int(batch["id"][-1]) if len(batch) else after_id
+        if packet_filter.status is not None:
+            batch = batch[batch["status"] == packet_filter.status]
+        return batch, last_id
+
+    def get_session_summary(self, session_id: int) -> Optional[SessionSummary]:
         if session_id is None:
             raise ValueError("Session ID не может быть None")
 
         try:
-            self.cursor.execute("""
-                SELECT "Packets"."Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId" 
-                FROM public."Packets"
-                WHERE "SessionId" = %s 
-                ORDER BY "Timestamp"
-                """, (session_id,))
-            packets = []
-            for row in self.cursor.fetchall():
-                try:
-                    packets.append(TelemetryPacket(
-                        id=row[0],
-                        counter=row[1],
-                        timestamp=row[2],
-                        payload=row[3],
-                        crc16=row[4],
-                        session_id=row[5],
-                        status='OK'
-                    ))
-                except Exception as e:
-                    print(f"Ошибка обработки пакета: {str(e)}")
-            return packets
+            rows = self._run(lambda conn: self._execute_prepared(conn, "session_summary", (session_id,)),
+                             "get_session_summary")
+            count, payload_min, payload_max, payload_mean, negative, gaps, missing, first, last = rows[0]
+            return SessionSummary(
+                session_id=session_id,
+                packet_count=count,
+                payload_min=payload_min,
+                payload_max=payload_max,
+                payload_mean=payload_mean,
+                negative_count=negative,
+                counter_gaps=gaps,
+                missing_packets=int(missing),
+                first_timestamp=first,
+                last_timestamp=last
+            )
         except Exception as e:
-            print(f"Ошибка БД get_session_packets: {str(e)}")
-            return []
+            print(f"Ошибка БД get_session_summary: {str(e)}")
+            return None
+
+    def get_session_buckets(self, session_id: int, time_from: float, time_to: float, buckets: int) -> Envelope:
+        if session_id is None:
+            raise ValueError("Session ID не может быть None")
+        if buckets < 1 or time_to <= time_from:
+            return empty_envelope()
 
-    def close(self):
         try:
-            if hasattr(self, 'cursor') and self.cursor:
-                print("Соединение с БД закрыто")
-                self.cursor.close()
+            rows = self._run(lambda conn: self._execute_prepared(
+                conn, "packet_buckets", (session_id, time_from, time_to, buckets)), "get_session_buckets")
+            if not rows:
+                return empty_envelope()
+
+            columns = np.array([row[1:5] for row in rows], dtype=np.float64)
+            return columns[:, 0], columns[:, 1], columns[:, 2], columns[:, 3]
         except Exception as e:
-            logging.error(f"Ошибка закрытия курсора: {e}")
+            print(f"Ошибка БД get_session_buckets: {str(e)}")
+            return empty_envelope()
+
+    def copy_session_packets(self, out: IO, session_id: int, binary: bool = False,
+                             time_from: Optional[float] = None, time_to: Optional[float] = None) -> None:
+        if session_id is None:
+            raise ValueError("Session ID не может быть None")
+
+        output = CopyOutput(out)
+
+        def copy(conn: PooledConnection) -> None:
+            with conn.cursor() as cursor:
+                query = cursor.mogrify("""
+                    SELECT "Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId"
+                    FROM public."Packets"
+                    WHERE "SessionId" = %s
+                      AND (%s IS NULL OR "Timestamp" >= %s)
+                      AND (%s IS NULL OR "Timestamp" <= %s)
+                    ORDER BY "Timestamp", "Id"
+                    """, (session_id, time_from, time_from, time_to, time_to)).decode()
+                copy_format = "FORMAT binary" if binary else "FORMAT csv, HEADER"
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH ({copy_format})", output)
 
+        self._run(copy, "copy_session_packets", can_retry=lambda: not output.written)
+
+    def close(self):
         try:
-            if hasattr(self, 'conn') and self.conn:
-                if not self.conn.closed:
-                    self.conn.close()
+            if self.pool is not None and not self.pool.closed:
+                self.pool.closeall()
+                print("Соединение с БД закрыто")
         except Exception as e:
-            logging.error(f"Ошибка закрытия соединения: {e}")
+            logging.error(f"Ошибка закрытия пула соединений: {e}")
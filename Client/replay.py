@@ -0,0 +1,193 @@
+import logging
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from capture import CaptureReader
+from postgres import PostgresManager
+from row_models import PacketFilter, SessionSummary, records_to_batch
+
+
+ReplayBatch = Tuple[np.ndarray, np.ndarray]
+
+
+class CaptureReplaySource:
+    def __init__(self, path: str):
+        self.reader = CaptureReader(path)
+        self.label = path
+        self.start_time = self.reader.start_time or 0.0
+        self.duration = self.reader.duration
+        self.packet_count = self.reader.packet_count
+
+    def batches(self, offset: float) -> Iterator[ReplayBatch]:
+        for records in self.reader.read_from(offset):
+            yield records["arrival"], records_to_batch(records)
+
+    def close(self) -> None:
+        self.reader.close()
+
+
+class DatabaseReplaySource:
+    def __init__(self, db: PostgresManager, summary: SessionSummary, page_size: int = 20000):
+        self.db = db
+        self.session_id = summary.session_id
+        self.label = f"сессия {summary.session_id}"
+        self.start_time = summary.first_timestamp or 0.0
+        self.duration = summary.duration
+        self.packet_count = summary.packet_count
+        self.page_size = page_size
+
+    def batches(self, offset: float) -> Iterator[ReplayBatch]:
+        packet_filter = PacketFilter(time_from=self.start_time + offset) if offset > 0 else PacketFilter()
+        for batch in self.db.iter_filtered_packets(self.session_id, packet_filter, self.page_size, self.page_size):
+            yield batch["timestamp"], batch
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayEngine:
+    def __init__(self, source, sink: Callable[[np.ndarray, np.ndarray], None],
+                 on_sessions: Optional[Callable[[List[int]], None]], backlog: Callable[[], int],
+                 speed: float = 1.0, batch_size: int = 5000, max_backlog: int = 32, tick: float = 0.02,
+                 on_seek: Optional[Callable[[float], None]] = None):
+        self.source = source
+        self.sink = sink
+        self.on_sessions = on_sessions
+        self.on_seek = on_seek
+        self.backlog = backlog
+        self.batch_size = batch_size
+        self.max_backlog = max_backlog
+        self.tick = tick
+        self.position = 0.0
+        self.packets_sent = 0
+        self.finished = False
+        self.error: Optional[str] = None
+
+        self._speed = speed
+        self._seek_to: Optional[float] = 0.0
+        self._rebase = False
+        self._sessions: Set[int] = set()
+        self._running = threading.Event()
+        self._running.set()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="replay", daemon=True)
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def set_speed(self, speed: float) -> None:
+        with self._lock:
+            self._speed = speed
+            self._rebase = True
+
+    def pause(self) -> None:
+        self._running.clear()
+
+    def resume(self) -> None:
+        with self._lock:
+            self._rebase = True
+        self._running.set()
+
+    def seek(self, offset: float) -> None:
+        with self._lock:
+            self._seek_to = min(max(0.0, offset), self.source.duration)
+            self._rebase = True
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._running.set()
+        self._wake.set()
+        if self._thread.ident is None:
+            self.source.close()
+
+    def join(self, timeout: float = 2.0) -> bool:
+        if self._thread.ident is not None:
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _take_seek(self) -> Optional[float]:
+        with self._lock:
+            offset, self._seek_to = self._seek_to, None
+            return offset
+
+    def _run(self) -> None:
+        try:
+            while not self._stopping:
+                offset = self._take_seek()
+                if offset is None:
+                    self.finished = True
+                    self._wake.wait(self.tick * 5)
+                    self._wake.clear()
+                    continue
+
+                self.finished = False
+                if self.on_seek is not None:
+                    self.on_seek(offset)
+                self._play_from(offset)
+        except Exception as e:
+            self.error = str(e)
+            logging.getLogger(__name__).error(f"Ошибка воспроизведения {self.source.label}: {e}")
+            self.finished = True
+        finally:
+            self.source.close()
+
+    def _play_from(self, offset: float) -> None:
+        self.position = offset
+        wall_base = time.monotonic()
+        replay_base = self.source.start_time + offset
+
+        for times, batch in self.source.batches(offset):
+            self._announce_sessions(batch)
+            position = 0
+            while position < len(batch):
+                if self._stopping or self._seek_to is not None:
+                    return
+                if not self._running.is_set():
+                    self._running.wait(self.tick * 5)
+                    continue
+                if self._rebase:
+                    with self._lock:
+                        self._rebase = False
+                    wall_base = time.monotonic()
+                    replay_base = self.source.start_time + self.position
+                if self.backlog() >= self.max_backlog:
+                    time.sleep(self.tick / 4)
+                    continue
+
+                end = min(len(batch), position + self.batch_size)
+                speed = self._speed
+                if speed > 0:
+                    now = replay_base + (time.monotonic() - wall_base) * speed
+                    end = min(end, int(np.searchsorted(times, now, side="right")))
+                    if end <= position:
+                        delay = (times[position] - replay_base) / speed - (time.monotonic() - wall_base)
+                        time.sleep(min(max(delay, 0.0), self.tick))
+                        continue
+
+                self.sink(batch[position:end], times[position:end])
+                self.packets_sent += end - position
+                self.position = float(times[end - 1]) - self.source.start_time
+                position = end
+
+        self.position = self.source.duration
+
+    def _announce_sessions(self, batch: np.ndarray) -> None:
+        session_ids = set(np.unique(batch["session_id"]).tolist()) - self._sessions
+        if session_ids:
+            self._sessions |= session_ids
+            if self.on_sessions is not None:
+                self.on_sessions(sorted(session_ids))
@@ -1,17 +1,52 @@
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional, Iterable, List, Tuple, Union
 
+import numpy as np
 
-@dataclass
-class TelemetryPacket:
+from checksum import compute_crc16, compute_crc16_batch
+from time_format import format_timestamp
+
+
+STATUS_OK = 0
+STATUS_NEGATIVE_VALUE = 1
+STATUS_CRC_MISMATCH = 2
+
+STATUS_NAMES = {
+    STATUS_OK: "OK",
+    STATUS_NEGATIVE_VALUE: "NegativeValue",
+    STATUS_CRC_MISMATCH: "CrcMismatch",
+}
+STATUS_CODES = {name: code for code, name in STATUS_NAMES.items()}
+
+PACKET_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("counter", np.int32),
+    ("timestamp", np.float64),
+    ("payload", np.float64),
+    ("crc16", np.uint16),
+    ("session_id", np.int64),
+    ("status", np.uint8),
+])
+
+ROW_FIELDS = ("id", "counter", "timestamp", "payload", "crc16", "session_id")
+ROW_DTYPE = np.dtype([(name, PACKET_DTYPE[name]) for name in ROW_FIELDS])
+
+
+class TelemetryPacket(NamedTuple):
     id: int
     counter: int
     timestamp: float
     payload: float
     crc16: int
-    session_id: Optional[int] = None
-    status: str = "OK"
+    session_id: int = 0
+
+    @property
+    def status(self) -> str:
+        return packet_status(self)
+
+    @property
+    def formatted_time(self) -> str:
+        return format_timestamp(self.timestamp)
 
 
 @dataclass
@@ -24,10 +59,132 @@ class Session:
 
     @property
     def formatted_start_time(self):
-        return datetime.fromtimestamp(self.start_time).strftime('%Y-%m-%d %H:%M:%S')
+        return format_timestamp(self.start_time)
 
     @property
     def formatted_end_time(self):
         if self.end_time:
-            return datetime.fromtimestamp(self.end_time).strftime('%Y-%m-%d %H:%M:%S')
+            return format_timestamp(self.end_time)
         return "В процессе"
+
+
+@dataclass
+class SessionSummary:
+    session_id: int
+    packet_count: int
+    payload_min: Optional[float] = None
+    payload_max: Optional[float] = None
+    payload_mean: Optional[float] = None
+    negative_count: int = 0
+    counter_gaps: int = 0
+    missing_packets: int = 0
+    first_timestamp: Optional[float] = None
+    last_timestamp: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        if self.first_timestamp is None or self.last_timestamp is None:
+            return 0.0
+        return self.last_timestamp - self.first_timestamp
+
+
+@dataclass(frozen=True)
+class PacketFilter:
+    time_from: Optional[float] = None
+    time_to: Optional[float] = None
+    payload_min: Optional[float] = None
+    payload_max: Optional[float] = None
+    status: Optional[int] = None
+    counter_from: Optional[int] = None
+    counter_to: Optional[int] = None
+
+    def is_empty(self) -> bool:
+        return self == PacketFilter()
+
+    def mask(self, batch: np.ndarray) -> np.ndarray:
+        mask = np.ones(len(batch), dtype=bool)
+        for column, low, high in (
+            ("timestamp", self.time_from, self.time_to),
+            ("payload", self.payload_min, self.payload_max),
+            ("counter", self.counter_from, self.counter_to),
+        ):
+            if low is not None:
+                mask &= batch[column] >= low
+            if high is not None:
+                mask &= batch[column] <= high
+        if self.status is not None:
+            mask &= batch["status"] == self.status
+        return mask
+
+    def apply(self, batch: np.ndarray) -> np.ndarray:
+        return batch if self.is_empty() else batch[self.mask(batch)]
+
+
+def packet_status(packet: TelemetryPacket) -> str:
+    if not np.isnan(packet.timestamp) and \
+            compute_crc16(packet.payload, packet.counter, packet.timestamp) != packet.crc16:
+        return "CrcMismatch"
+    return "NegativeValue" if packet.payload < 0 else "OK"
+
+
+def make_packet(packet_id, counter, timestamp, payload, crc16, session_id) -> TelemetryPacket:
+    return TelemetryPacket(
+        packet_id or 0,
+        counter or 0,
+        np.nan if timestamp is None else timestamp,
+        payload or 0.0,
+        crc16 or 0,
+        session_id or 0
+    )
+
+
+def packet_from_hub(values: dict) -> TelemetryPacket:
+    return make_packet(
+        values.get("Id"),
+        values.get("PacketCounter"),
+        values.get("Timestamp"),
+        values.get("Payload"),
+        values.get("Crc16"),
+        values.get("SessionId")
+    )
+
+
+def rows_to_batch(rows: List[Tuple]) -> np.ndarray:
+    return records_to_batch(np.array(rows, dtype=ROW_DTYPE))
+
+
+def records_to_batch(records: np.ndarray) -> np.ndarray:
+    batch = np.empty(len(records), dtype=PACKET_DTYPE)
+    for name in ROW_FIELDS:
+        batch[name] = records[name]
+    batch["status"] = np.where(records["payload"] < 0, STATUS_NEGATIVE_VALUE, STATUS_OK)
+
+    expected_crc = compute_crc16_batch(records["payload"], records["counter"], records["timestamp"])
+    batch["status"][expected_crc != records["crc16"]] = STATUS_CRC_MISMATCH
+    return batch
+
+
+def packets_to_batch(packets: Iterable[TelemetryPacket]) -> np.ndarray:
+    if not isinstance(packets, list):
+        packets = list(packets)
+    if not packets:
+        return np.empty(0, dtype=PACKET_DTYPE)
+    return rows_to_batch(packets)
+
+
+def queued_to_batch(items: List[Union[TelemetryPacket, np.ndarray]]) -> np.ndarray:
+    parts = []
+    run: List[TelemetryPacket] = []
+    for item in items:
+        if isinstance(item, np.ndarray):
+            if run:
+                parts.append(packets_to_batch(run))
+                run = []
+            parts.append(item)
+        else:
+            run.append(item)
+    if run:
+        parts.append(packets_to_batch(run))
+    if len(parts) == 1:
+        return parts[0]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=PACKET_DTYPE)
@@ -0,0 +1,164 @@
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class SequenceStats:
+    received: int = 0
+    expected: int = 0
+    missing: int = 0
+    duplicates: int = 0
+    reordered: int = 0
+    backfilled: int = 0
+    gap_count: int = 0
+    jitter: float = 0.0
+
+    @property
+    def loss_percent(self) -> float:
+        return 100.0 * self.missing / self.expected if self.expected else 0.0
+
+
+class SequenceTracker:
+    JITTER_GAIN = 1 / 16
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self.first: Optional[int] = None
+        self.next_expected: Optional[int] = None
+        self.received = 0
+        self.duplicates = 0
+        self.reordered = 0
+        self.backfilled = 0
+        self.missing = 0
+        self.jitter = 0.0
+        self.gap_starts: List[int] = []
+        self.gap_ends: List[int] = []
+        self._last_transit: Optional[float] = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def _accept(self, counter: int) -> Optional[bool]:
+        if self.next_expected is None:
+            self.first = counter
+            self.next_expected = counter + 1
+        elif counter == self.next_expected:
+            self.next_expected += 1
+        elif counter > self.next_expected:
+            self.gap_starts.append(self.next_expected)
+            self.gap_ends.append(counter - 1)
+            self.missing += counter - self.next_expected
+            self.next_expected = counter + 1
+        elif self._fill_gap(counter):
+            return False
+        else:
+            return None
+        return True
+
+    def add(self, counter: int, timestamp: Optional[float], arrival: float) -> bool:
+        with self._lock:
+            in_order = self._accept(counter)
+            if in_order is None:
+                self.duplicates += 1
+                return False
+
+            self.received += 1
+            if not in_order:
+                self.reordered += 1
+            if timestamp is not None:
+                self._update_jitter(arrival - timestamp)
+            return True
+
+    def backfill(self, counters: np.ndarray) -> np.ndarray:
+        with self._lock:
+            accepted = np.fromiter((self._accept(counter) is not None for counter in counters.tolist()),
+                                   dtype=bool, count=len(counters))
+            count = int(accepted.sum())
+            self.received += count
+            self.backfilled += count
+            return accepted
+
+    def add_batch(self, counters: np.ndarray, timestamps: np.ndarray, arrivals: np.ndarray) -> np.ndarray:
+        if not len(counters):
+            return np.zeros(0, dtype=bool)
+
+        with self._lock:
+            in_order = self.next_expected is None or counters[0] == self.next_expected
+            if not in_order or (len(counters) > 1 and not (np.diff(counters) == 1).all()):
+                sequential = False
+            else:
+                sequential = True
+                if self.next_expected is None:
+                    self.first = int(counters[0])
+                self.next_expected = int(counters[-1]) + 1
+                self.received += len(counters)
+                self._update_jitter_batch(arrivals - timestamps)
+
+        if sequential:
+            return np.ones(len(counters), dtype=bool)
+        return np.fromiter(
+            (self.add(counter, timestamp, arrival)
+             for counter, timestamp, arrival in zip(counters.tolist(), timestamps.tolist(), arrivals.tolist())),
+            dtype=bool, count=len(counters)
+        )
+
+    def _update_jitter_batch(self, transits: np.ndarray) -> None:
+        if self._last_transit is not None:
+            transits = np.concatenate(([self._last_transit], transits))
+        deltas = np.abs(np.diff(transits))
+        if len(deltas):
+            decay = 1 - self.JITTER_GAIN
+            weights = decay ** np.arange(len(deltas) - 1, -1, -1)
+            self.jitter = decay ** len(deltas) * self.jitter + self.JITTER_GAIN * float(weights @ deltas)
+        self._last_transit = float(transits[-1])
+
+    def _fill_gap(self, counter: int) -> bool:
+        position = bisect_right(self.gap_starts, counter) - 1
+        if position < 0 or counter > self.gap_ends[position]:
+            return False
+
+        start, end = self.gap_starts[position], self.gap_ends[position]
+        if start == end:
+            del self.gap_starts[position]
+            del self.gap_ends[position]
+        elif counter == start:
+            self.gap_starts[position] = counter + 1
+        elif counter == end:
+            self.gap_ends[position] = counter - 1
+        else:
+            self.gap_ends[position] = counter - 1
+            self.gap_starts.insert(position + 1, counter + 1)
+            self.gap_ends.insert(position + 1, end)
+        self.missing -= 1
+        return True
+
+    def _update_jitter(self, transit: float) -> None:
+        if self._last_transit is not None:
+            self.jitter += (abs(transit - self._last_transit) - self.jitter) * self.JITTER_GAIN
+        self._last_transit = transit
+
+    def gaps(self) -> List[Tuple[int, int]]:
+        with self._lock:
+            return list(zip(self.gap_starts, self.gap_ends))
+
+    def stats(self) -> SequenceStats:
+        with self._lock:
+            expected = self.next_expected - self.first if self.first is not None else 0
+            return SequenceStats(
+                received=self.received,
+                expected=expected,
+                missing=self.missing,
+                duplicates=self.duplicates,
+                reordered=self.reordered,
+                backfilled=self.backfilled,
+                gap_count=len(self.gap_starts),
+                jitter=self.jitter
+            )
@@ -1,21 +1,58 @@
-import json
-import requests
-from requests.adapters import HTTPAdapter
-from typing import Callable
+import asyncio
+import logging
+import aiohttp
+import msgpack
+from typing import Any, Callable, Optional
 from signalrcore.hub_connection_builder import HubConnectionBuilder
-from urllib3 import Retry
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.protocol.messagepack_protocol import MessagePackHubProtocol
+
+from metrics import REST_CALL_SECONDS
+from row_models import packet_from_hub
+
+
+class TelemetryMessagePackProtocol(MessagePackHubProtocol):
+    def parse_messages(self, raw):
+        messages = []
+        offset = 0
+        while offset < len(raw):
+            try:
+                length, offset = self._read_varint(raw, offset)
+            except IndexError:
+                logging.error("Обрезанный заголовок MessagePack сообщения, остаток кадра отброшен")
+                break
+            payload = raw[offset:offset + length]
+            offset += length
+
+            try:
+                message = self._decode_message(msgpack.unpackb(payload))
+                if isinstance(message, InvocationMessage) and message.target == "NewPacket":
+                    message.arguments = [packet_from_hub(argument) for argument in message.arguments]
+            except Exception as e:
+                logging.error(f"Ошибка разбора MessagePack сообщения, сообщение пропущено: {e}")
+                continue
+            messages.append(message)
+        return messages
+
+    @staticmethod
+    def _read_varint(raw, offset):
+        value = 0
+        shift = 0
+        while True:
+            byte = raw[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value, offset
+            shift += 7
 
 
 class SignalRClient:
-    def __init__(self, url: str):
+    def __init__(self, url: str, protocol: str = "json"):
         connection_builder = HubConnectionBuilder()
         connection_builder.with_url(url)
-        connection_builder.with_automatic_reconnect({
-            "type": "interval",
-            "keep_alive_interval": 10,
-            "reconnect_interval": 30,
-            "max_attempts": 3
-        })
+        if protocol == "messagepack":
+            connection_builder.with_hub_protocol(TelemetryMessagePackProtocol())
         self.connection = connection_builder.build()
 
     def connect(self):
@@ -37,49 +74,63 @@ class SignalRClient:
 
 
 class TelemetryApiClient:
-    def __init__(self, base_url):
+    CONNECT_ATTEMPTS = 3
+
+    def __init__(self, base_url: str, timeout: float = 10, stop_timeout: float = 2, max_connections: int = 4):
         self.base_url = base_url.rstrip('/')
-        self._session = self._create_session()
-
-    @classmethod
-    def _create_session(cls):
-        session = requests.Session()
-        retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        return session
-
-    def start_session(self, name):
-        response = self._session.post(
-            f"{self.base_url}/sessions/start",
-            json={"name": name},
-            timeout=10
-        )
-        response.raise_for_status()
-
-        data = response.json()
-        session_id = data.get('SessionId') or data.get('sessionId') or data.get('id')
-        response._content = json.dumps({'SessionId': session_id}).encode()
-        return response
-
-    def start_generation(self, session_id):
-        return self._session.post(
-            f"{self.base_url}/start",
-            json={"sessionId": session_id},
-            timeout=10
-        )
+        self.timeout = timeout
+        self.stop_timeout = stop_timeout
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
 
-    def stop_generation(self, session_id=None):
-        if session_id is None:
-            return self._session.post(
-                f"{self.base_url}/stop",
-                timeout=2
+    def _client(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30)
             )
+        return self._session
+
+    async def _post(self, call: str, path: str, error_message: str, payload: Any = None,
+                    timeout: Optional[float] = None) -> Any:
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        with REST_CALL_SECONDS.time(call=call):
+            for attempt in range(self.CONNECT_ATTEMPTS):
+                try:
+                    async with self._client().post(f"{self.base_url}{path}", json=payload,
+                                                   timeout=client_timeout) as response:
+                        if response.status != 200:
+                            logging.error(f"{error_message}, код статуса: {response.status}")
+                            raise RuntimeError(error_message)
+                        if response.content_type != "application/json":
+                            return None
+                        return await response.json()
+                except aiohttp.ClientConnectionError as e:
+                    if attempt == self.CONNECT_ATTEMPTS - 1:
+                        raise RuntimeError(f"{error_message}: {e}") from e
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                except asyncio.TimeoutError as e:
+                    raise RuntimeError(f"{error_message}: сервер не ответил вовремя") from e
+
+    async def start_session(self, name: str) -> int:
+        data = await self._post("start_session", "/sessions/start", "Ошибка создания сессии", {"name": name})
+        session_id = (data or {}).get('SessionId') or (data or {}).get('sessionId') or (data or {}).get('id')
+        if session_id is None:
+            logging.error("Некорректный формат ответа сервера")
+            raise RuntimeError("Неверный формат ответа сервера")
+        return int(session_id)
+
+    async def start_generation(self, session_id: int) -> None:
+        await self._post("start_generation", "/start", "Ошибка запуска генерации", {"sessionId": session_id})
+
+    async def stop_generation(self, session_id: Optional[int] = None) -> None:
+        await self._post(
+            "stop_generation",
+            "/stop",
+            "Сервер не подтвердил остановку генерации",
+            {"sessionId": int(session_id)} if session_id is not None else None,
+            timeout=self.stop_timeout
+        )
 
-        return self._session.post(
-            f"{self.base_url}/stop",
-            json={"sessionId": int(session_id)},
-            headers={"Content-Type": "application/json"},
-            timeout=2
-        )
\ No newline at end of file
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,119 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from row_models import PACKET_DTYPE, SessionSummary
+
+
+CACHE_FORMAT_VERSION = 1
+META_FILE = "meta.json"
+
+
+class CachedSession:
+    def __init__(self, session_id: int, summary: Optional[SessionSummary], columns: Dict[str, np.ndarray]):
+        self.session_id = session_id
+        self.summary = summary
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def to_batch(self) -> np.ndarray:
+        batch = np.empty(len(self), dtype=PACKET_DTYPE)
+        for name, column in self.columns.items():
+            batch[name] = column
+        return batch
+
+
+class SessionCache:
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.startswith(".session_"):
+                shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+    def _entry_path(self, session_id: int) -> str:
+        return os.path.join(self.directory, f"session_{session_id}")
+
+    def get(self, session_id: int) -> Optional[CachedSession]:
+        path = self._entry_path(session_id)
+        meta_path = os.path.join(path, META_FILE)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+
+            if meta.get("version") != CACHE_FORMAT_VERSION or meta.get("session_id") != session_id:
+                raise ValueError("метаданные не совпадают")
+
+            count = meta["packet_count"]
+            columns = {}
+            for name in PACKET_DTYPE.names:
+                column = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+                if column.dtype != PACKET_DTYPE[name] or column.shape != (count,):
+                    raise ValueError(f"столбец {name} повреждён")
+                columns[name] = column
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Кэш сессии {session_id} отброшен: {e}")
+            self.remove(session_id)
+            return None
+
+        os.utime(meta_path)
+        summary = SessionSummary(**meta["summary"]) if meta.get("summary") else None
+        return CachedSession(session_id, summary, columns)
+
+    def put(self, session_id: int, batch: np.ndarray, summary: Optional[SessionSummary] = None) -> None:
+        staging = tempfile.mkdtemp(prefix=f".session_{session_id}_", dir=self.directory)
+        try:
+            for name in PACKET_DTYPE.names:
+                np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(batch[name]))
+            with open(os.path.join(staging, META_FILE), "w", encoding="utf-8") as file:
+                json.dump({
+                    "version": CACHE_FORMAT_VERSION,
+                    "session_id": session_id,
+                    "packet_count": len(batch),
+                    "summary": asdict(summary) if summary else None,
+                }, file)
+
+            self.remove(session_id)
+            os.replace(staging, self._entry_path(session_id))
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self.evict()
+
+    def remove(self, session_id: int) -> None:
+        shutil.rmtree(self._entry_path(session_id), ignore_errors=True)
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if not name.startswith("session_") or not os.path.isdir(path):
+                continue
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+                entries.append((os.stat(os.path.join(path, META_FILE)).st_mtime, size, path))
+            except OSError:
+                shutil.rmtree(path, ignore_errors=True)
+        return entries
+
+    def evict(self) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            logging.info(f"Сессия удалена из кэша: {os.path.basename(path)}")
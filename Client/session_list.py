@@ -0,0 +1,128 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal
+
+from row_models import Session
+from time_format import format_timestamps
+
+
+SESSION_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+SESSION_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+class SessionListModel(QAbstractListModel):
+    older_requested = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sessions: List[Session] = []
+        self._labels: List[str] = []
+        self._rows: Dict[int, int] = {}
+        self._has_older = False
+        self._fetching_older = False
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._sessions)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        session = self._sessions[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[index.row()]
+        if role == SESSION_ID_ROLE:
+            return session.id
+        if role == SESSION_ROLE:
+            return session
+        return None
+
+    def session(self, index: QModelIndex) -> Optional[Session]:
+        return self._sessions[index.row()] if index.isValid() else None
+
+    @property
+    def newest_id(self) -> Optional[int]:
+        return self._sessions[0].id if self._sessions else None
+
+    @property
+    def active_ids(self) -> List[int]:
+        return [session.id for session in self._sessions if session.end_time is None]
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_older and not self._fetching_older
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        self._fetching_older = True
+        self.older_requested.emit(self._sessions[-1].id)
+
+    def set_sessions(self, sessions: List[Session], page_size: int) -> None:
+        self.beginResetModel()
+        self._sessions = sorted(sessions, key=lambda session: session.id, reverse=True)
+        self._labels = self._format_labels(self._sessions)
+        self._rebuild_rows()
+        self._has_older = len(sessions) >= page_size
+        self._fetching_older = False
+        self.endResetModel()
+
+    def append_older(self, sessions: List[Session], page_size: int) -> None:
+        self._fetching_older = False
+        self._has_older = len(sessions) >= page_size
+
+        oldest = self._sessions[-1].id if self._sessions else None
+        older = sorted(
+            (session for session in sessions if oldest is None or session.id < oldest),
+            key=lambda session: session.id,
+            reverse=True
+        )
+        if not older:
+            return
+
+        first = len(self._sessions)
+        self.beginInsertRows(QModelIndex(), first, first + len(older) - 1)
+        self._sessions.extend(older)
+        self._labels.extend(self._format_labels(older))
+        self._rebuild_rows()
+        self.endInsertRows()
+
+    def older_failed(self) -> None:
+        self._fetching_older = False
+
+    def merge(self, sessions: List[Session]) -> None:
+        newest = self.newest_id
+        newer = []
+        for session in sessions:
+            row = self._rows.get(session.id)
+            if row is not None:
+                self._sessions[row] = session
+                self._labels[row] = self._format_labels([session])[0]
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+            elif newest is None or session.id > newest:
+                newer.append(session)
+
+        if not newer:
+            return
+
+        newer.sort(key=lambda session: session.id, reverse=True)
+        self.beginInsertRows(QModelIndex(), 0, len(newer) - 1)
+        self._sessions[:0] = newer
+        self._labels[:0] = self._format_labels(newer)
+        self._rebuild_rows()
+        self.endInsertRows()
+
+    @staticmethod
+    def _format_labels(sessions: List[Session]) -> List[str]:
+        if not sessions:
+            return []
+        starts = format_timestamps(np.array([session.start_time for session in sessions], dtype=np.float64))
+        ends = format_timestamps(np.array([session.end_time or 0 for session in sessions], dtype=np.float64))
+        return [
+            f"{session.id}: {session.name} ({start} - {end if session.end_time else 'Активна'})"
+            for session, start, end in zip(sessions, starts, ends)
+        ]
+
+    def _rebuild_rows(self) -> None:
+        self._rows = {session.id: row for row, session in enumerate(self._sessions)}
@@ -0,0 +1,48 @@
+import gc
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from config import Config
+from helpers import make_rows
+
+
+@pytest.fixture
+def rows():
+    return make_rows(np.arange(100))
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    from PySide6.QtCore import QEventLoop
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Config, "SESSION_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(Config, "METRICS_PORT", 0)
+    monkeypatch.setattr(Config, "SERVER_AUTO_CONNECT", False)
+    monkeypatch.setattr(Config, "DB_CONFIG", {**Config.DB_CONFIG, "host": "127.0.0.1", "port": 1})
+
+    import main_window
+
+    monkeypatch.setattr(main_window.QMessageBox, "critical", staticmethod(lambda *args, **kwargs: None))
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def spin(seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 20)
+
+    window = main_window.MainWindow()
+    window.spin = spin
+    yield window
+    app.processEvents()
+    window.close()
+    del window
+    gc.collect()
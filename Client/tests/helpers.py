@@ -0,0 +1,21 @@
+import numpy as np
+
+from checksum import compute_crc16_batch
+from row_models import PACKET_DTYPE, ROW_DTYPE, STATUS_NEGATIVE_VALUE, STATUS_OK, TelemetryPacket
+
+
+def make_rows(counters, session_id: int = 1, start: float = 1_760_000_000.0, step: float = 0.5) -> np.ndarray:
+    counters = np.asarray(counters, dtype=np.int32)
+    batch = np.zeros(len(counters), dtype=PACKET_DTYPE)
+    batch["id"] = counters.astype(np.int64) + 1
+    batch["counter"] = counters
+    batch["timestamp"] = start + counters * step
+    batch["payload"] = np.sin(counters.astype(np.float64))
+    batch["crc16"] = compute_crc16_batch(batch["payload"], batch["counter"], batch["timestamp"])
+    batch["session_id"] = session_id
+    batch["status"] = np.where(batch["payload"] < 0, STATUS_NEGATIVE_VALUE, STATUS_OK)
+    return batch
+
+
+def to_packets(batch: np.ndarray) -> list:
+    return [TelemetryPacket(*row) for row in batch[list(ROW_DTYPE.names)].tolist()]
@@ -0,0 +1,123 @@
+import os
+import zlib
+
+import numpy as np
+import pytest
+
+from capture import CHUNK_HEADER, FILE_HEADER, CaptureReader, CaptureRecorder
+from helpers import to_packets
+
+
+def record(path, batch, arrivals, chunk_packets=25):
+    recorder = CaptureRecorder(str(path), chunk_packets=chunk_packets, flush_interval=0.01)
+    for packet, arrival in zip(to_packets(batch), arrivals.tolist()):
+        recorder.record(packet, arrival)
+    recorder.close()
+    return recorder
+
+
+@pytest.fixture
+def capture(tmp_path, rows):
+    path = tmp_path / "stream.tlmcap"
+    arrivals = rows["timestamp"] + 0.01
+    recorder = record(path, rows, arrivals)
+    return path, rows, arrivals, recorder
+
+
+def test_round_trip(capture):
+    path, rows, arrivals, recorder = capture
+    assert recorder.packet_count == len(rows)
+
+    reader = CaptureReader(str(path))
+    try:
+        assert reader.packet_count == len(rows)
+        assert len(reader.chunks) == 4
+        records = np.concatenate(list(reader.iter_chunks()))
+    finally:
+        reader.close()
+
+    for name in ("id", "counter", "timestamp", "payload", "crc16", "session_id"):
+        np.testing.assert_array_equal(records[name], rows[name])
+    np.testing.assert_array_equal(records["arrival"], arrivals)
+
+
+def test_index_seek(capture):
+    path, rows, arrivals, _ = capture
+    reader = CaptureReader(str(path))
+    try:
+        assert reader.start_time == arrivals[0]
+        assert reader.duration == pytest.approx(arrivals[-1] - arrivals[0])
+        assert reader.find_chunk(0.0) == 0
+        assert reader.find_chunk(reader.duration) == len(reader.chunks) - 1
+
+        records = np.concatenate(list(reader.read_from(30.0)))
+        np.testing.assert_array_equal(records["counter"], rows["counter"][arrivals >= arrivals[0] + 30.0])
+    finally:
+        reader.close()
+
+
+def test_missing_index_is_rebuilt_by_scanning(capture):
+    path, rows, _, _ = capture
+    os.remove(f"{path}.idx")
+    reader = CaptureReader(str(path))
+    try:
+        assert reader.packet_count == len(rows)
+    finally:
+        reader.close()
+
+
+def test_truncated_tail_chunk_is_dropped(capture):
+    path, _, _, _ = capture
+    size = os.path.getsize(path)
+    with open(path, "r+b") as file:
+        file.truncate(size - 10)
+
+    reader = CaptureReader(str(path))
+    try:
+        assert reader.packet_count == 75
+        assert len(np.concatenate(list(reader.iter_chunks()))) == 75
+    finally:
+        reader.close()
+
+
+def test_corrupt_chunk_header_stops_scan(capture):
+    path, _, _, _ = capture
+    os.remove(f"{path}.idx")
+    reader = CaptureReader(str(path))
+    second = reader.chunks[1].offset
+    reader.close()
+    with open(path, "r+b") as file:
+        file.seek(second)
+        file.write(b"XXXX")
+
+    reader = CaptureReader(str(path))
+    try:
+        assert len(reader.chunks) == 1
+        assert reader.packet_count == 25
+    finally:
+        reader.close()
+
+
+def test_corrupt_chunk_payload_raises(capture):
+    path, _, _, _ = capture
+    reader = CaptureReader(str(path))
+    chunk = reader.chunks[2]
+    reader.close()
+    with open(path, "r+b") as file:
+        file.seek(chunk.offset + CHUNK_HEADER.size)
+        file.write(b"\x00" * 8)
+
+    reader = CaptureReader(str(path))
+    try:
+        reader.read_chunk(1)
+        with pytest.raises(zlib.error):
+            reader.read_chunk(2)
+    finally:
+        reader.close()
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "foreign.bin"
+    path.write_bytes(b"\x00" * FILE_HEADER.size)
+    with pytest.raises(ValueError):
+        CaptureReader(str(path))
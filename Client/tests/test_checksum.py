@@ -0,0 +1,50 @@
+import struct
+
+import numpy as np
+
+from checksum import CRC_RECORD_DTYPE, compute_crc16, compute_crc16_batch, _crc16_ccitt
+
+
+def server_crc16(payload: float, counter: int, timestamp: float) -> int:
+    # TelemetryService.ComputeCrc16: BitConverter bytes of Payload, PacketCounter, Timestamp
+    data = struct.pack("<d", payload) + struct.pack("<i", counter) + struct.pack("<d", timestamp)
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) & 0xFFFF if crc & 0x8000 else (crc << 1) & 0xFFFF
+    return crc
+
+
+def test_ccitt_false_check_value():
+    assert _crc16_ccitt(b"123456789") == 0x29B1
+
+
+def test_record_layout_matches_server():
+    assert CRC_RECORD_DTYPE.itemsize == 20
+    assert CRC_RECORD_DTYPE.fields["counter"][1] == 8
+    assert CRC_RECORD_DTYPE.fields["timestamp"][1] == 12
+
+
+def test_scalar_matches_server():
+    for payload, counter, timestamp in (
+        (0.0, 0, 0.0),
+        (-0.75, 1, 1_760_000_000.125),
+        (123.456, 2 ** 31 - 1, 1_760_123_456.5),
+        (1e-300, -5, 42.0),
+    ):
+        assert compute_crc16(payload, counter, timestamp) == server_crc16(payload, counter, timestamp)
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(7)
+    payload = rng.normal(size=500)
+    counter = rng.integers(-2 ** 31, 2 ** 31 - 1, size=500, dtype=np.int64).astype(np.int32)
+    timestamp = 1_760_000_000 + rng.random(500) * 1e6
+
+    expected = [compute_crc16(float(p), int(c), float(t)) for p, c, t in zip(payload, counter, timestamp)]
+    np.testing.assert_array_equal(compute_crc16_batch(payload, counter, timestamp), expected)
+
+
+def test_empty_batch():
+    assert len(compute_crc16_batch(np.empty(0), np.empty(0, dtype=np.int32), np.empty(0))) == 0
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6.QtCore")
+
+from custom_table import PacketTableModel
+from helpers import make_rows
+from packet_buffer import PacketRingBuffer
+
+
+def model_with(counters, capacity: int) -> PacketTableModel:
+    model = PacketTableModel(capacity)
+    model.append_batch(make_rows(counters))
+    return model
+
+
+def record_signals(model: PacketTableModel) -> list:
+    events = []
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("insert", first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("remove", first, last)))
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    return events
+
+
+def test_merge_batch_inserts_each_gap():
+    model = model_with(np.r_[0:4, 8:10, 13:16], capacity=20)
+    events = record_signals(model)
+    model.merge_batch(make_rows(np.r_[4:8, 10:13]))
+
+    assert events == [("insert", 6, 8), ("insert", 4, 7)]
+    np.testing.assert_array_equal(model.buffer.ordered("counter"), np.arange(16))
+    assert model.rowCount() == 16
+
+
+def test_merge_batch_matches_buffer_merge_when_full():
+    counters = np.r_[0:30, 40:60]
+    backfill = make_rows(np.r_[30:40, -3:0])
+    model = model_with(counters, capacity=45)
+    buffer = PacketRingBuffer(45)
+    buffer.extend(make_rows(counters))
+
+    events = record_signals(model)
+    model.merge_batch(backfill)
+    buffer.merge(backfill)
+
+    assert ("reset",) not in events
+    np.testing.assert_array_equal(model.buffer.ordered("counter"), buffer.ordered("counter"))
+    np.testing.assert_array_equal(model.buffer.ordered("counter"), np.arange(15, 60))
+    assert model.rowCount() == 45
@@ -0,0 +1,61 @@
+import numpy as np
+
+from decimation import MinMaxPyramid, StreamingDecimator
+
+
+def test_streaming_envelope_buckets():
+    decimator = StreamingDecimator(window=10.0, buckets=10)
+    decimator.add(np.array([0.1, 0.2, 1.5, 1.6]), np.array([1.0, -1.0, 3.0, 5.0]))
+    x, low, high, mean = decimator.envelope()
+    np.testing.assert_allclose(x, [0.5, 1.5])
+    np.testing.assert_allclose(low, [-1.0, 3.0])
+    np.testing.assert_allclose(high, [1.0, 5.0])
+    np.testing.assert_allclose(mean, [0.0, 4.0])
+
+
+def test_streaming_window_rolls_and_accepts_late_samples():
+    decimator = StreamingDecimator(window=10.0, buckets=10)
+    decimator.add(np.arange(0.5, 20.0), np.arange(20.0))
+    x, _, _, _ = decimator.envelope()
+    np.testing.assert_allclose(x, np.arange(10.5, 20.0))
+
+    decimator.add(np.array([12.2, 3.0]), np.array([-7.0, 100.0]))
+    x, low, high, _ = decimator.envelope()
+    assert low[x == 12.5][0] == -7.0
+    assert high.max() == 19.0
+
+
+def test_streaming_ignores_nan_timestamps():
+    decimator = StreamingDecimator(window=10.0, buckets=10)
+    decimator.add(np.array([np.nan]), np.array([1.0]))
+    assert len(decimator.envelope()[0]) == 0
+
+
+def test_pyramid_preserves_extremes():
+    x = np.arange(100_000, dtype=np.float64)
+    y = np.sin(x / 50.0)
+    y[12_345] = 10.0
+    y[67_890] = -10.0
+    pyramid = MinMaxPyramid(x, y)
+    assert len(pyramid.levels) > 1
+
+    _, low, high, _ = pyramid.query(0.0, x[-1], 200)
+    assert len(low) <= 200
+    assert high.max() == 10.0
+    assert low.min() == -10.0
+
+
+def test_streaming_envelope_merges_to_requested_buckets():
+    decimator = StreamingDecimator(window=100.0, buckets=100)
+    x = np.arange(0.5, 100.0)
+    y = np.sin(x)
+    y[37] = 10.0
+    y[73] = -10.0
+    decimator.add(x, y)
+
+    full = decimator.envelope()
+    merged_x, low, high, mean = decimator.envelope(10)
+    assert len(merged_x) == 10
+    assert high.max() == 10.0 and low.min() == -10.0
+    np.testing.assert_allclose(mean, y.reshape(10, 10).mean(axis=1))
+    assert decimator.envelope(1000)[0].tolist() == full[0].tolist()
@@ -0,0 +1,109 @@
+import csv
+import io
+import os
+import struct
+
+import numpy as np
+import pytest
+
+from export import PG_COPY_RECORD_DTYPE, PG_COPY_SIGNATURE, export_session
+from row_models import PACKET_DTYPE, ROW_FIELDS
+
+
+def binary_copy(batch: np.ndarray) -> bytes:
+    records = np.zeros(len(batch), dtype=PG_COPY_RECORD_DTYPE)
+    records["field_count"] = len(ROW_FIELDS)
+    for name in ROW_FIELDS:
+        records[f"{name}_length"] = PG_COPY_RECORD_DTYPE[name].itemsize
+        records[name] = batch[name]
+    return PG_COPY_SIGNATURE + struct.pack(">ii", 0, 0) + records.tobytes() + struct.pack(">h", -1)
+
+
+def csv_copy(batch: np.ndarray) -> bytes:
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["Id", "PacketCounter", "Timestamp", "Payload", "Crc16", "SessionId"])
+    writer.writerows(batch[list(ROW_FIELDS)].tolist())
+    return out.getvalue().encode()
+
+
+class CopyDatabase:
+    def __init__(self, batch: np.ndarray, piece: int = 37):
+        self.batch = batch
+        self.piece = piece
+        self.calls = []
+
+    def copy_session_packets(self, out, session_id, binary=False, time_from=None, time_to=None):
+        self.calls.append((session_id, binary, time_from, time_to))
+        batch = self.batch
+        if time_from is not None:
+            batch = batch[batch["timestamp"] >= time_from]
+        if time_to is not None:
+            batch = batch[batch["timestamp"] <= time_to]
+        data = binary_copy(batch) if binary else csv_copy(batch)
+        for start in range(0, len(data), self.piece):
+            out.write(data[start:start + self.piece])
+
+
+def test_npz_round_trip(tmp_path, rows):
+    path = str(tmp_path / "session.npz")
+    assert export_session(CopyDatabase(rows), 1, path) == len(rows)
+
+    with np.load(path) as bundle:
+        assert set(bundle.files) == set(PACKET_DTYPE.names)
+        for name in PACKET_DTYPE.names:
+            assert bundle[name].dtype == PACKET_DTYPE[name]
+            np.testing.assert_array_equal(bundle[name], rows[name])
+    assert not os.path.exists(f"{path}.part")
+
+
+def test_npz_time_range(tmp_path, rows):
+    path = str(tmp_path / "range.npz")
+    db = CopyDatabase(rows)
+    time_from, time_to = float(rows["timestamp"][10]), float(rows["timestamp"][19])
+    assert export_session(db, 1, path, time_from, time_to) == 10
+    assert db.calls == [(1, True, time_from, time_to)]
+    with np.load(path) as bundle:
+        np.testing.assert_array_equal(bundle["counter"], np.arange(10, 20))
+
+
+def test_csv_round_trip(tmp_path, rows):
+    path = str(tmp_path / "session.csv")
+    assert export_session(CopyDatabase(rows), 1, path) == len(rows)
+
+    with open(path, newline="") as file:
+        lines = list(csv.reader(file))
+    assert lines[0][0] == "Id"
+    exported = np.array([tuple(float(value) for value in line) for line in lines[1:]])
+    for column, name in enumerate(ROW_FIELDS):
+        np.testing.assert_array_equal(exported[:, column], rows[name].astype(np.float64))
+
+
+def test_default_extension_is_npz(tmp_path, rows):
+    path = str(tmp_path / "session")
+    export_session(CopyDatabase(rows), 1, path)
+    assert os.path.exists(f"{path}.npz")
+
+
+def test_failed_export_leaves_no_part_file(tmp_path, rows):
+    class BrokenDatabase(CopyDatabase):
+        def copy_session_packets(self, out, *args, **kwargs):
+            out.write(b"not a copy stream" * 4)
+            raise RuntimeError("соединение потеряно")
+
+    path = str(tmp_path / "broken.csv")
+    with pytest.raises(RuntimeError):
+        export_session(BrokenDatabase(rows), 1, path)
+    assert not os.path.exists(path)
+    assert not os.path.exists(f"{path}.part")
+
+
+def test_invalid_binary_stream_is_rejected(tmp_path, rows):
+    class GarbageDatabase(CopyDatabase):
+        def copy_session_packets(self, out, *args, **kwargs):
+            out.write(b"x" * 64)
+
+    path = str(tmp_path / "garbage.npz")
+    with pytest.raises(ValueError):
+        export_session(GarbageDatabase(rows), 1, path)
+    assert not os.path.exists(path)
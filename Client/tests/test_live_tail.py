@@ -0,0 +1,131 @@
+import json
+import logging
+import time
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+
+from config import Config
+from live_tail import PACKETS_CHANNEL, SESSION_ENDED_CHANNEL, PacketNotificationListener
+
+
+UNREACHABLE = {"host": "127.0.0.1", "port": 1, "dbname": "telemetry", "connect_timeout": 1}
+
+
+def notify(channel: str, payload) -> SimpleNamespace:
+    return SimpleNamespace(channel=channel, payload=payload if isinstance(payload, str) else json.dumps(payload))
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_collect_keeps_highest_id_and_ended_sessions():
+    listener = PacketNotificationListener(UNREACHABLE)
+    listener._collect([
+        notify(PACKETS_CHANNEL, {"session_id": 1, "last_id": 10}),
+        notify(PACKETS_CHANNEL, {"session_id": 1, "last_id": 7}),
+        notify(PACKETS_CHANNEL, {"session_id": 2, "last_id": 3}),
+        notify(SESSION_ENDED_CHANNEL, {"session_id": 2}),
+        notify(PACKETS_CHANNEL, "not json"),
+        notify(PACKETS_CHANNEL, {"last_id": 5}),
+    ])
+
+    assert listener.take() == ({1: 10, 2: 3}, {2})
+    assert listener.take() == ({}, set())
+
+
+def test_reconnect_delay_backs_off_to_the_limit():
+    listener = PacketNotificationListener(UNREACHABLE, reconnect_interval=5.0, max_reconnect_interval=60.0)
+    assert [listener.reconnect_delay(attempt) for attempt in range(6)] == [5.0, 10.0, 20.0, 40.0, 60.0, 60.0]
+
+
+def test_failed_reconnects_warn_once(caplog):
+    caplog.set_level(logging.DEBUG, logger="live_tail")
+    listener = PacketNotificationListener(UNREACHABLE, reconnect_interval=0.01, max_reconnect_interval=0.02)
+    listener.start()
+    try:
+        assert wait_until(lambda: len(caplog.records) >= 4)
+    finally:
+        assert listener.stop(timeout=2.0)
+
+    levels = [record.levelno for record in caplog.records]
+    assert levels[0] == logging.WARNING
+    assert set(levels[1:]) == {logging.DEBUG}
+
+
+def test_stop_and_start_again():
+    listener = PacketNotificationListener(UNREACHABLE, reconnect_interval=0.01)
+    assert not listener.running
+    listener.start()
+    first = listener._thread
+    listener.start()
+    assert listener._thread is first
+
+    listener.stop()
+    assert not listener.running
+    listener.start()
+    assert listener.running and listener._thread is not first
+    assert listener.stop(timeout=2.0)
+    first.join(2.0)
+    assert not first.is_alive()
+
+
+@pytest.fixture
+def notify_connection():
+    if not Config.DB_CONFIG.get("dbname"):
+        pytest.skip("БД не настроена")
+    try:
+        conn = psycopg2.connect(**Config.DB_CONFIG)
+    except psycopg2.Error as e:
+        pytest.skip(f"БД недоступна: {e}")
+    conn.autocommit = True
+    yield conn
+    conn.close()
+
+
+def test_notifications_from_the_database(notify_connection):
+    listener = PacketNotificationListener(Config.DB_CONFIG, poll_timeout=0.05)
+    listener.start()
+    try:
+        assert wait_until(lambda: listener.connected)
+        with notify_connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", (PACKETS_CHANNEL, json.dumps({"session_id": 7, "last_id": 42})))
+            cursor.execute("SELECT pg_notify(%s, %s)", (SESSION_ENDED_CHANNEL, json.dumps({"session_id": 7})))
+
+        received = ({}, set())
+
+        def collected() -> bool:
+            last_ids, ended = listener.take()
+            received[0].update(last_ids)
+            received[1].update(ended)
+            return 7 in received[1]
+
+        assert wait_until(collected)
+        assert received == ({7: 42}, {7})
+    finally:
+        assert listener.stop(timeout=2.0)
+    assert not listener.connected
+
+
+def test_window_listens_only_while_tailing(window):
+    assert not window.tail_listener.running
+
+    window.history_active = True
+    window.history_session_id = 1
+    window.ui.chkHistoryTail.setChecked(True)
+    window._toggle_history_tail(True)
+    assert window.tail_listener.running and window.history_tail_timer.isActive()
+
+    window._toggle_history_tail(False)
+    assert not window.tail_listener.running and not window.history_tail_timer.isActive()
+
+    window._toggle_history_tail(True)
+    window._finish_history_tail()
+    assert not window.tail_listener.running
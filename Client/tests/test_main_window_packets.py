@@ -0,0 +1,38 @@
+import json
+
+from checksum import compute_crc16
+from metrics import PACKETS_DROPPED
+
+
+def hub_packet(packet_id: int, counter: int, session_id=None) -> dict:
+    timestamp, payload = 1_760_000_000.0 + counter, 0.5
+    packet = {
+        "id": packet_id,
+        "packetCounter": counter,
+        "timestamp": timestamp,
+        "payload": payload,
+        "crc16": compute_crc16(payload, counter, timestamp),
+    }
+    if session_id is not None:
+        packet["sessionId"] = session_id
+    return packet
+
+
+def test_json_packets_are_routed_by_session_id(window):
+    generated = window.live_sessions.watch(3, "3: live")
+    watched = window.live_sessions.watch(4, "4: live")
+    window.current_session_id = 3
+    not_subscribed = PACKETS_DROPPED.value(reason="not_subscribed")
+
+    window._handle_new_packet(json.dumps(hub_packet(1, 0, session_id=4)))
+    window._handle_new_packet(json.dumps([hub_packet(2, 1, session_id=4)]))
+    window._handle_new_packet(json.dumps(hub_packet(3, 0)))
+    window._handle_new_packet(hub_packet(4, 1, session_id=3))
+    window._handle_new_packet(json.dumps(hub_packet(5, 0, session_id=5)))
+    window._drain_packet_queue()
+
+    assert watched.buffer.ordered("counter").tolist() == [0, 1]
+    assert watched.buffer.ordered("session_id").tolist() == [4, 4]
+    assert generated.buffer.ordered("counter").tolist() == [0, 1]
+    assert generated.buffer.ordered("session_id").tolist() == [3, 3]
+    assert PACKETS_DROPPED.value(reason="not_subscribed") == not_subscribed + 1
@@ -0,0 +1,103 @@
+import numpy as np
+
+from config import Config
+from helpers import make_rows
+from row_models import PacketFilter
+
+
+class FakeSignalR:
+    def __init__(self):
+        self.joined = []
+
+    def join_session(self, session_id):
+        self.joined.append(session_id)
+
+
+def receive(window, session, rows) -> None:
+    accepted = session.tracker.add_batch(rows["counter"], rows["timestamp"], rows["timestamp"])
+    window.packet_queue.put(rows[accepted])
+    window._drain_packet_queue()
+
+
+def stored_packets(monkeypatch, window, rows) -> list:
+    queries = []
+
+    def iter_filtered_packets(session_id, packet_filter, page_size, first_page_size):
+        queries.append(packet_filter)
+        matched = packet_filter.apply(rows)
+        for start in range(0, len(matched), 7):
+            yield matched[start:start + 7]
+
+    monkeypatch.setattr(window.db, "iter_filtered_packets", iter_filtered_packets)
+    return queries
+
+
+def test_reconnect_delay_backs_off_with_jitter(window):
+    for attempt in range(window.MAX_RECONNECT_ATTEMPTS):
+        ceiling = min(window.BASE_RECONNECT_INTERVAL * 2 ** attempt, window.MAX_RECONNECT_INTERVAL)
+        for _ in range(20):
+            assert ceiling / 2 <= window._reconnect_delay(attempt) <= ceiling
+
+
+def test_rejoin_backfills_up_to_the_live_stream(window, monkeypatch):
+    rows = make_rows(np.arange(100), session_id=5)
+    session = window.live_sessions.watch(5, "5: live")
+    window._watch_session(session)
+    receive(window, session, rows[:40])
+
+    window._remember_resume_points()
+    assert window.resume_points == {5: (40, float(rows["timestamp"][39]))}
+
+    receive(window, session, rows[70:80])
+    queries = stored_packets(monkeypatch, window, rows)
+    signalr = FakeSignalR()
+    packet_filter = PacketFilter(time_from=float(rows["timestamp"][39]), counter_from=40)
+    for batch in window._rejoin_session(signalr, 5, packet_filter):
+        window._merge_backfill(5, batch)
+
+    assert signalr.joined == [5]
+    assert queries == [PacketFilter(time_from=float(rows["timestamp"][39]), counter_from=40, counter_to=79)]
+    np.testing.assert_array_equal(session.buffer.ordered("counter"), np.arange(80))
+    assert window.ui.PacketTableWidget.packet_model.rowCount() == 80
+    stats = session.tracker.stats()
+    assert session.tracker.gaps() == []
+    assert (stats.received, stats.backfilled, stats.duplicates) == (80, 30, 0)
+
+
+def test_rejoin_without_live_packets_is_unbounded(window, monkeypatch):
+    rows = make_rows(np.arange(60), session_id=6)
+    session = window.live_sessions.watch(6, "6: live")
+    receive(window, session, rows[:20])
+    queries = stored_packets(monkeypatch, window, rows)
+
+    for batch in window._rejoin_session(FakeSignalR(), 6, PacketFilter(counter_from=20)):
+        window._merge_backfill(6, batch)
+
+    assert queries == [PacketFilter(counter_from=20)]
+    np.testing.assert_array_equal(session.buffer.ordered("counter"), np.arange(60))
+
+
+def test_resume_fills_gaps_left_after_rejoin(window, monkeypatch):
+    monkeypatch.setattr(Config, "BACKFILL_SETTLE_INTERVAL", 0)
+    rows = make_rows(np.arange(100), session_id=7)
+    session = window.live_sessions.watch(7, "7: live")
+    window._watch_session(session)
+    receive(window, session, rows[:30])
+    window._remember_resume_points()
+
+    stored = np.delete(rows, np.r_[50:55])
+    stored_packets(monkeypatch, window, stored)
+    window.signalr = FakeSignalR()
+    receive(window, session, rows[90:100])
+    window._resume_sessions()
+    window.spin(0.3)
+    assert session.tracker.gaps() == [(50, 54)]
+
+    stored_packets(monkeypatch, window, rows)
+    window._backfill_gaps(7, PacketFilter(counter_from=30))
+    window.spin(0.3)
+
+    assert window.signalr.joined == [7]
+    np.testing.assert_array_equal(session.buffer.ordered("counter"), np.arange(100))
+    assert session.tracker.gaps() == []
+    assert window.resume_points == {}
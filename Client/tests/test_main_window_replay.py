@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+from capture import CaptureRecorder
+from helpers import make_rows, to_packets
+from replay import CaptureReplaySource
+
+
+def wait_for_replay(window, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not window.replay.finished and time.monotonic() < deadline:
+        window.spin(0.05)
+    window.spin(0.2)
+
+
+def test_live_and_replay_sessions_share_an_id(window, tmp_path):
+    rows = make_rows(np.arange(100), session_id=2)
+    live = window.live_sessions.watch(2, "2: live")
+    window._watch_session(live)
+    accepted = live.tracker.add_batch(rows["counter"], rows["timestamp"], rows["timestamp"])
+    window.packet_queue.put(rows[accepted])
+    window._drain_packet_queue()
+    assert len(live.buffer) == 100
+
+    path = str(tmp_path / "session2.tlmcap")
+    recorder = CaptureRecorder(path, chunk_packets=30, flush_interval=0.01)
+    for packet, arrival in zip(to_packets(rows), rows["timestamp"].tolist()):
+        recorder.record(packet, arrival)
+    recorder.close()
+
+    window._start_replay(CaptureReplaySource(path))
+    window.replay.set_speed(0)
+    wait_for_replay(window)
+
+    assert len(live.buffer) == 100
+    assert live.tracker.stats().received == 100
+    assert live.tracker.stats().duplicates == 0
+    replayed = window.replay_sessions.get(2)
+    assert replayed is not live
+    assert len(replayed.buffer) == 100
+
+    combo = window.ui.cmbLiveSession
+    live_index, replay_index = window._session_index(("live", 2)), window._session_index(("replay", 2))
+    assert live_index >= 0 and replay_index >= 0 and live_index != replay_index
+    combo.setCurrentIndex(live_index)
+    assert window.live_session is live
+    combo.setCurrentIndex(replay_index)
+    assert window.live_session is replayed
+    assert window.ui.PacketTableWidget.packet_model.rowCount() == 100
+
+    window.ui.sliderReplay.setValue(0)
+    window._seek_replay()
+    wait_for_replay(window)
+    assert len(live.buffer) == 100
+    assert live.tracker.stats().received == 100
+    assert replayed.tracker.stats().received == 100
+    assert replayed.tracker.stats().duplicates == 0
+    assert window.ui.PacketTableWidget.packet_model.rowCount() == 100
+
+    window._unwatch_live_session()
+    assert window.replay_sessions.get(2) is None
+    assert window.live_sessions.get(2) is live
+    assert window._session_index(("live", 2)) >= 0
+
+    window._stop_replay()
+    window.spin(0.1)
@@ -0,0 +1,37 @@
+import logging
+
+import pytest
+
+from config import Config
+
+
+@pytest.fixture
+def startup_probe(monkeypatch, caplog):
+    monkeypatch.setattr(Config, "STARTUP_PROBE", True)
+    caplog.set_level(logging.INFO, logger="main_window")
+
+
+def startup_records(caplog) -> list:
+    return [record for record in caplog.records if hasattr(record, "startup_stage")]
+
+
+def test_startup_stages_are_emitted_through_the_probe_handler(startup_probe, window, caplog):
+    window.spin(0.2)
+
+    records = startup_records(caplog)
+    assert [record.startup_stage for record in records] == ["window", "db"]
+    assert 0 < records[0].startup_seconds <= records[1].startup_seconds
+    fields = window.startup_probe.format(records[0]).split()
+    assert fields == ["startup", "window", f"{records[0].startup_seconds:.4f}"]
+    assert all(window.startup_probe.filter(record) for record in records)
+    assert not window.startup_probe.filter(caplog.records[-1])
+
+
+def test_startup_probe_handler_is_detached_on_close(startup_probe, window):
+    window.spin(0.2)
+
+    assert window.startup_probe not in logging.getLogger("main_window").handlers
+
+
+def test_startup_probe_is_off_by_default(window):
+    assert window.startup_probe is None
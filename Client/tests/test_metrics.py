@@ -0,0 +1,113 @@
+import logging
+import urllib.request
+
+import pytest
+
+import metrics
+from metrics import (
+    LOG_MESSAGES_SUPPRESSED, RATE_LIMIT_NOTE, MetricsRegistry, MetricsServer, RateLimitFilter
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter_and_gauge_by_labels(registry):
+    dropped = registry.counter("dropped_total", "Dropped")
+    dropped.inc(reason="crc")
+    dropped.inc(3, reason="crc")
+    dropped.inc(reason="empty")
+    depth = registry.gauge("depth", "Depth")
+    depth.set(5)
+    depth.set(2)
+
+    assert dropped.value(reason="crc") == 4
+    assert dropped.value(reason="empty") == 1
+    assert dropped.value(reason="other") == 0
+    assert depth.value() == 2
+    assert registry.counter("dropped_total", "Dropped") is dropped
+
+
+def test_histogram_quantiles_and_prometheus_text(registry):
+    histogram = registry.histogram("apply_seconds", "Apply", buckets=(0.1, 1.0))
+    assert histogram.series() == {}
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value, stage="ui")
+
+    series = histogram.series()[(("stage", "ui"),)]
+    assert series.counts == [2, 1, 1]
+    assert series.quantile(0.5) == 0.1
+    assert series.quantile(0.75) == 1.0
+    assert series.quantile(1.0) == float("inf")
+
+    text = registry.render_prometheus()
+    assert "# TYPE apply_seconds histogram" in text
+    assert 'apply_seconds_bucket{stage="ui",le="1.0"} 3' in text
+    assert 'apply_seconds_bucket{stage="ui",le="+Inf"} 4' in text
+    assert 'apply_seconds_count{stage="ui"} 4' in text
+
+
+def test_metrics_server_serves_the_registry(monkeypatch, registry):
+    registry.counter("served_total", "Served").inc()
+    monkeypatch.setattr(metrics._MetricsRequestHandler, "registry", registry)
+    server = MetricsServer("127.0.0.1", 0)
+    server.start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.stop()
+    assert "served_total 1" in body
+
+
+@pytest.fixture
+def limited_logger(caplog):
+    logger = logging.getLogger("tests.rate_limited")
+    limit = RateLimitFilter(burst=2, interval=60.0)
+    logger.addFilter(limit)
+    caplog.set_level(logging.DEBUG, logger=logger.name)
+    yield logger, limit
+    logger.removeFilter(limit)
+
+
+def test_rate_limit_per_call_site(limited_logger, caplog):
+    logger, _ = limited_logger
+    suppressed = LOG_MESSAGES_SUPPRESSED.value(logger=logger.name)
+    for index in range(5):
+        logger.warning("packet %d rejected", index)
+    for index in range(2):
+        logger.warning("other site %d", index)
+    logger.error("errors always pass")
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "packet 0 rejected", "packet 1 rejected", "other site 0", "other site 1", "errors always pass"
+    ]
+    assert LOG_MESSAGES_SUPPRESSED.value(logger=logger.name) == suppressed + 3
+    assert logging.getLogger("tests.unlimited").filters == []
+
+
+def test_suppressed_count_goes_to_a_separate_attribute(limited_logger, caplog, monkeypatch):
+    logger, limit = limited_logger
+    clock = [100.0]
+    monkeypatch.setattr(metrics.time, "monotonic", lambda: clock[0])
+
+    def emit(index):
+        logger.warning("packet %d rejected", index)
+
+    for index in range(4):
+        emit(index)
+    clock[0] += limit.interval
+    emit(4)
+
+    record = caplog.records[-1]
+    assert record.getMessage() == "packet 4 rejected"
+    assert record.msg == "packet %d rejected" and record.args == (4,)
+    assert getattr(record, RATE_LIMIT_NOTE) == " (ещё 2 подобных сообщений пропущено)"
+    assert not any(hasattr(record, RATE_LIMIT_NOTE) for record in caplog.records[:-1])
+
+    formatter = logging.Formatter(f"%(message)s%({RATE_LIMIT_NOTE})s", defaults={RATE_LIMIT_NOTE: ""})
+    assert formatter.format(record) == "packet 4 rejected (ещё 2 подобных сообщений пропущено)"
+    assert formatter.format(caplog.records[0]) == "packet 0 rejected"
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from packet_buffer import PacketRingBuffer
+from helpers import make_rows
+
+
+def test_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        PacketRingBuffer(0)
+
+
+def test_extend_grows_allocation_until_capacity():
+    buffer = PacketRingBuffer(5000)
+    buffer.extend(make_rows(np.arange(3000)))
+    assert len(buffer) == 3000
+    assert buffer.allocated >= 3000
+    np.testing.assert_array_equal(buffer.snapshot()["counter"], np.arange(3000))
+
+
+def test_wraparound_keeps_newest_rows_in_order():
+    buffer = PacketRingBuffer(10)
+    for start in range(0, 35, 7):
+        buffer.extend(make_rows(np.arange(start, start + 7)))
+
+    assert len(buffer) == 10
+    np.testing.assert_array_equal(buffer.snapshot()["counter"], np.arange(25, 35))
+    assert buffer.value(0, "counter") == 25
+    assert buffer.value(9, "counter") == 34
+
+
+def test_batch_larger_than_capacity_keeps_tail():
+    buffer = PacketRingBuffer(8)
+    buffer.extend(make_rows(np.arange(3)))
+    buffer.extend(make_rows(np.arange(100, 120)))
+    np.testing.assert_array_equal(buffer.snapshot()["counter"], np.arange(112, 120))
+
+
+def test_overflow_and_drop_oldest():
+    buffer = PacketRingBuffer(10)
+    buffer.extend(make_rows(np.arange(8)))
+    assert buffer.overflow(5) == 3
+    buffer.drop_oldest(3)
+    np.testing.assert_array_equal(buffer.snapshot()["counter"], np.arange(3, 8))
+
+
+def test_merge_inserts_runs_at_their_counter_position():
+    buffer = PacketRingBuffer(20)
+    counters = np.r_[0:4, 8:10, 13:16]
+    buffer.extend(make_rows(counters))
+    buffer.merge(make_rows(np.r_[11:13, 4:8, 10:11]))
+    np.testing.assert_array_equal(buffer.ordered("counter"), np.arange(16))
+    assert (np.diff(buffer.ordered("timestamp")) > 0).all()
+
+
+def test_merge_across_wraparound():
+    buffer = PacketRingBuffer(10)
+    buffer.extend(make_rows(np.arange(0, 6)))
+    buffer.drop_oldest(4)
+    buffer.extend(make_rows(np.r_[6:8, 12:14]))
+    buffer.merge(make_rows(np.arange(8, 12)))
+    np.testing.assert_array_equal(buffer.ordered("counter"), np.arange(4, 14))
+
+
+def test_merge_drops_oldest_rows_when_full():
+    buffer = PacketRingBuffer(10)
+    buffer.extend(make_rows(np.r_[0:4, 8:12]))
+    buffer.merge(make_rows(np.arange(4, 8)))
+    np.testing.assert_array_equal(buffer.ordered("counter"), np.arange(2, 12))
+
+    buffer.merge(make_rows(np.arange(-5, 0)))
+    np.testing.assert_array_equal(buffer.ordered("counter"), np.arange(2, 12))
+
+
+def test_merge_run_overflowing_window_keeps_newest():
+    buffer = PacketRingBuffer(5)
+    buffer.extend(make_rows(np.r_[0, 20]))
+    buffer.merge(make_rows(np.arange(1, 20)))
+    np.testing.assert_array_equal(buffer.ordered("counter"), np.arange(16, 21))
+
+
+def test_clear(rows):
+    buffer = PacketRingBuffer(10)
+    buffer.extend(rows[:5])
+    buffer.clear()
+    assert len(buffer) == 0
+    assert len(buffer.snapshot()) == 0
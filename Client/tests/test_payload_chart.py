@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from config import Config
+from helpers import make_rows
+from payload_chart import LivePayloadChart
+
+
+@pytest.fixture
+def chart():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    chart = LivePayloadChart()
+    chart.resize(400, 300)
+    chart.show()
+    app.processEvents()
+    yield chart
+    chart.close()
+    app.processEvents()
+
+
+def assert_one_bucket_per_pixel(chart) -> None:
+    width = chart.plot_width()
+    assert abs(chart.mean_series.count() - width) <= width * 0.05
+
+
+def test_live_chart_draws_one_bucket_per_pixel_and_follows_resize(chart):
+    rows = make_rows(np.arange(20_000))
+    rows["timestamp"] = 1_760_000_000.0 + np.linspace(0.0, Config.LIVE_CHART_WINDOW_SECONDS, len(rows))
+    chart.append_batch(rows)
+
+    narrow = chart.plot_width()
+    assert narrow < chart.decimator.buckets // 4
+    assert_one_bucket_per_pixel(chart)
+
+    chart.resize(1200, 300)
+    QtWidgets.QApplication.instance().processEvents()
+    assert chart.plot_width() > narrow * 2
+    assert_one_bucket_per_pixel(chart)
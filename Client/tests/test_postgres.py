@@ -0,0 +1,149 @@
+import io
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+from psycopg2.pool import PoolError
+
+from metrics import DB_QUERY_ERRORS
+from postgres import PostgresManager
+from row_models import PacketFilter
+
+
+@pytest.fixture
+def broken_db(monkeypatch):
+    db = PostgresManager({"dbname": "telemetry"})
+
+    @contextmanager
+    def connection():
+        raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        yield
+
+    monkeypatch.setattr(db, "_connection", connection)
+    return db
+
+
+@pytest.mark.parametrize("read, method", [
+    (lambda db: list(db.iter_session_packets(1)), "iter_session_packets"),
+    (lambda db: list(db.iter_filtered_packets(1, PacketFilter(counter_from=5))), "iter_filtered_packets"),
+    (lambda db: db.get_packets_after(1, 0), "get_packets_after"),
+])
+def test_stream_errors_reach_the_caller(broken_db, read, method):
+    errors = DB_QUERY_ERRORS.value(method=method)
+    with pytest.raises(psycopg2.OperationalError):
+        read(broken_db)
+    assert DB_QUERY_ERRORS.value(method=method) == errors + 1
+    assert not broken_db.is_connected
+
+
+class FakeConnection:
+    closed = 0
+    info = SimpleNamespace(transaction_status=psycopg2.extensions.TRANSACTION_STATUS_IDLE)
+
+    def __init__(self, copy):
+        self.copy = copy
+
+    def cursor(self):
+        return FakeCursor(self.copy)
+
+
+class FakeCursor:
+    def __init__(self, copy):
+        self.copy_expert = copy
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def mogrify(self, query, params):
+        return b"SELECT 1"
+
+
+def copy_db(monkeypatch, copy) -> PostgresManager:
+    db = PostgresManager({"dbname": "telemetry"})
+
+    @contextmanager
+    def connection():
+        yield FakeConnection(copy)
+
+    monkeypatch.setattr(db, "_connection", connection)
+    return db
+
+
+def test_copy_retries_a_stale_connection(monkeypatch):
+    calls = []
+
+    def copy(sql, out):
+        calls.append(sql)
+        if len(calls) == 1:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        out.write(b"Id\n1\n")
+
+    out = io.BytesIO()
+    copy_db(monkeypatch, copy).copy_session_packets(out, 1)
+    assert len(calls) == 2
+    assert out.getvalue() == b"Id\n1\n"
+
+
+def test_copy_is_not_retried_after_output_was_written(monkeypatch):
+    calls = []
+
+    def copy(sql, out):
+        calls.append(sql)
+        out.write(b"Id\n1\n")
+        raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    errors = DB_QUERY_ERRORS.value(method="copy_session_packets")
+    out = io.BytesIO()
+    with pytest.raises(psycopg2.OperationalError):
+        copy_db(monkeypatch, copy).copy_session_packets(out, 1)
+    assert len(calls) == 1
+    assert out.getvalue() == b"Id\n1\n"
+    assert DB_QUERY_ERRORS.value(method="copy_session_packets") == errors + 1
+
+
+class CountingPool:
+    def __init__(self, maxconn: int):
+        self.maxconn = maxconn
+        self.in_use = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def getconn(self):
+        with self.lock:
+            if self.in_use >= self.maxconn:
+                raise PoolError("connection pool exhausted")
+            self.in_use += 1
+            self.peak = max(self.peak, self.in_use)
+        return FakeConnection(None)
+
+    def putconn(self, conn, close=False):
+        with self.lock:
+            self.in_use -= 1
+
+
+def test_connections_wait_for_a_free_pool_slot():
+    db = PostgresManager({"dbname": "telemetry"}, max_connections=2)
+    db.pool = CountingPool(2)
+    failures = []
+
+    def query():
+        try:
+            with db._connection():
+                time.sleep(0.02)
+        except PoolError as e:
+            failures.append(e)
+
+    threads = [threading.Thread(target=query) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+    assert db.pool.peak == 2
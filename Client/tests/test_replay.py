@@ -0,0 +1,98 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from capture import CaptureRecorder
+from helpers import make_rows, to_packets
+from replay import CaptureReplaySource, ReplayEngine
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def source(tmp_path):
+    rows = np.concatenate((make_rows(np.arange(60), session_id=1), make_rows(np.arange(60, 100), session_id=2)))
+    path = str(tmp_path / "replay.tlmcap")
+    recorder = CaptureRecorder(path, chunk_packets=20, flush_interval=0.01)
+    for packet, arrival in zip(to_packets(rows), rows["timestamp"].tolist()):
+        recorder.record(packet, arrival)
+    recorder.close()
+
+    source = CaptureReplaySource(path)
+    yield source
+    source.close()
+
+
+class Collector:
+    def __init__(self):
+        self.batches = []
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    def sink(self, batch, arrivals):
+        with self.lock:
+            self.batches.append(batch.copy())
+
+    def on_sessions(self, session_ids):
+        self.sessions.extend(session_ids)
+
+    def counters(self):
+        with self.lock:
+            return np.concatenate([batch["counter"] for batch in self.batches]) if self.batches else np.empty(0)
+
+
+def test_max_speed_delivers_everything_in_order(source):
+    collector = Collector()
+    engine = ReplayEngine(source, collector.sink, collector.on_sessions, lambda: 0, speed=0, batch_size=7)
+    engine.start()
+    try:
+        wait_for(lambda: engine.finished)
+    finally:
+        engine.stop()
+
+    np.testing.assert_array_equal(collector.counters(), np.arange(100))
+    assert max(len(batch) for batch in collector.batches) <= 7
+    assert collector.sessions == [1, 2]
+    assert engine.packets_sent == 100
+    assert engine.error is None
+
+
+def test_seek_replays_from_offset(source):
+    collector = Collector()
+    engine = ReplayEngine(source, collector.sink, collector.on_sessions, lambda: 0, speed=0)
+    engine.start()
+    try:
+        wait_for(lambda: engine.finished)
+        collector.batches.clear()
+        engine.seek(25.0)
+        wait_for(lambda: len(collector.counters()) == 50)
+        wait_for(lambda: engine.finished)
+    finally:
+        engine.stop()
+
+    np.testing.assert_array_equal(collector.counters(), np.arange(50, 100))
+
+
+def test_backlog_throttles_delivery(source):
+    collector = Collector()
+    backlog = [10]
+    engine = ReplayEngine(source, collector.sink, collector.on_sessions, lambda: backlog[0],
+                          speed=0, max_backlog=10)
+    engine.start()
+    try:
+        time.sleep(0.1)
+        assert collector.counters().size == 0
+        backlog[0] = 0
+        wait_for(lambda: engine.finished)
+    finally:
+        engine.stop()
+
+    assert collector.counters().size == 100
@@ -0,0 +1,107 @@
+import numpy as np
+import psycopg2
+import pytest
+
+from checksum import compute_crc16
+from config import Config
+from helpers import make_rows
+from postgres import PostgresManager
+from row_models import (
+    STATUS_CRC_MISMATCH, STATUS_NEGATIVE_VALUE, STATUS_OK, PacketFilter, TelemetryPacket, packet_status,
+    queued_to_batch, rows_to_batch
+)
+
+
+FILTERS = [
+    PacketFilter(),
+    PacketFilter(time_from=1_760_000_010.0),
+    PacketFilter(time_to=1_760_000_010.0),
+    PacketFilter(time_from=1_760_000_005.0, time_to=1_760_000_020.5),
+    PacketFilter(payload_min=-0.5, payload_max=0.5),
+    PacketFilter(counter_from=10, counter_to=10),
+    PacketFilter(status=STATUS_OK),
+    PacketFilter(status=STATUS_NEGATIVE_VALUE),
+    PacketFilter(status=STATUS_CRC_MISMATCH),
+    PacketFilter(time_from=1_760_000_005.0, payload_max=0.0, counter_to=60, status=STATUS_NEGATIVE_VALUE),
+]
+
+
+@pytest.fixture
+def mixed_rows():
+    batch = make_rows(np.arange(100))
+    records = batch[["id", "counter", "timestamp", "payload", "crc16", "session_id"]].tolist()
+    for index in (3, 17, 42):
+        records[index] = records[index][:4] + ((records[index][4] + 1) % 65536,) + records[index][5:]
+    return rows_to_batch(records)
+
+
+def test_status_from_payload_and_crc(mixed_rows):
+    assert (mixed_rows["status"][[3, 17, 42]] == STATUS_CRC_MISMATCH).all()
+    valid = np.ones(len(mixed_rows), dtype=bool)
+    valid[[3, 17, 42]] = False
+    expected = np.where(mixed_rows["payload"] < 0, STATUS_NEGATIVE_VALUE, STATUS_OK)
+    np.testing.assert_array_equal(mixed_rows["status"][valid], expected[valid])
+
+
+def test_packet_status_matches_batch(mixed_rows):
+    names = {STATUS_OK: "OK", STATUS_NEGATIVE_VALUE: "NegativeValue", STATUS_CRC_MISMATCH: "CrcMismatch"}
+    for row in mixed_rows:
+        packet = TelemetryPacket(*(row[name].item() for name in ("id", "counter", "timestamp", "payload",
+                                                                 "crc16", "session_id")))
+        assert packet_status(packet) == names[int(row["status"])]
+
+
+def test_mask_bounds_are_inclusive(mixed_rows):
+    packet_filter = PacketFilter(counter_from=10, counter_to=12)
+    np.testing.assert_array_equal(packet_filter.apply(mixed_rows)["counter"], [10, 11, 12])
+    assert PacketFilter().apply(mixed_rows) is mixed_rows
+
+
+def test_queued_to_batch_keeps_order():
+    batch = make_rows(np.arange(5))
+    packet = TelemetryPacket(99, 5, 1_760_000_002.5, 0.25, compute_crc16(0.25, 5, 1_760_000_002.5), 1)
+    merged = queued_to_batch([batch[:2], packet, batch[2:]])
+    np.testing.assert_array_equal(merged["counter"], [0, 1, 5, 2, 3, 4])
+    assert merged["status"][2] == STATUS_OK
+
+
+@pytest.fixture
+def db_session(mixed_rows):
+    if not Config.DB_CONFIG.get("dbname"):
+        pytest.skip("БД не настроена")
+    db = PostgresManager(dict(Config.DB_CONFIG), max_connections=2)
+    try:
+        db.connect()
+    except psycopg2.Error as e:
+        pytest.skip(f"БД недоступна: {e}")
+
+    session_id = 900_000_001
+    rows = mixed_rows.copy()
+    rows["id"] += session_id * 1000
+    rows["session_id"] = session_id
+    with db._connection() as conn, conn.cursor() as cursor:
+        cursor.execute('DELETE FROM public."Packets" WHERE "SessionId" = %s', (session_id,))
+        cursor.execute('DELETE FROM public."Sessions" WHERE "Id" = %s', (session_id,))
+        cursor.execute('INSERT INTO public."Sessions" ("Id", "StartTime", "EndTime", "Name") '
+                       "VALUES (%s, now(), now(), 'pytest')", (session_id,))
+        cursor.executemany(
+            'INSERT INTO public."Packets" ("Id", "PacketCounter", "Timestamp", "Payload", "Crc16", '
+            '"SyncMarker", "SessionId") VALUES (%s, %s, %s, %s, %s, 0, %s)',
+            [tuple(row[name].item() for name in ("id", "counter", "timestamp", "payload", "crc16", "session_id"))
+             for row in rows]
+        )
+    try:
+        yield db, session_id, rows
+    finally:
+        with db._connection() as conn, conn.cursor() as cursor:
+            cursor.execute('DELETE FROM public."Packets" WHERE "SessionId" = %s', (session_id,))
+            cursor.execute('DELETE FROM public."Sessions" WHERE "Id" = %s', (session_id,))
+        db.close()
+
+
+@pytest.mark.parametrize("packet_filter", FILTERS)
+def test_mask_matches_sql(db_session, packet_filter):
+    db, session_id, rows = db_session
+    fetched = list(db.iter_filtered_packets(session_id, packet_filter, page_size=17, first_page_size=5))
+    ids = np.concatenate([batch["id"] for batch in fetched]) if fetched else np.empty(0, dtype=np.int64)
+    np.testing.assert_array_equal(ids, packet_filter.apply(rows)["id"])
@@ -0,0 +1,74 @@
+import numpy as np
+
+from sequence_tracker import SequenceTracker
+
+
+def feed(tracker: SequenceTracker, counters):
+    for counter in counters:
+        tracker.add(counter, None, 0.0)
+
+
+def test_in_order_stream_has_no_loss():
+    tracker = SequenceTracker()
+    feed(tracker, range(10, 20))
+    stats = tracker.stats()
+    assert (stats.received, stats.expected, stats.missing, stats.gap_count) == (10, 10, 0, 0)
+
+
+def test_gap_is_recorded_and_filled_by_late_packets():
+    tracker = SequenceTracker()
+    feed(tracker, [0, 1, 2, 6, 7])
+    assert tracker.gaps() == [(3, 5)]
+    assert tracker.stats().missing == 3
+
+    feed(tracker, [4])
+    assert tracker.gaps() == [(3, 3), (5, 5)]
+    feed(tracker, [3, 5])
+    stats = tracker.stats()
+    assert tracker.gaps() == []
+    assert (stats.missing, stats.reordered, stats.received) == (0, 3, 8)
+
+
+def test_duplicates_are_rejected():
+    tracker = SequenceTracker()
+    feed(tracker, [0, 1, 2])
+    feed(tracker, [1, 2])
+    stats = tracker.stats()
+    assert (stats.duplicates, stats.received) == (2, 3)
+
+
+def test_add_batch_returns_accept_mask():
+    tracker = SequenceTracker()
+    counters = np.arange(5)
+    assert tracker.add_batch(counters, counters * 1.0, counters * 1.0).all()
+
+    counters = np.array([3, 4, 5, 6])
+    mask = tracker.add_batch(counters, counters * 1.0, counters * 1.0)
+    np.testing.assert_array_equal(mask, [False, False, True, True])
+    assert tracker.stats().duplicates == 2
+    assert len(tracker.add_batch(np.empty(0, dtype=np.int32), np.empty(0), np.empty(0))) == 0
+
+
+def test_backfill_fills_gaps_and_skips_received():
+    tracker = SequenceTracker()
+    feed(tracker, list(range(0, 40)) + list(range(70, 80)))
+    assert tracker.gaps() == [(40, 69)]
+
+    accepted = tracker.backfill(np.arange(40, 100))
+    assert accepted.sum() == 50
+    assert not accepted[30:40].any()
+    stats = tracker.stats()
+    assert tracker.gaps() == []
+    assert (stats.received, stats.backfilled, stats.missing, stats.duplicates) == (100, 50, 0, 0)
+
+    assert not tracker.backfill(np.arange(40, 100)).any()
+    assert tracker.stats().duplicates == 0
+
+
+def test_reset():
+    tracker = SequenceTracker()
+    feed(tracker, [0, 5])
+    tracker.reset()
+    stats = tracker.stats()
+    assert (stats.received, stats.missing, stats.backfilled) == (0, 0, 0)
+    assert tracker.gaps() == []
@@ -0,0 +1,72 @@
+import logging
+
+import msgpack
+import pytest
+
+from checksum import compute_crc16
+from row_models import TelemetryPacket
+
+pytest.importorskip("signalrcore")
+
+from server_connection import TelemetryMessagePackProtocol
+
+
+def frame(*messages: bytes) -> bytes:
+    framed = bytearray()
+    for message in messages:
+        length = len(message)
+        while True:
+            byte = length & 0x7F
+            length >>= 7
+            framed.append(byte | (0x80 if length else 0))
+            if not length:
+                break
+        framed += message
+    return bytes(framed)
+
+
+def new_packet(counter: int, argument=None) -> bytes:
+    timestamp, payload = 1_760_000_000.0 + counter, 0.25
+    if argument is None:
+        argument = {
+            "Id": counter + 1,
+            "PacketCounter": counter,
+            "Timestamp": timestamp,
+            "Payload": payload,
+            "Crc16": compute_crc16(payload, counter, timestamp),
+            "SessionId": 9,
+        }
+    return msgpack.packb([1, {}, None, "NewPacket", [argument], []])
+
+
+def test_parse_messages_decodes_packets():
+    messages = TelemetryMessagePackProtocol().parse_messages(frame(new_packet(0), new_packet(1)))
+
+    packets = [message.arguments[0] for message in messages]
+    assert all(isinstance(packet, TelemetryPacket) for packet in packets)
+    assert [(packet.counter, packet.session_id) for packet in packets] == [(0, 9), (1, 9)]
+
+
+def test_malformed_message_is_skipped_not_the_frame(caplog):
+    raw = frame(
+        new_packet(0),
+        b"\xc1",
+        new_packet(1, argument=42),
+        msgpack.packb([6]),
+        new_packet(2),
+    )
+    with caplog.at_level(logging.ERROR):
+        messages = TelemetryMessagePackProtocol().parse_messages(raw)
+
+    packets = [message.arguments[0] for message in messages if getattr(message, "target", None) == "NewPacket"]
+    assert [packet.counter for packet in packets] == [0, 2]
+    assert len(messages) == 3
+    assert len(caplog.records) == 2
+
+
+def test_truncated_length_keeps_decoded_messages(caplog):
+    with caplog.at_level(logging.ERROR):
+        messages = TelemetryMessagePackProtocol().parse_messages(frame(new_packet(0)) + b"\x80")
+
+    assert [message.arguments[0].counter for message in messages] == [0]
+    assert len(caplog.records) == 1
@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+import pytest
+
+from row_models import SessionSummary
+from session_cache import META_FILE, SessionCache
+
+
+def entry_size(cache: SessionCache, session_id: int) -> int:
+    path = cache._entry_path(session_id)
+    return sum(entry.stat().st_size for entry in os.scandir(path))
+
+
+def set_mtime(cache: SessionCache, session_id: int, mtime: float) -> None:
+    os.utime(os.path.join(cache._entry_path(session_id), META_FILE), (mtime, mtime))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SessionCache(str(tmp_path / "cache"), max_bytes=1 << 30)
+
+
+def test_round_trip(cache, rows):
+    summary = SessionSummary(session_id=7, packet_count=len(rows), payload_min=-1.0, payload_max=1.0)
+    cache.put(7, rows, summary)
+
+    cached = cache.get(7)
+    assert cached is not None
+    assert len(cached) == len(rows)
+    assert cached.summary == summary
+    np.testing.assert_array_equal(cached.to_batch(), rows)
+
+
+def test_missing_entry(cache):
+    assert cache.get(1) is None
+
+
+def test_evicts_least_recently_used(cache, rows):
+    cache.put(1, rows)
+    cache.put(2, rows)
+    set_mtime(cache, 1, 1000)
+    set_mtime(cache, 2, 2000)
+    assert cache.get(1) is not None
+
+    cache.max_bytes = int(entry_size(cache, 1) * 2.5)
+    cache.put(3, rows)
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert cache.get(3) is not None
+
+
+def test_truncated_column_is_discarded(cache, rows):
+    cache.put(5, rows)
+    column = os.path.join(cache._entry_path(5), "payload.npy")
+    with open(column, "r+b") as file:
+        file.truncate(os.path.getsize(column) - 16)
+
+    assert cache.get(5) is None
+    assert not os.path.exists(cache._entry_path(5))
+
+
+def test_mismatched_meta_is_discarded(cache, rows):
+    cache.put(5, rows)
+    with open(os.path.join(cache._entry_path(5), META_FILE), "w", encoding="utf-8") as file:
+        file.write('{"version": 1, "session_id": 6, "packet_count": 100}')
+
+    assert cache.get(5) is None
+    assert not os.path.exists(cache._entry_path(5))
+
+
+def test_unreadable_meta_is_discarded(cache, rows):
+    cache.put(5, rows)
+    with open(os.path.join(cache._entry_path(5), META_FILE), "w", encoding="utf-8") as file:
+        file.write("{")
+
+    assert cache.get(5) is None
+
+
+def test_stale_staging_directories_are_removed(tmp_path, rows):
+    directory = tmp_path / "cache"
+    (directory / ".session_9_abc").mkdir(parents=True)
+    SessionCache(str(directory), max_bytes=1 << 30)
+    assert not (directory / ".session_9_abc").exists()
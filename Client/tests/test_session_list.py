@@ -0,0 +1,90 @@
+import pytest
+
+pytest.importorskip("PySide6.QtCore")
+
+from row_models import Session
+from session_list import SESSION_ID_ROLE, SESSION_ROLE, SessionListModel
+
+
+def sessions(*ids, active=()) -> list:
+    return [Session(i, f"s{i}", 1_760_000_000.0 + i, None if i in active else 1_760_000_100.0 + i) for i in ids]
+
+
+def ids(model: SessionListModel) -> list:
+    return [model.data(model.index(row), SESSION_ID_ROLE) for row in range(model.rowCount())]
+
+
+@pytest.fixture
+def model():
+    model = SessionListModel()
+    model.set_sessions(sessions(3, 5, 4, active=(5,)), page_size=3)
+    return model
+
+
+def test_set_sessions_orders_newest_first(model):
+    assert ids(model) == [5, 4, 3]
+    assert model.newest_id == 5
+    assert model.active_ids == [5]
+    assert model.data(model.index(0)).endswith("Активна)")
+    assert model.data(model.index(0)).startswith("5: s5 (")
+    assert model.data(model.index(1), SESSION_ROLE) == model.session(model.index(1))
+    assert model.session(model.index(-1)) is None
+
+
+def test_fetch_more_requests_one_page_at_a_time(model):
+    requested = []
+    model.older_requested.connect(requested.append)
+
+    assert model.canFetchMore()
+    model.fetchMore()
+    model.fetchMore()
+    assert requested == [3]
+    assert not model.canFetchMore()
+
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.append_older(sessions(4, 2, 1), page_size=3)
+    assert ids(model) == [5, 4, 3, 2, 1]
+    assert inserted == [(3, 4)]
+    assert model.canFetchMore()
+
+    model.fetchMore()
+    model.append_older([], page_size=3)
+    assert not model.canFetchMore()
+    assert requested == [3, 1]
+
+
+def test_failed_fetch_can_be_retried(model):
+    requested = []
+    model.older_requested.connect(requested.append)
+    model.fetchMore()
+    model.older_failed()
+    model.fetchMore()
+    assert requested == [3, 3]
+
+
+def test_short_first_page_has_nothing_older():
+    model = SessionListModel()
+    model.set_sessions(sessions(1, 2), page_size=3)
+    assert not model.canFetchMore()
+
+
+def test_merge_updates_rows_and_prepends_newer(model):
+    changed, inserted = [], []
+    model.dataChanged.connect(lambda first, last, roles=None: changed.append(first.row()))
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    model.merge(sessions(5) + sessions(7, 6, active=(7,)) + sessions(1))
+
+    assert ids(model) == [7, 6, 5, 4, 3]
+    assert changed == [0]
+    assert inserted == [(0, 1)]
+    assert model.active_ids == [7]
+    assert model.data(model.index(2)).startswith("5: s5 (")
+    assert not model.data(model.index(2)).endswith("Активна)")
+
+
+def test_merge_into_empty_model():
+    model = SessionListModel()
+    model.merge(sessions(2, 1))
+    assert ids(model) == [2, 1]
@@ -0,0 +1,26 @@
+import math
+from datetime import datetime
+
+import numpy as np
+
+from time_format import MISSING_TIME, TIME_FORMAT, format_timestamp, format_timestamps
+
+
+def test_missing_values():
+    for value in (None, 0, 0.0, math.nan):
+        assert format_timestamp(value) == MISSING_TIME
+
+
+def test_seconds_and_milliseconds():
+    timestamp = 1_760_000_000.9876
+    text = datetime.fromtimestamp(1_760_000_000).strftime(TIME_FORMAT)
+    assert format_timestamp(timestamp) == text
+    assert format_timestamp(timestamp, milliseconds=True) == f"{text}.987"
+
+
+def test_vectorized_matches_scalar():
+    timestamps = np.array([1_760_000_000.0, 1_760_000_000.5, 1_760_000_001.999, 0.0, np.nan, 1_700_000_000.25])
+    for milliseconds in (False, True):
+        expected = [format_timestamp(None if np.isnan(value) else float(value), milliseconds)
+                    for value in timestamps]
+        assert format_timestamps(timestamps, milliseconds).tolist() == expected
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from workers import AsyncTaskRunner, TaskRunner
+
+
+@pytest.fixture
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def spin_until(app, condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class Calls:
+    def __init__(self):
+        self.events = []
+        self.threads = set()
+
+    def record(self, name):
+        def callback(*args):
+            self.threads.add(threading.current_thread())
+            self.events.append((name,) + args)
+        return callback
+
+    def callbacks(self, chunks: bool = True) -> dict:
+        callbacks = dict(on_result=self.record("result"), on_error=self.record("error"),
+                         on_finished=self.record("finished"))
+        if chunks:
+            callbacks["on_chunk"] = self.record("chunk")
+        return callbacks
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.events) and self.events[-1] == ("finished",)
+
+
+@pytest.fixture
+def tasks(app):
+    runner = TaskRunner(max_threads=2)
+    yield runner
+    runner.shutdown()
+
+
+def test_result_and_finished_arrive_on_the_gui_thread(app, tasks):
+    calls = Calls()
+    tasks.submit("sum", sum, [1, 2, 3], **calls.callbacks())
+    assert tasks.is_busy("sum")
+
+    assert spin_until(app, lambda: calls.finished)
+    assert calls.events == [("result", 6), ("finished",)]
+    assert calls.threads == {threading.main_thread()}
+    assert not tasks.is_busy("sum")
+
+
+def test_generator_results_stream_as_chunks(app, tasks):
+    calls = Calls()
+    tasks.submit("pages", lambda: (page for page in range(3)), **calls.callbacks())
+
+    assert spin_until(app, lambda: calls.finished)
+    assert calls.events == [("chunk", 0), ("chunk", 1), ("chunk", 2), ("finished",)]
+
+
+def test_errors_are_reported_before_finished(app, tasks):
+    calls = Calls()
+
+    def fail():
+        raise ValueError("нет соединения")
+
+    tasks.submit(None, fail, **calls.callbacks())
+    assert spin_until(app, lambda: calls.finished)
+    assert calls.events == [("error", "нет соединения"), ("finished",)]
+
+
+def test_resubmitting_a_key_cancels_the_previous_task(app, tasks):
+    release = threading.Event()
+    first, second = Calls(), Calls()
+
+    def slow():
+        release.wait(5)
+        return "first"
+
+    tasks.submit("load", slow, **first.callbacks())
+    tasks.submit("load", lambda: "second", **second.callbacks())
+    assert spin_until(app, lambda: second.finished)
+    release.set()
+    assert spin_until(app, lambda: not tasks._running)
+
+    assert first.events == []
+    assert second.events == [("result", "second"), ("finished",)]
+    assert not tasks.is_busy("load")
+
+
+def test_cancel_closes_a_running_generator(app, tasks):
+    closed = threading.Event()
+    produced = threading.Event()
+    calls = Calls()
+
+    def pages():
+        try:
+            while True:
+                produced.set()
+                yield 1
+                time.sleep(0.01)
+        finally:
+            closed.set()
+
+    tasks.submit("pages", pages, **calls.callbacks())
+    assert produced.wait(5)
+    tasks.cancel("pages")
+
+    assert closed.wait(5)
+    assert spin_until(app, lambda: not tasks._running)
+    assert ("finished",) not in calls.events
+    assert not tasks.is_busy("pages")
+
+
+@pytest.fixture
+def async_tasks(app):
+    runner = AsyncTaskRunner()
+    yield runner
+    runner.shutdown(1.0)
+
+
+def test_async_result_and_finished(app, async_tasks):
+    calls = Calls()
+
+    async def fetch(value):
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async_tasks.submit("fetch", fetch, 21, **calls.callbacks(chunks=False))
+    assert spin_until(app, lambda: calls.finished)
+    assert calls.events == [("result", 42), ("finished",)]
+    assert calls.threads == {threading.main_thread()}
+
+
+def test_async_error_without_message_uses_the_type_name(app, async_tasks):
+    calls = Calls()
+
+    async def fail():
+        raise asyncio.TimeoutError()
+
+    async_tasks.submit(None, fail, **calls.callbacks(chunks=False))
+    assert spin_until(app, lambda: calls.finished)
+    assert calls.events == [("error", "TimeoutError"), ("finished",)]
+
+
+def test_async_resubmit_cancels_the_running_coroutine(app, async_tasks):
+    started, cancelled = threading.Event(), threading.Event()
+    first, second = Calls(), Calls()
+
+    async def hang():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def done():
+        return "done"
+
+    async_tasks.submit("stop", hang, **first.callbacks(chunks=False))
+    assert started.wait(5)
+    async_tasks.submit("stop", done, **second.callbacks(chunks=False))
+
+    assert spin_until(app, lambda: second.finished)
+    assert cancelled.wait(5)
+    assert spin_until(app, lambda: len(async_tasks._running) == 0)
+    assert first.events == []
+    assert not async_tasks.is_busy("stop")
+
+
+def test_async_shutdown_runs_closers_and_stops_the_loop(app):
+    runner = AsyncTaskRunner()
+    closed = []
+
+    async def close():
+        closed.append(threading.current_thread().name)
+
+    runner.shutdown(1.0, close)
+    assert closed == ["asyncio-loop"]
+    assert not runner.thread.is_alive()
@@ -0,0 +1,46 @@
+import math
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from config import Config
+
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+MISSING_TIME = "N/A"
+
+
+@lru_cache(maxsize=Config.TIME_FORMAT_CACHE_SIZE)
+def format_second(second: int) -> str:
+    try:
+        return datetime.fromtimestamp(second).strftime(TIME_FORMAT)
+    except (OverflowError, OSError, ValueError):
+        return MISSING_TIME
+
+
+def format_timestamp(timestamp: Optional[float], milliseconds: bool = False) -> str:
+    if not timestamp or math.isnan(timestamp):
+        return MISSING_TIME
+
+    second = math.floor(timestamp)
+    text = format_second(second)
+    if milliseconds and text != MISSING_TIME:
+        return f"{text}.{min(int((timestamp - second) * 1000), 999):03d}"
+    return text
+
+
+def format_timestamps(timestamps: np.ndarray, milliseconds: bool = False) -> np.ndarray:
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    valid = np.isfinite(timestamps) & (timestamps != 0)
+    timestamps = np.where(valid, timestamps, 0)
+    seconds = np.floor(timestamps)
+
+    unique, inverse = np.unique(seconds, return_inverse=True)
+    texts = np.array([format_second(int(second)) for second in unique], dtype=object)[inverse]
+    if milliseconds:
+        fractions = np.minimum(((timestamps - seconds) * 1000).astype(np.int64), 999)
+        texts = texts + np.char.add(".", np.char.zfill(fractions.astype(str), 3)).astype(object)
+    texts[~valid] = MISSING_TIME
+    return texts
@@ -15,12 +15,16 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractScrollArea, QApplication, QHeaderView, QLabel,
-    QLayout, QListWidget, QListWidgetItem, QMainWindow,
-    QPushButton, QSizePolicy, QStatusBar, QTabWidget,
-    QTableWidgetItem, QVBoxLayout, QWidget)
+from PySide6.QtWidgets import (QAbstractScrollArea, QApplication, QCheckBox, QComboBox,
+    QDateTimeEdit, QDoubleSpinBox, QGridLayout, QGroupBox,
+    QHBoxLayout, QHeaderView, QLabel, QLayout,
+    QListView, QMainWindow, QPushButton, QSizePolicy,
+    QSlider, QSpinBox, QStatusBar, QTabWidget,
+    QVBoxLayout, QWidget)
 
 from custom_table import PacketTable
+from diagnostics import DiagnosticsView
+from payload_chart import (HistoryPayloadChart, LivePayloadChart)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -83,6 +87,87 @@ class Ui_MainWindow(object):
 
         self.verticalLayout_4.addLayout(self.verticalLayout)
 
+        self.horizontalLayout_replay = QHBoxLayout()
+        self.horizontalLayout_replay.setObjectName(u"horizontalLayout_replay")
+        self.btnReplayCapture = QPushButton(self.tab_3)
+        self.btnReplayCapture.setObjectName(u"btnReplayCapture")
+
+        self.horizontalLayout_replay.addWidget(self.btnReplayCapture)
+
+        self.cmbReplaySpeed = QComboBox(self.tab_3)
+        self.cmbReplaySpeed.addItem("")
+        self.cmbReplaySpeed.addItem("")
+        self.cmbReplaySpeed.addItem("")
+        self.cmbReplaySpeed.addItem("")
+        self.cmbReplaySpeed.addItem("")
+        self.cmbReplaySpeed.addItem("")
+        self.cmbReplaySpeed.setObjectName(u"cmbReplaySpeed")
+
+        self.horizontalLayout_replay.addWidget(self.cmbReplaySpeed)
+
+        self.btnReplayPause = QPushButton(self.tab_3)
+        self.btnReplayPause.setObjectName(u"btnReplayPause")
+        self.btnReplayPause.setEnabled(False)
+        self.btnReplayPause.setCheckable(True)
+
+        self.horizontalLayout_replay.addWidget(self.btnReplayPause)
+
+        self.sliderReplay = QSlider(self.tab_3)
+        self.sliderReplay.setObjectName(u"sliderReplay")
+        self.sliderReplay.setEnabled(False)
+        self.sliderReplay.setMaximum(1000)
+        self.sliderReplay.setOrientation(Qt.Orientation.Horizontal)
+
+        self.horizontalLayout_replay.addWidget(self.sliderReplay)
+
+        self.lblReplayPosition = QLabel(self.tab_3)
+        self.lblReplayPosition.setObjectName(u"lblReplayPosition")
+
+        self.horizontalLayout_replay.addWidget(self.lblReplayPosition)
+
+        self.btnReplayStop = QPushButton(self.tab_3)
+        self.btnReplayStop.setObjectName(u"btnReplayStop")
+        self.btnReplayStop.setEnabled(False)
+
+        self.horizontalLayout_replay.addWidget(self.btnReplayStop)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_replay)
+
+        self.horizontalLayout_live = QHBoxLayout()
+        self.horizontalLayout_live.setObjectName(u"horizontalLayout_live")
+        self.lblLiveSession = QLabel(self.tab_3)
+        self.lblLiveSession.setObjectName(u"lblLiveSession")
+
+        self.horizontalLayout_live.addWidget(self.lblLiveSession)
+
+        self.cmbLiveSession = QComboBox(self.tab_3)
+        self.cmbLiveSession.setObjectName(u"cmbLiveSession")
+        sizePolicy2.setHeightForWidth(self.cmbLiveSession.sizePolicy().hasHeightForWidth())
+        self.cmbLiveSession.setSizePolicy(sizePolicy2)
+
+        self.horizontalLayout_live.addWidget(self.cmbLiveSession)
+
+        self.btnCapture = QPushButton(self.tab_3)
+        self.btnCapture.setObjectName(u"btnCapture")
+        self.btnCapture.setCheckable(True)
+
+        self.horizontalLayout_live.addWidget(self.btnCapture)
+
+        self.chkMilliseconds = QCheckBox(self.tab_3)
+        self.chkMilliseconds.setObjectName(u"chkMilliseconds")
+
+        self.horizontalLayout_live.addWidget(self.chkMilliseconds)
+
+        self.btnUnwatchSession = QPushButton(self.tab_3)
+        self.btnUnwatchSession.setObjectName(u"btnUnwatchSession")
+        self.btnUnwatchSession.setEnabled(False)
+
+        self.horizontalLayout_live.addWidget(self.btnUnwatchSession)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_live)
+
         self.PacketTableWidget = PacketTable(self.tab_3)
         self.PacketTableWidget.setObjectName(u"PacketTableWidget")
         self.PacketTableWidget.setEnabled(True)
@@ -101,18 +186,154 @@ class Ui_MainWindow(object):
 
         self.verticalLayout_5.addWidget(self.btnRefreshSessions)
 
+        self.btnExportSession = QPushButton(self.tab_4)
+        self.btnExportSession.setObjectName(u"btnExportSession")
+        self.btnExportSession.setEnabled(False)
+
+        self.verticalLayout_5.addWidget(self.btnExportSession)
+
+        self.btnWatchSession = QPushButton(self.tab_4)
+        self.btnWatchSession.setObjectName(u"btnWatchSession")
+        self.btnWatchSession.setEnabled(False)
+
+        self.verticalLayout_5.addWidget(self.btnWatchSession)
+
+        self.btnReplaySession = QPushButton(self.tab_4)
+        self.btnReplaySession.setObjectName(u"btnReplaySession")
+        self.btnReplaySession.setEnabled(False)
+
+        self.verticalLayout_5.addWidget(self.btnReplaySession)
+
+        self.chkHistoryTail = QCheckBox(self.tab_4)
+        self.chkHistoryTail.setObjectName(u"chkHistoryTail")
+        self.chkHistoryTail.setEnabled(False)
+        self.chkHistoryTail.setChecked(True)
+
+        self.verticalLayout_5.addWidget(self.chkHistoryTail)
+
         self.lblSessionInfo = QLabel(self.tab_4)
         self.lblSessionInfo.setObjectName(u"lblSessionInfo")
 
         self.verticalLayout_5.addWidget(self.lblSessionInfo)
 
-        self.listSessions = QListWidget(self.tab_4)
+        self.listSessions = QListView(self.tab_4)
         self.listSessions.setObjectName(u"listSessions")
         sizePolicy.setHeightForWidth(self.listSessions.sizePolicy().hasHeightForWidth())
         self.listSessions.setSizePolicy(sizePolicy)
+        self.listSessions.setUniformItemSizes(True)
 
         self.verticalLayout_5.addWidget(self.listSessions)
 
+        self.grpHistoryFilter = QGroupBox(self.tab_4)
+        self.grpHistoryFilter.setObjectName(u"grpHistoryFilter")
+        self.gridLayout_filter = QGridLayout(self.grpHistoryFilter)
+        self.gridLayout_filter.setObjectName(u"gridLayout_filter")
+        self.chkFilterTime = QCheckBox(self.grpHistoryFilter)
+        self.chkFilterTime.setObjectName(u"chkFilterTime")
+
+        self.gridLayout_filter.addWidget(self.chkFilterTime, 0, 0, 1, 1)
+
+        self.dtFilterFrom = QDateTimeEdit(self.grpHistoryFilter)
+        self.dtFilterFrom.setObjectName(u"dtFilterFrom")
+        self.dtFilterFrom.setEnabled(False)
+        self.dtFilterFrom.setCalendarPopup(True)
+
+        self.gridLayout_filter.addWidget(self.dtFilterFrom, 0, 1, 1, 1)
+
+        self.lblFilterTimeTo = QLabel(self.grpHistoryFilter)
+        self.lblFilterTimeTo.setObjectName(u"lblFilterTimeTo")
+
+        self.gridLayout_filter.addWidget(self.lblFilterTimeTo, 0, 2, 1, 1)
+
+        self.dtFilterTo = QDateTimeEdit(self.grpHistoryFilter)
+        self.dtFilterTo.setObjectName(u"dtFilterTo")
+        self.dtFilterTo.setEnabled(False)
+        self.dtFilterTo.setCalendarPopup(True)
+
+        self.gridLayout_filter.addWidget(self.dtFilterTo, 0, 3, 1, 1)
+
+        self.chkFilterPayload = QCheckBox(self.grpHistoryFilter)
+        self.chkFilterPayload.setObjectName(u"chkFilterPayload")
+
+        self.gridLayout_filter.addWidget(self.chkFilterPayload, 1, 0, 1, 1)
+
+        self.spnPayloadMin = QDoubleSpinBox(self.grpHistoryFilter)
+        self.spnPayloadMin.setObjectName(u"spnPayloadMin")
+        self.spnPayloadMin.setEnabled(False)
+        self.spnPayloadMin.setDecimals(4)
+        self.spnPayloadMin.setMinimum(-1000000.000000000000000)
+        self.spnPayloadMin.setMaximum(1000000.000000000000000)
+        self.spnPayloadMin.setSingleStep(0.100000000000000)
+
+        self.gridLayout_filter.addWidget(self.spnPayloadMin, 1, 1, 1, 1)
+
+        self.lblFilterPayloadTo = QLabel(self.grpHistoryFilter)
+        self.lblFilterPayloadTo.setObjectName(u"lblFilterPayloadTo")
+
+        self.gridLayout_filter.addWidget(self.lblFilterPayloadTo, 1, 2, 1, 1)
+
+        self.spnPayloadMax = QDoubleSpinBox(self.grpHistoryFilter)
+        self.spnPayloadMax.setObjectName(u"spnPayloadMax")
+        self.spnPayloadMax.setEnabled(False)
+        self.spnPayloadMax.setDecimals(4)
+        self.spnPayloadMax.setMinimum(-1000000.000000000000000)
+        self.spnPayloadMax.setMaximum(1000000.000000000000000)
+        self.spnPayloadMax.setSingleStep(0.100000000000000)
+
+        self.gridLayout_filter.addWidget(self.spnPayloadMax, 1, 3, 1, 1)
+
+        self.chkFilterCounter = QCheckBox(self.grpHistoryFilter)
+        self.chkFilterCounter.setObjectName(u"chkFilterCounter")
+
+        self.gridLayout_filter.addWidget(self.chkFilterCounter, 2, 0, 1, 1)
+
+        self.spnCounterFrom = QSpinBox(self.grpHistoryFilter)
+        self.spnCounterFrom.setObjectName(u"spnCounterFrom")
+        self.spnCounterFrom.setEnabled(False)
+        self.spnCounterFrom.setMaximum(2147483647)
+
+        self.gridLayout_filter.addWidget(self.spnCounterFrom, 2, 1, 1, 1)
+
+        self.lblFilterCounterTo = QLabel(self.grpHistoryFilter)
+        self.lblFilterCounterTo.setObjectName(u"lblFilterCounterTo")
+
+        self.gridLayout_filter.addWidget(self.lblFilterCounterTo, 2, 2, 1, 1)
+
+        self.spnCounterTo = QSpinBox(self.grpHistoryFilter)
+        self.spnCounterTo.setObjectName(u"spnCounterTo")
+        self.spnCounterTo.setEnabled(False)
+        self.spnCounterTo.setMaximum(2147483647)
+
+        self.gridLayout_filter.addWidget(self.spnCounterTo, 2, 3, 1, 1)
+
+        self.lblFilterStatus = QLabel(self.grpHistoryFilter)
+        self.lblFilterStatus.setObjectName(u"lblFilterStatus")
+
+        self.gridLayout_filter.addWidget(self.lblFilterStatus, 3, 0, 1, 1)
+
+        self.cmbFilterStatus = QComboBox(self.grpHistoryFilter)
+        self.cmbFilterStatus.addItem("")
+        self.cmbFilterStatus.addItem("")
+        self.cmbFilterStatus.addItem("")
+        self.cmbFilterStatus.addItem("")
+        self.cmbFilterStatus.setObjectName(u"cmbFilterStatus")
+
+        self.gridLayout_filter.addWidget(self.cmbFilterStatus, 3, 1, 1, 1)
+
+        self.btnResetFilter = QPushButton(self.grpHistoryFilter)
+        self.btnResetFilter.setObjectName(u"btnResetFilter")
+
+        self.gridLayout_filter.addWidget(self.btnResetFilter, 3, 2, 1, 1)
+
+        self.btnApplyFilter = QPushButton(self.grpHistoryFilter)
+        self.btnApplyFilter.setObjectName(u"btnApplyFilter")
+        self.btnApplyFilter.setEnabled(False)
+
+        self.gridLayout_filter.addWidget(self.btnApplyFilter, 3, 3, 1, 1)
+
+
+        self.verticalLayout_5.addWidget(self.grpHistoryFilter)
+
         self.HistoryPacketTableWidget = PacketTable(self.tab_4)
         self.HistoryPacketTableWidget.setObjectName(u"HistoryPacketTableWidget")
         sizePolicy.setHeightForWidth(self.HistoryPacketTableWidget.sizePolicy().hasHeightForWidth())
@@ -123,6 +344,36 @@ class Ui_MainWindow(object):
         self.verticalLayout_5.addWidget(self.HistoryPacketTableWidget)
 
         self.tabWidget.addTab(self.tab_4, "")
+        self.tab_charts = QWidget()
+        self.tab_charts.setObjectName(u"tab_charts")
+        self.verticalLayout_charts = QVBoxLayout(self.tab_charts)
+        self.verticalLayout_charts.setObjectName(u"verticalLayout_charts")
+        self.LivePayloadChart = LivePayloadChart(self.tab_charts)
+        self.LivePayloadChart.setObjectName(u"LivePayloadChart")
+
+        self.verticalLayout_charts.addWidget(self.LivePayloadChart)
+
+        self.HistoryPayloadChart = HistoryPayloadChart(self.tab_charts)
+        self.HistoryPayloadChart.setObjectName(u"HistoryPayloadChart")
+
+        self.verticalLayout_charts.addWidget(self.HistoryPayloadChart)
+
+        self.tabWidget.addTab(self.tab_charts, "")
+        self.tab_diagnostics = QWidget()
+        self.tab_diagnostics.setObjectName(u"tab_diagnostics")
+        self.verticalLayout_diagnostics = QVBoxLayout(self.tab_diagnostics)
+        self.verticalLayout_diagnostics.setObjectName(u"verticalLayout_diagnostics")
+        self.btnExportMetrics = QPushButton(self.tab_diagnostics)
+        self.btnExportMetrics.setObjectName(u"btnExportMetrics")
+
+        self.verticalLayout_diagnostics.addWidget(self.btnExportMetrics)
+
+        self.DiagnosticsView = DiagnosticsView(self.tab_diagnostics)
+        self.DiagnosticsView.setObjectName(u"DiagnosticsView")
+
+        self.verticalLayout_diagnostics.addWidget(self.DiagnosticsView)
+
+        self.tabWidget.addTab(self.tab_diagnostics, "")
         MainWindow.setCentralWidget(self.centralwidget)
         self.statusbar = QStatusBar(MainWindow)
         self.statusbar.setObjectName(u"statusbar")
@@ -147,9 +398,96 @@ class Ui_MainWindow(object):
         self.btnStop.setToolTip(QCoreApplication.translate("MainWindow", u"\u041f\u0440\u0438\u043e\u0441\u0442\u0430\u043d\u0430\u0432\u043b\u0438\u0432\u0430\u0435\u0442 \u0433\u0435\u043d\u0435\u0440\u0430\u0446\u0438\u044e \u0434\u0430\u043d\u043d\u044b\u0445", None))
 #endif // QT_CONFIG(tooltip)
         self.btnStop.setText(QCoreApplication.translate("MainWindow", u"\u041e\u0441\u0442\u0430\u043d\u043e\u0432\u0438\u0442\u044c \u043f\u0435\u0440\u0435\u0434\u0430\u0447\u0443 \u0434\u0430\u043d\u043d\u044b\u0445", None))
+#if QT_CONFIG(tooltip)
+        self.btnReplayCapture.setToolTip(QCoreApplication.translate("MainWindow", u"\u0412\u043e\u0441\u043f\u0440\u043e\u0438\u0437\u0432\u043e\u0434\u0438\u0442 \u0441\u043e\u0445\u0440\u0430\u043d\u0451\u043d\u043d\u044b\u0439 \u0436\u0443\u0440\u043d\u0430\u043b \u0437\u0430\u0445\u0432\u0430\u0442\u0430 \u0447\u0435\u0440\u0435\u0437 \u0436\u0438\u0432\u043e\u0439 \u043a\u043e\u043d\u0432\u0435\u0439\u0435\u0440", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnReplayCapture.setText(QCoreApplication.translate("MainWindow", u"\u041f\u043e\u0432\u0442\u043e\u0440 \u0437\u0430\u043f\u0438\u0441\u0438\u2026", None))
+        self.cmbReplaySpeed.setItemText(0, QCoreApplication.translate("MainWindow", u"1\u00d7", None))
+        self.cmbReplaySpeed.setItemText(1, QCoreApplication.translate("MainWindow", u"2\u00d7", None))
+        self.cmbReplaySpeed.setItemText(2, QCoreApplication.translate("MainWindow", u"5\u00d7", None))
+        self.cmbReplaySpeed.setItemText(3, QCoreApplication.translate("MainWindow", u"10\u00d7", None))
+        self.cmbReplaySpeed.setItemText(4, QCoreApplication.translate("MainWindow", u"100\u00d7", None))
+        self.cmbReplaySpeed.setItemText(5, QCoreApplication.translate("MainWindow", u"\u041c\u0430\u043a\u0441", None))
+
+#if QT_CONFIG(tooltip)
+        self.cmbReplaySpeed.setToolTip(QCoreApplication.translate("MainWindow", u"\u0421\u043a\u043e\u0440\u043e\u0441\u0442\u044c \u0432\u043e\u0441\u043f\u0440\u043e\u0438\u0437\u0432\u0435\u0434\u0435\u043d\u0438\u044f", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnReplayPause.setText(QCoreApplication.translate("MainWindow", u"\u041f\u0430\u0443\u0437\u0430", None))
+#if QT_CONFIG(tooltip)
+        self.sliderReplay.setToolTip(QCoreApplication.translate("MainWindow", u"\u041f\u043e\u0437\u0438\u0446\u0438\u044f \u0432\u043e\u0441\u043f\u0440\u043e\u0438\u0437\u0432\u0435\u0434\u0435\u043d\u0438\u044f", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblReplayPosition.setText("")
+        self.btnReplayStop.setText(QCoreApplication.translate("MainWindow", u"\u041e\u0441\u0442\u0430\u043d\u043e\u0432\u0438\u0442\u044c \u043f\u043e\u0432\u0442\u043e\u0440", None))
+        self.lblLiveSession.setText(QCoreApplication.translate("MainWindow", u"\u0421\u0435\u0441\u0441\u0438\u044f:", None))
+#if QT_CONFIG(tooltip)
+        self.cmbLiveSession.setToolTip(QCoreApplication.translate("MainWindow", u"\u0421\u0435\u0441\u0441\u0438\u044f, \u043f\u0430\u043a\u0435\u0442\u044b \u043a\u043e\u0442\u043e\u0440\u043e\u0439 \u043e\u0442\u043e\u0431\u0440\u0430\u0436\u0430\u044e\u0442\u0441\u044f \u0432 \u0442\u0430\u0431\u043b\u0438\u0446\u0435 \u0438 \u043d\u0430 \u0433\u0440\u0430\u0444\u0438\u043a\u0435", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.btnCapture.setToolTip(QCoreApplication.translate("MainWindow", u"\u0417\u0430\u043f\u0438\u0441\u044b\u0432\u0430\u0435\u0442 \u0432\u0441\u0435 \u043f\u0440\u0438\u043d\u044f\u0442\u044b\u0435 \u043f\u0430\u043a\u0435\u0442\u044b \u0432 \u043b\u043e\u043a\u0430\u043b\u044c\u043d\u044b\u0439 \u0436\u0443\u0440\u043d\u0430\u043b \u0437\u0430\u0445\u0432\u0430\u0442\u0430", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnCapture.setText(QCoreApplication.translate("MainWindow", u"\u0417\u0430\u043f\u0438\u0441\u044c \u043f\u043e\u0442\u043e\u043a\u0430", None))
+#if QT_CONFIG(tooltip)
+        self.chkMilliseconds.setToolTip(QCoreApplication.translate("MainWindow", u"\u041f\u043e\u043a\u0430\u0437\u044b\u0432\u0430\u0442\u044c \u0432\u0440\u0435\u043c\u044f \u043f\u0430\u043a\u0435\u0442\u043e\u0432 \u0441 \u043c\u0438\u043b\u043b\u0438\u0441\u0435\u043a\u0443\u043d\u0434\u0430\u043c\u0438 \u0432 \u0442\u0430\u0431\u043b\u0438\u0446\u0430\u0445", None))
+#endif // QT_CONFIG(tooltip)
+        self.chkMilliseconds.setText(QCoreApplication.translate("MainWindow", u"\u043c\u0441", None))
+        self.btnUnwatchSession.setText(QCoreApplication.translate("MainWindow", u"\u041f\u0440\u0435\u043a\u0440\u0430\u0442\u0438\u0442\u044c \u043d\u0430\u0431\u043b\u044e\u0434\u0435\u043d\u0438\u0435", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), QCoreApplication.translate("MainWindow", u"\u0420\u0435\u0436\u0438\u043c \u0440\u0435\u0430\u043b\u044c\u043d\u043e\u0433\u043e \u0432\u0440\u0435\u043c\u0435\u043d\u0438", None))
         self.btnRefreshSessions.setText(QCoreApplication.translate("MainWindow", u"\u041e\u0431\u043d\u043e\u0432\u0438\u0442\u044c \u0441\u0435\u0441\u0441\u0438\u0438", None))
+#if QT_CONFIG(tooltip)
+        self.btnExportSession.setToolTip(QCoreApplication.translate("MainWindow", u"\u0412\u044b\u0433\u0440\u0443\u0436\u0430\u0435\u0442 \u043f\u0430\u043a\u0435\u0442\u044b \u0432\u044b\u0431\u0440\u0430\u043d\u043d\u043e\u0439 \u0441\u0435\u0441\u0441\u0438\u0438 \u0432 \u0444\u0430\u0439\u043b NumPy \u0438\u043b\u0438 CSV", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnExportSession.setText(QCoreApplication.translate("MainWindow", u"\u042d\u043a\u0441\u043f\u043e\u0440\u0442 \u0441\u0435\u0441\u0441\u0438\u0438", None))
+#if QT_CONFIG(tooltip)
+        self.btnWatchSession.setToolTip(QCoreApplication.translate("MainWindow", u"\u041f\u043e\u0434\u043f\u0438\u0441\u044b\u0432\u0430\u0435\u0442\u0441\u044f \u043d\u0430 \u043f\u0430\u043a\u0435\u0442\u044b \u0432\u044b\u0431\u0440\u0430\u043d\u043d\u043e\u0439 \u0430\u043a\u0442\u0438\u0432\u043d\u043e\u0439 \u0441\u0435\u0441\u0441\u0438\u0438", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnWatchSession.setText(QCoreApplication.translate("MainWindow", u"\u041d\u0430\u0431\u043b\u044e\u0434\u0430\u0442\u044c \u0432 \u0440\u0435\u0430\u043b\u044c\u043d\u043e\u043c \u0432\u0440\u0435\u043c\u0435\u043d\u0438", None))
+#if QT_CONFIG(tooltip)
+        self.btnReplaySession.setToolTip(QCoreApplication.translate("MainWindow", u"\u0412\u043e\u0441\u043f\u0440\u043e\u0438\u0437\u0432\u043e\u0434\u0438\u0442 \u043f\u0430\u043a\u0435\u0442\u044b \u0432\u044b\u0431\u0440\u0430\u043d\u043d\u043e\u0439 \u0441\u0435\u0441\u0441\u0438\u0438 \u0438\u0437 \u0411\u0414 \u0447\u0435\u0440\u0435\u0437 \u0436\u0438\u0432\u043e\u0439 \u043a\u043e\u043d\u0432\u0435\u0439\u0435\u0440", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnReplaySession.setText(QCoreApplication.translate("MainWindow", u"\u0412\u043e\u0441\u043f\u0440\u043e\u0438\u0437\u0432\u0435\u0441\u0442\u0438 \u0441\u0435\u0441\u0441\u0438\u044e", None))
+#if QT_CONFIG(tooltip)
+        self.chkHistoryTail.setToolTip(QCoreApplication.translate("MainWindow", u"\u0414\u043e\u0433\u0440\u0443\u0436\u0430\u0435\u0442 \u043d\u043e\u0432\u044b\u0435 \u043f\u0430\u043a\u0435\u0442\u044b \u0430\u043a\u0442\u0438\u0432\u043d\u043e\u0439 \u0441\u0435\u0441\u0441\u0438\u0438 \u043f\u043e \u0443\u0432\u0435\u0434\u043e\u043c\u043b\u0435\u043d\u0438\u044f\u043c \u0411\u0414", None))
+#endif // QT_CONFIG(tooltip)
+        self.chkHistoryTail.setText(QCoreApplication.translate("MainWindow", u"\u0421\u043b\u0435\u0434\u0438\u0442\u044c \u0437\u0430 \u043d\u043e\u0432\u044b\u043c\u0438 \u043f\u0430\u043a\u0435\u0442\u0430\u043c\u0438", None))
         self.lblSessionInfo.setText(QCoreApplication.translate("MainWindow", u"\u0412\u044b\u0431\u0435\u0440\u0438\u0442\u0435 \u0441\u0435\u0441\u0441\u0438\u044e \u0434\u043b\u044f \u043f\u0440\u043e\u0441\u043c\u043e\u0442\u0440\u0430", None))
+        self.grpHistoryFilter.setTitle(QCoreApplication.translate("MainWindow", u"\u0424\u0438\u043b\u044c\u0442\u0440 \u043f\u0430\u043a\u0435\u0442\u043e\u0432", None))
+        self.chkFilterTime.setText(QCoreApplication.translate("MainWindow", u"\u0412\u0440\u0435\u043c\u044f \u0441", None))
+#if QT_CONFIG(tooltip)
+        self.chkFilterTime.setToolTip(QCoreApplication.translate("MainWindow", u"\u041e\u0433\u0440\u0430\u043d\u0438\u0447\u0438\u0442\u044c \u043f\u0430\u043a\u0435\u0442\u044b \u0438\u043d\u0442\u0435\u0440\u0432\u0430\u043b\u043e\u043c \u0432\u0440\u0435\u043c\u0435\u043d\u0438", None))
+#endif // QT_CONFIG(tooltip)
+        self.dtFilterFrom.setDisplayFormat(QCoreApplication.translate("MainWindow", u"yyyy-MM-dd HH:mm:ss", None))
+        self.lblFilterTimeTo.setText(QCoreApplication.translate("MainWindow", u"\u043f\u043e", None))
+        self.dtFilterTo.setDisplayFormat(QCoreApplication.translate("MainWindow", u"yyyy-MM-dd HH:mm:ss", None))
+        self.chkFilterPayload.setText(QCoreApplication.translate("MainWindow", u"\u0417\u043d\u0430\u0447\u0435\u043d\u0438\u0435 \u043e\u0442", None))
+#if QT_CONFIG(tooltip)
+        self.chkFilterPayload.setToolTip(QCoreApplication.translate("MainWindow", u"\u041e\u0433\u0440\u0430\u043d\u0438\u0447\u0438\u0442\u044c \u043f\u0430\u043a\u0435\u0442\u044b \u0434\u0438\u0430\u043f\u0430\u0437\u043e\u043d\u043e\u043c \u0437\u043d\u0430\u0447\u0435\u043d\u0438\u0439", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblFilterPayloadTo.setText(QCoreApplication.translate("MainWindow", u"\u0434\u043e", None))
+        self.chkFilterCounter.setText(QCoreApplication.translate("MainWindow", u"\u0421\u0447\u0451\u0442\u0447\u0438\u043a \u043e\u0442", None))
+#if QT_CONFIG(tooltip)
+        self.chkFilterCounter.setToolTip(QCoreApplication.translate("MainWindow", u"\u041e\u0433\u0440\u0430\u043d\u0438\u0447\u0438\u0442\u044c \u043f\u0430\u043a\u0435\u0442\u044b \u0434\u0438\u0430\u043f\u0430\u0437\u043e\u043d\u043e\u043c \u0441\u0447\u0451\u0442\u0447\u0438\u043a\u0430", None))
+#endif // QT_CONFIG(tooltip)
+        self.lblFilterCounterTo.setText(QCoreApplication.translate("MainWindow", u"\u0434\u043e", None))
+        self.lblFilterStatus.setText(QCoreApplication.translate("MainWindow", u"\u0421\u0442\u0430\u0442\u0443\u0441", None))
+        self.cmbFilterStatus.setItemText(0, QCoreApplication.translate("MainWindow", u"\u0412\u0441\u0435", None))
+        self.cmbFilterStatus.setItemText(1, QCoreApplication.translate("MainWindow", u"OK", None))
+        self.cmbFilterStatus.setItemText(2, QCoreApplication.translate("MainWindow", u"NegativeValue", None))
+        self.cmbFilterStatus.setItemText(3, QCoreApplication.translate("MainWindow", u"CrcMismatch", None))
+
+        self.btnResetFilter.setText(QCoreApplication.translate("MainWindow", u"\u0421\u0431\u0440\u043e\u0441\u0438\u0442\u044c", None))
+#if QT_CONFIG(tooltip)
+        self.btnApplyFilter.setToolTip(QCoreApplication.translate("MainWindow", u"\u041f\u043e\u0432\u0442\u043e\u0440\u043d\u043e \u0437\u0430\u043f\u0440\u0430\u0448\u0438\u0432\u0430\u0435\u0442 \u043f\u0430\u043a\u0435\u0442\u044b \u0432\u044b\u0431\u0440\u0430\u043d\u043d\u043e\u0439 \u0441\u0435\u0441\u0441\u0438\u0438 \u0441 \u0443\u0447\u0451\u0442\u043e\u043c \u0444\u0438\u043b\u044c\u0442\u0440\u0430", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnApplyFilter.setText(QCoreApplication.translate("MainWindow", u"\u041f\u0440\u0438\u043c\u0435\u043d\u0438\u0442\u044c \u0444\u0438\u043b\u044c\u0442\u0440", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), QCoreApplication.translate("MainWindow", u"\u0418\u0441\u0442\u043e\u0440\u0438\u044f \u0441\u0435\u0441\u0441\u0438\u0439", None))
+#if QT_CONFIG(tooltip)
+        self.HistoryPayloadChart.setToolTip(QCoreApplication.translate("MainWindow", u"\u041a\u043e\u043b\u0435\u0441\u043e \u043c\u044b\u0448\u0438 \u2014 \u043c\u0430\u0441\u0448\u0442\u0430\u0431, \u043f\u0435\u0440\u0435\u0442\u0430\u0441\u043a\u0438\u0432\u0430\u043d\u0438\u0435 \u2014 \u043f\u0440\u043e\u043a\u0440\u0443\u0442\u043a\u0430, \u0434\u0432\u043e\u0439\u043d\u043e\u0439 \u0449\u0435\u043b\u0447\u043e\u043a \u2014 \u0432\u0435\u0441\u044c \u0434\u0438\u0430\u043f\u0430\u0437\u043e\u043d", None))
+#endif // QT_CONFIG(tooltip)
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_charts), QCoreApplication.translate("MainWindow", u"\u0413\u0440\u0430\u0444\u0438\u043a\u0438", None))
+#if QT_CONFIG(tooltip)
+        self.btnExportMetrics.setToolTip(QCoreApplication.translate("MainWindow", u"\u0421\u043e\u0445\u0440\u0430\u043d\u044f\u0435\u0442 \u0442\u0435\u043a\u0443\u0449\u0438\u0435 \u043c\u0435\u0442\u0440\u0438\u043a\u0438 \u0432 \u0442\u0435\u043a\u0441\u0442\u043e\u0432\u043e\u043c \u0444\u043e\u0440\u043c\u0430\u0442\u0435 Prometheus", None))
+#endif // QT_CONFIG(tooltip)
+        self.btnExportMetrics.setText(QCoreApplication.translate("MainWindow", u"\u042d\u043a\u0441\u043f\u043e\u0440\u0442 \u043c\u0435\u0442\u0440\u0438\u043a", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_diagnostics), QCoreApplication.translate("MainWindow", u"\u0414\u0438\u0430\u0433\u043d\u043e\u0441\u0442\u0438\u043a\u0430", None))
     # retranslateUi
 
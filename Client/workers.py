@@ -0,0 +1,230 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Set, Union
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+
+class TaskSignals(QObject):
+    chunk = Signal(object, object)
+    result = Signal(object, object)
+    error = Signal(object, str)
+    finished = Signal(object)
+
+
+class Task(QRunnable):
+    def __init__(self, key: Optional[str], fn: Callable, args: tuple, kwargs: dict, signals: TaskSignals):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.on_chunk: Optional[Callable[[Any], None]] = None
+        self.on_result: Optional[Callable[[Any], None]] = None
+        self.on_error: Optional[Callable[[str], None]] = None
+        self.on_finished: Optional[Callable[[], None]] = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        try:
+            if self.cancelled:
+                return
+
+            result = self.fn(*self.args, **self.kwargs)
+            if isinstance(result, Iterator):
+                for chunk in result:
+                    if self.cancelled:
+                        result.close()
+                        break
+                    self.signals.chunk.emit(self, chunk)
+            else:
+                self.signals.result.emit(self, result)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Ошибка фоновой задачи {self.key}: {e}")
+            self.signals.error.emit(self, str(e))
+        finally:
+            self.signals.finished.emit(self)
+
+
+class AsyncTask:
+    def __init__(self, key: Optional[str], fn: Callable[..., Awaitable], args: tuple, kwargs: dict,
+                 signals: TaskSignals):
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.future: Optional[concurrent.futures.Future] = None
+        self.on_chunk: Optional[Callable[[Any], None]] = None
+        self.on_result: Optional[Callable[[Any], None]] = None
+        self.on_error: Optional[Callable[[str], None]] = None
+        self.on_finished: Optional[Callable[[], None]] = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    async def run(self) -> None:
+        try:
+            result = await self.fn(*self.args, **self.kwargs)
+            self.signals.result.emit(self, result)
+        except asyncio.CancelledError:
+            self._cancel_event.set()
+            raise
+        except Exception as e:
+            message = str(e) or type(e).__name__
+            logging.getLogger(__name__).error(f"Ошибка асинхронной задачи {self.key}: {message}")
+            self.signals.error.emit(self, message)
+        finally:
+            self.signals.finished.emit(self)
+
+
+class TaskDispatcher(QObject):
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.signals = TaskSignals(self)
+        self.signals.chunk.connect(self._on_chunk)
+        self.signals.result.connect(self._on_result)
+        self.signals.error.connect(self._on_error)
+        self.signals.finished.connect(self._on_finished)
+        self._current: Dict[str, Union[Task, AsyncTask]] = {}
+        self._running: Set[Union[Task, AsyncTask]] = set()
+
+    def _register(self, task: Union[Task, AsyncTask],
+                  on_chunk: Optional[Callable[[Any], None]],
+                  on_result: Optional[Callable[[Any], None]],
+                  on_error: Optional[Callable[[str], None]],
+                  on_finished: Optional[Callable[[], None]]) -> None:
+        if task.key is not None:
+            self.cancel(task.key)
+
+        task.on_chunk = on_chunk
+        task.on_result = on_result
+        task.on_error = on_error
+        task.on_finished = on_finished
+
+        if task.key is not None:
+            self._current[task.key] = task
+        self._running.add(task)
+
+    def cancel(self, key: str) -> None:
+        task = self._current.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def is_busy(self, key: str) -> bool:
+        return key in self._current
+
+    @Slot(object, object)
+    def _on_chunk(self, task: Task, chunk: Any) -> None:
+        if not task.cancelled and task.on_chunk:
+            task.on_chunk(chunk)
+
+    @Slot(object, object)
+    def _on_result(self, task: Task, result: Any) -> None:
+        if not task.cancelled and task.on_result:
+            task.on_result(result)
+
+    @Slot(object, str)
+    def _on_error(self, task: Task, message: str) -> None:
+        if not task.cancelled and task.on_error:
+            task.on_error(message)
+
+    @Slot(object)
+    def _on_finished(self, task: Task) -> None:
+        self._running.discard(task)
+        if task.key is not None and self._current.get(task.key) is task:
+            del self._current[task.key]
+        if not task.cancelled and task.on_finished:
+            task.on_finished()
+
+
+class TaskRunner(TaskDispatcher):
+    def __init__(self, parent: Optional[QObject] = None, max_threads: int = 4):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+
+    def submit(self, key: Optional[str], fn: Callable, *args,
+               on_chunk: Optional[Callable[[Any], None]] = None,
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None,
+               on_finished: Optional[Callable[[], None]] = None,
+               **kwargs) -> Task:
+        task = Task(key, fn, args, kwargs, self.signals)
+        self._register(task, on_chunk, on_result, on_error, on_finished)
+        self.pool.start(task)
+        return task
+
+    def shutdown(self, timeout_ms: int = 1000) -> None:
+        for task in list(self._running):
+            task.cancel()
+        self._current.clear()
+        self.pool.clear()
+        self.pool.waitForDone(timeout_ms)
+
+
+class AsyncTaskRunner(TaskDispatcher):
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name="asyncio-loop", daemon=True)
+        self.thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def submit(self, key: Optional[str], fn: Callable[..., Awaitable], *args,
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None,
+               on_finished: Optional[Callable[[], None]] = None,
+               **kwargs) -> AsyncTask:
+        task = AsyncTask(key, fn, args, kwargs, self.signals)
+        self._register(task, None, on_result, on_error, on_finished)
+        task.future = asyncio.run_coroutine_threadsafe(task.run(), self.loop)
+        task.future.add_done_callback(lambda future: future.cancelled() and self.signals.finished.emit(task))
+        return task
+
+    def shutdown(self, timeout: float = 1.0, *closers: Callable[[], Awaitable]) -> None:
+        if not self.loop.is_running():
+            return
+
+        deadline = time.monotonic() + timeout
+        pending = [task.future for task in self._running if task.future is not None]
+        concurrent.futures.wait(pending, timeout=timeout)
+        for task in list(self._running):
+            task.cancel()
+        self._current.clear()
+
+        for closer in closers:
+            future = asyncio.run_coroutine_threadsafe(closer(), self.loop)
+            try:
+                future.result(timeout=max(0.1, deadline - time.monotonic()))
+            except Exception as e:
+                future.cancel()
+                logging.getLogger(__name__).warning(f"Ресурс не закрыт при завершении: {e or type(e).__name__}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(max(0.1, deadline - time.monotonic()))
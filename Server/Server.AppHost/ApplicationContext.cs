@@ -23,6 +23,7 @@ namespace Server.Data
                 entity.Property(p => p.Crc16).HasColumnType("integer");
                 entity.Property(p => p.SyncMarker).HasColumnType("integer");
                 entity.Property(p => p.PacketCounter).HasColumnType("integer");
+                entity.HasIndex(p => new { p.SessionId, p.Timestamp, p.Id });
             });
 
             modelBuilder.Entity<Session>(entity => 
@@ -0,0 +1,29 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Server.AppHost.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddPacketSessionTimestampIndex : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_Packets_SessionId_Timestamp_Id",
+                schema: "public",
+                table: "Packets",
+                columns: new[] { "SessionId", "Timestamp", "Id" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Packets_SessionId_Timestamp_Id",
+                schema: "public",
+                table: "Packets");
+        }
+    }
+}
@@ -0,0 +1,55 @@
+﻿using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Server.AppHost.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddPacketNotifyTriggers : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"
+CREATE OR REPLACE FUNCTION public.notify_packets_inserted() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('packets_inserted', json_build_object('session_id', ""SessionId"", 'last_id', max(""Id""))::text)
+    FROM inserted
+    GROUP BY ""SessionId"";
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ""TR_Packets_NotifyInserted""
+    AFTER INSERT ON public.""Packets""
+    REFERENCING NEW TABLE AS inserted
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.notify_packets_inserted();
+
+CREATE OR REPLACE FUNCTION public.notify_session_ended() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('session_ended', json_build_object('session_id', NEW.""Id"")::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER ""TR_Sessions_NotifyEnded""
+    AFTER UPDATE OF ""EndTime"" ON public.""Sessions""
+    FOR EACH ROW
+    WHEN (OLD.""EndTime"" IS NULL AND NEW.""EndTime"" IS NOT NULL)
+    EXECUTE FUNCTION public.notify_session_ended();
+");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"
+DROP TRIGGER IF EXISTS ""TR_Sessions_NotifyEnded"" ON public.""Sessions"";
+DROP FUNCTION IF EXISTS public.notify_session_ended();
+DROP TRIGGER IF EXISTS ""TR_Packets_NotifyInserted"" ON public.""Packets"";
+DROP FUNCTION IF EXISTS public.notify_packets_inserted();
+");
+        }
+    }
+}
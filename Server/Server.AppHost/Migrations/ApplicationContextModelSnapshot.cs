@@ -77,6 +77,8 @@ namespace Server.AppHost.Migrations
 
                     b.HasIndex("SessionId");
 
+                    b.HasIndex("SessionId", "Timestamp", "Id");
+
                     b.ToTable("Packets", "public");
                 });
 
@@ -62,7 +62,8 @@ try
     builder.Services.AddDbContext<ApplicationContext>(options =>
         options.UseNpgsql(connectionString));
 
-    builder.Services.AddSignalR();
+    builder.Services.AddSignalR()
+        .AddMessagePackProtocol();
     builder.Services.AddSingleton<TelemetryService>();
     builder.Services.AddHostedService(provider =>
         provider.GetRequiredService<TelemetryService>());